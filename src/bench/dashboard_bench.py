@@ -0,0 +1,169 @@
+# src/bench/dashboard_bench.py
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.bench.synthetic import SyntheticSpec, seed_database, table_has_rows
+from src.db.connection import get_engine
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+DASHBOARD_DIR = BASE_DIR / "src" / "dashboard"
+PAGES_DIR = DASHBOARD_DIR / "pages"
+BENCH_DIR = BASE_DIR / "data" / "bench"
+
+DEFAULT_SCALES = [100, 1000, 10000]
+PAGE_TIMEOUT_SEC = 120
+
+
+def discover_pages(only: Optional[List[str]] = None) -> List[Path]:
+    """pages/01_*.py ~ 05_*.py (admin 제외). only 가 있으면 파일명 앞부분으로 필터."""
+    pages = sorted(p for p in PAGES_DIR.glob("0*.py"))
+    if only:
+        pages = [p for p in pages if any(p.stem.startswith(prefix) for prefix in only)]
+    return pages
+
+
+def bench_db_name(scale: int) -> str:
+    return f"car_trend_bench_{scale}"
+
+
+def _prepare_sys_path() -> None:
+    # 페이지 스크립트는 components / queries / db.* 를 최상위 모듈로 import 한다.
+    for path in (str(DASHBOARD_DIR), str(BASE_DIR / "src")):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+def run_page(page: Path, reruns: int, warmup: int = 1) -> Dict[str, Any]:
+    """
+    AppTest 로 페이지 스크립트를 headless 실행.
+    warmup 회 실행 후 reruns 회 각각 wall time / tracemalloc peak 측정.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(page), default_timeout=PAGE_TIMEOUT_SEC)
+    for _ in range(warmup):
+        at.run()
+
+    latencies: List[float] = []
+    peaks: List[float] = []
+    errors: List[str] = []
+    for _ in range(reruns):
+        gc.collect()
+        tracemalloc.start()
+        started = time.perf_counter()
+        at.run()
+        latencies.append((time.perf_counter() - started) * 1000)
+        peaks.append(tracemalloc.get_traced_memory()[1] / 1024 / 1024)
+        tracemalloc.stop()
+        errors.extend(str(e.value) for e in at.exception)
+
+    return {
+        "page": page.stem,
+        "reruns": reruns,
+        "latency_ms_median": round(statistics.median(latencies), 1),
+        "latency_ms_max": round(max(latencies), 1),
+        "peak_mem_mb_max": round(max(peaks), 2),
+        "latencies_ms": [round(v, 1) for v in latencies],
+        "errors": errors[:3],
+    }
+
+
+def run_benchmark(
+    scales: List[int],
+    months: int,
+    reruns: int,
+    pages: List[Path],
+    reseed: bool = False,
+) -> List[Dict[str, Any]]:
+    _prepare_sys_path()
+    results: List[Dict[str, Any]] = []
+
+    for scale in scales:
+        # get_engine 은 호출마다 DB_NAME 을 다시 읽으므로 환경 변수만 바꾸면 페이지도 이 DB 를 본다.
+        os.environ["DB_NAME"] = bench_db_name(scale)
+        engine = get_engine(echo=False)
+        if reseed or not table_has_rows(engine):
+            print(f"[INFO] 합성 데이터 생성: {scale} models × {months} months")
+            seed_database(engine, SyntheticSpec(n_models=scale, n_months=months), drop=reseed)
+        engine.dispose()
+
+        for page in pages:
+            print(f"[INFO] scale={scale} page={page.stem} 실행 중...")
+            result = run_page(page, reruns=reruns)
+            result.update(scale=scale, months=months)
+            results.append(result)
+            status = "ERROR" if result["errors"] else "ok"
+            print(
+                f"[INFO]   median {result['latency_ms_median']:.0f}ms, "
+                f"max {result['latency_ms_max']:.0f}ms, peak {result['peak_mem_mb_max']:.1f}MB ({status})"
+            )
+    return results
+
+
+def print_table(results: List[Dict[str, Any]]) -> None:
+    print(f"\n{'scale':>7}  {'page':<20} {'median_ms':>10} {'max_ms':>10} {'peak_mb':>9}")
+    for r in results:
+        print(
+            f"{r['scale']:>7}  {r['page']:<20} {r['latency_ms_median']:>10.1f} "
+            f"{r['latency_ms_max']:>10.1f} {r['peak_mem_mb_max']:>9.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="대시보드 페이지 headless 벤치마크 (AppTest + 합성 데이터 DB)"
+    )
+    parser.add_argument(
+        "--scales",
+        default=",".join(str(s) for s in DEFAULT_SCALES),
+        help="모델 수 목록 (쉼표 구분, default: 100,1000,10000)",
+    )
+    parser.add_argument("--months", type=int, default=24, help="합성 데이터 개월 수")
+    parser.add_argument("--reruns", type=int, default=3, help="페이지별 측정 반복 횟수")
+    parser.add_argument(
+        "--pages", nargs="*", default=None, help="측정할 페이지 (파일명 앞부분, 예: 01 04)"
+    )
+    parser.add_argument("--reseed", action="store_true", help="벤치마크 DB 를 지우고 다시 생성")
+    parser.add_argument(
+        "--output", default=None, help="결과 JSON 경로 (default: data/bench/dashboard_<시각>.json)"
+    )
+    args = parser.parse_args()
+
+    scales = [int(s) for s in args.scales.split(",") if s.strip()]
+    pages = discover_pages(args.pages)
+    if not pages:
+        print("[WARN] 측정할 페이지가 없습니다.")
+        return
+
+    results = run_benchmark(scales, args.months, args.reruns, pages, reseed=args.reseed)
+    print_table(results)
+
+    out_path = Path(args.output) if args.output else (
+        BENCH_DIR / f"dashboard_{datetime.datetime.now():%Y%m%d_%H%M%S}.json"
+    )
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(
+        json.dumps(
+            {"created_at": datetime.datetime.now().isoformat(), "results": results},
+            ensure_ascii=False,
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    print(f"[INFO] 결과 저장: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,415 @@
+# src/bench/parser_bench.py
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import csv
+import datetime
+import gc
+import io
+import json
+import os
+import statistics
+import subprocess
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from src.bench.synthetic import (
+    BRAND_CODES,
+    RAW_BASE,
+    SyntheticSpec,
+    create_database,
+    generate_tables,
+    table_has_rows,
+    write_raw_files,
+    write_tables,
+)
+from src.db.connection import get_engine
+from src.etl.interest import load_naver_interest_detail, normalize_google_trend_wide
+from src.etl.interest import normalize_naver_detail
+from src.etl.sales import danawa_normalizer, load_danawa_sales_to_db
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+FIXTURE_DIR = BASE_DIR / "data" / "bench" / "fixtures"
+RESULT_DIR = BASE_DIR / "data" / "bench" / "parsers"
+HISTORY_JSONL = RESULT_DIR / "history.jsonl"
+
+# 1× = 실제 수집 규모 (현대/기아 2개 브랜드, 모델 100개, 12개월)
+BASE_MODELS = 100
+FIXTURE_MONTHS = 12
+FIXTURE_END_MONTH = datetime.date(2024, 12, 1)
+FIXTURE_SEED = 46
+DEFAULT_MULTIPLIERS = [1, 10, 100]
+
+
+def fixture_run_id(multiplier: int) -> str:
+    return f"bench_fixture_{multiplier}x"
+
+
+def fixture_spec(multiplier: int) -> SyntheticSpec:
+    # 시드/마지막 월을 고정해서 커밋이 바뀌어도 같은 입력 파일로 측정한다.
+    return SyntheticSpec(
+        n_models=BASE_MODELS * multiplier,
+        n_months=FIXTURE_MONTHS,
+        n_brands=len(BRAND_CODES),
+        blog_months=0,
+        end_month=FIXTURE_END_MONTH,
+        seed=FIXTURE_SEED,
+    )
+
+
+def prepare_fixture(multiplier: int, regen: bool = False) -> pd.DataFrame:
+    """
+    data/raw/<source>/bench_fixture_<N>x/ 에 ETL 입력 형식의 고정 픽스처를 만든다.
+    (이미 있으면 재사용) return: 픽스처의 car_model
+    """
+    run_id = fixture_run_id(multiplier)
+    meta_dir = FIXTURE_DIR / run_id
+    models_path = meta_dir / "car_model.csv"
+    if models_path.exists() and not regen:
+        return pd.read_csv(models_path, encoding="utf-8-sig")
+
+    print(f"[INFO] 픽스처 생성: {run_id}")
+    spec = fixture_spec(multiplier)
+    tables = generate_tables(spec)
+    write_raw_files(tables, run_id)
+
+    meta_dir.mkdir(parents=True, exist_ok=True)
+    tables["car_model"].to_csv(models_path, index=False, encoding="utf-8-sig")
+    (meta_dir / "spec.json").write_text(
+        json.dumps(vars(spec), ensure_ascii=False, indent=2, default=str), encoding="utf-8"
+    )
+    return tables["car_model"]
+
+
+def read_raw_sales_rows(run_id: str) -> List[List[str]]:
+    """다나와 크롤러 원본 판매량 CSV 의 모든 행 (메타/정규화 파일 제외)."""
+    rows: List[List[str]] = []
+    for path in sorted((RAW_BASE / "danawa" / run_id).glob("*/*_model_sales_*.csv")):
+        if path.name.endswith("_normalized.csv"):
+            continue
+        with path.open("r", encoding="utf-8-sig", newline="") as f:
+            rows.extend(csv.reader(f))
+    return rows
+
+
+def measure(
+    name: str, func: Callable[[], Any], rows: int, repeat: int
+) -> Dict[str, Any]:
+    """
+    repeat 회 실행 시간(median) + tracemalloc 켠 상태로 한 번 더 돌려 할당 피크를 잰다.
+    (tracemalloc 은 실행을 느리게 하므로 시간 측정과 분리)
+    대상 함수의 [INFO] 출력은 측정 중에만 버린다.
+    """
+    sink = io.StringIO()
+    timings: List[float] = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(sink):
+            func()
+        timings.append(time.perf_counter() - started)
+        sink.seek(0)
+        sink.truncate()
+
+    gc.collect()
+    tracemalloc.start()
+    with contextlib.redirect_stdout(sink):
+        func()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    median = statistics.median(timings)
+    return {
+        "case": name,
+        "rows": rows,
+        "repeat": repeat,
+        "median_ms": round(median * 1000, 2),
+        "min_ms": round(min(timings) * 1000, 2),
+        "rows_per_sec": round(rows / median, 1) if median > 0 and rows else None,
+        "peak_alloc_kb": round(peak / 1024, 1),
+        "retained_kb": round(current / 1024, 1),
+    }
+
+
+def parser_cases(run_id: str, car_models: pd.DataFrame) -> List[Dict[str, Any]]:
+    """DB 없이 도는 파서/정규화 대상. 입력은 측정 전에 메모리에 올려둔다."""
+    raw_rows = read_raw_sales_rows(run_id)
+    change_strs = [c for r in raw_rows if len(r) >= 7 for c in (r[5], r[6])]
+    share_strs = [r[4] for r in raw_rows if len(r) >= 7]
+    brand_dirs = [RAW_BASE / "danawa" / run_id / code for code in BRAND_CODES.values()]
+
+    def normalize_rows():
+        for row in raw_rows:
+            danawa_normalizer.normalize_row(row)
+
+    def parse_changes():
+        for s in change_strs:
+            danawa_normalizer.parse_change_field(s)
+
+    def parse_shares():
+        for s in share_strs:
+            load_danawa_sales_to_db.parse_share_ratio(s)
+
+    def normalize_folders():
+        for folder in brand_dirs:
+            danawa_normalizer.normalize_folder(folder)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        normalize_folders()  # load_normalized_sales_csv 입력(*_normalized.csv) 준비
+    normalized_files = [
+        (path, folder.name)
+        for folder in brand_dirs
+        for path in sorted(folder.glob("*_model_sales_*_normalized.csv"))
+    ]
+
+    def load_normalized():
+        for path, code in normalized_files:
+            load_danawa_sales_to_db.load_normalized_sales_csv(path, code)
+
+    naver_stats: Dict[str, int] = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        normalize_naver_detail.normalize_detail(run_id, naver_stats)
+
+    def normalize_naver():
+        normalize_naver_detail.normalize_detail(run_id, {})
+
+    google = normalize_google_trend_wide
+    model_map = {
+        (brand, name): int(mid)
+        for brand, name, mid in zip(
+            car_models["brand_name"], car_models["model_name_kr"], car_models["model_id"]
+        )
+    }
+    aliases = google.build_alias_table(model_map)
+    wide_files = [
+        (path, google.guess_brand_from_filename(path))
+        for path in google.find_wide_files(google.GOOGLE_DIR / run_id)
+    ]
+    google_points = sum(
+        len(google.read_wide_as_long(path, brand, aliases)) for path, brand in wide_files
+    )
+
+    def read_google_wide():
+        for path, brand in wide_files:
+            google.read_wide_as_long(path, brand, aliases)
+
+    n_rows = len(raw_rows)
+    return [
+        {"name": "danawa.normalize_row", "func": normalize_rows, "rows": n_rows},
+        {"name": "danawa.parse_change_field", "func": parse_changes, "rows": len(change_strs)},
+        {"name": "sales.parse_share_ratio", "func": parse_shares, "rows": len(share_strs)},
+        {"name": "danawa.normalize_folder", "func": normalize_folders, "rows": n_rows},
+        {"name": "sales.load_normalized_sales_csv", "func": load_normalized, "rows": n_rows},
+        {
+            "name": "naver.normalize_detail",
+            "func": normalize_naver,
+            "rows": naver_stats.get("raw_rows", 0),
+        },
+        {"name": "google.read_wide_as_long", "func": read_google_wide, "rows": google_points},
+    ]
+
+
+def loader_cases(
+    run_id: str, car_models: pd.DataFrame, google_points: int, naver_rows: int, n_sales: int
+) -> List[Dict[str, Any]]:
+    """
+    DB 를 쓰는 로더 / 구글 정규화 (car_model 매핑을 DB 에서 읽음).
+    로더 SQL 이 MySQL 전용(ON DUPLICATE KEY)이라 로컬 MySQL 의 벤치마크 DB 를 쓴다.
+    """
+    os.environ["DB_NAME"] = f"car_trend_{run_id}"
+    engine = get_engine(echo=False)
+    create_database(engine)
+    if not table_has_rows(engine):
+        with contextlib.redirect_stdout(io.StringIO()):
+            write_tables(engine, {"car_model": car_models})
+    engine.dispose()
+
+    google = normalize_google_trend_wide
+    return [
+        {
+            "name": "google.normalize_google_trend_wide",
+            "func": lambda: google.normalize_google_trend_wide(run_id),
+            "rows": google_points,
+            "db": True,
+        },
+        {
+            "name": "google.normalize_google_trend_wide_vectorized(db)",
+            "func": lambda: google.normalize_google_trend_wide_vectorized(
+                run_id, output="db", workers=1
+            ),
+            "rows": google_points,
+            "db": True,
+        },
+        {
+            "name": "naver.load_detail",
+            "func": lambda: load_naver_interest_detail.load_detail(run_id),
+            "rows": naver_rows,
+            "db": True,
+        },
+        {
+            "name": "sales.run_loader",
+            "func": lambda: load_danawa_sales_to_db.run_loader(
+                run_id, list(BRAND_CODES.values())
+            ),
+            "rows": n_sales,
+            "db": True,
+        },
+    ]
+
+
+def run_benchmark(
+    multipliers: List[int],
+    repeat: int,
+    loaders: bool = False,
+    only: Optional[List[str]] = None,
+    regen: bool = False,
+) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    for multiplier in multipliers:
+        run_id = fixture_run_id(multiplier)
+        car_models = prepare_fixture(multiplier, regen=regen)
+
+        cases = parser_cases(run_id, car_models)
+        if loaders:
+            rows = {c["name"]: c["rows"] for c in cases}
+            cases += loader_cases(
+                run_id,
+                car_models,
+                google_points=rows["google.read_wide_as_long"],
+                naver_rows=rows["naver.normalize_detail"],
+                n_sales=rows["sales.load_normalized_sales_csv"],
+            )
+        if only:
+            cases = [c for c in cases if any(key in c["name"] for key in only)]
+
+        for case in cases:
+            # DB 를 쓰는 케이스는 한 번만 (upsert 라 반복해도 결과는 같지만 오래 걸린다)
+            n = 1 if case.get("db") else repeat
+            result = measure(case["name"], case["func"], case["rows"], n)
+            result["scale"] = f"{multiplier}x"
+            results.append(result)
+            rate = f"{result['rows_per_sec']:,.0f} rows/s" if result["rows_per_sec"] else "-"
+            print(
+                f"[INFO] {result['scale']:>5} {case['name']:<50} "
+                f"{result['median_ms']:>10.1f}ms  {rate:>16}  peak {result['peak_alloc_kb']:,.0f}KB"
+            )
+    return results
+
+
+
+def git_revision() -> Dict[str, Any]:
+    """현재 커밋 (short sha) 과 추적 파일 변경 여부."""
+    try:
+        sha = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BASE_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        dirty = bool(
+            subprocess.run(
+                ["git", "status", "--porcelain", "--untracked-files=no"],
+                cwd=BASE_DIR, capture_output=True, text=True, check=True,
+            ).stdout.strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": "unknown", "dirty": False}
+    return {"commit": sha, "dirty": dirty}
+
+
+def save_results(results: List[Dict[str, Any]], revision: Dict[str, Any]) -> Path:
+    """data/bench/parsers/<commit>.json 저장 + history.jsonl 에 한 줄 추가."""
+    record = {
+        **revision,
+        "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        "results": results,
+    }
+    RESULT_DIR.mkdir(parents=True, exist_ok=True)
+    suffix = "-dirty" if revision["dirty"] else ""
+    out_path = RESULT_DIR / f"{revision['commit']}{suffix}.json"
+    out_path.write_text(json.dumps(record, ensure_ascii=False, indent=2), encoding="utf-8")
+    with HISTORY_JSONL.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return out_path
+
+
+def load_previous(commit: str) -> Optional[Dict[str, Any]]:
+    """history.jsonl 에서 현재 커밋이 아닌 가장 최근 기록."""
+    if not HISTORY_JSONL.exists():
+        return None
+    previous = None
+    with HISTORY_JSONL.open("r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record.get("commit") != commit:
+                previous = record
+    return previous
+
+
+def print_comparison(results: List[Dict[str, Any]], previous: Dict[str, Any]) -> None:
+    before = {(r["scale"], r["case"]): r for r in previous["results"]}
+    print(f"\n[INFO] 이전 기록과 비교: {previous['commit']} ({previous['created_at']})")
+    print(f"{'scale':>5}  {'case':<50} {'before/s':>12} {'now/s':>12} {'diff':>8}")
+    for r in results:
+        old = before.get((r["scale"], r["case"]))
+        if not old or not old.get("rows_per_sec") or not r["rows_per_sec"]:
+            continue
+        diff = (r["rows_per_sec"] / old["rows_per_sec"] - 1) * 100
+        print(
+            f"{r['scale']:>5}  {r['case']:<50} {old['rows_per_sec']:>12,.0f} "
+            f"{r['rows_per_sec']:>12,.0f} {diff:>+7.1f}%"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="파서/정규화/로더 마이크로 벤치마크 (고정 픽스처 1×/10×/100×, 커밋별 결과 저장)"
+    )
+    parser.add_argument(
+        "--scales",
+        default=",".join(str(m) for m in DEFAULT_MULTIPLIERS),
+        help="픽스처 배수 목록 (쉼표 구분, default: 1,10,100)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="파서별 측정 반복 횟수")
+    parser.add_argument(
+        "--loaders",
+        action="store_true",
+        help="DB 로더도 측정 (로컬 MySQL 에 car_trend_bench_fixture_<N>x DB 생성)",
+    )
+    parser.add_argument(
+        "--cases", nargs="*", default=None, help="이름에 이 문자열이 포함된 케이스만 측정"
+    )
+    parser.add_argument("--regen-fixtures", action="store_true", help="픽스처 파일을 다시 생성")
+    parser.add_argument(
+        "--compare", action="store_true", help="history.jsonl 의 이전 커밋 결과와 비교 출력"
+    )
+    parser.add_argument("--no-save", action="store_true", help="결과를 저장하지 않음")
+    args = parser.parse_args()
+
+    multipliers = [int(s) for s in args.scales.split(",") if s.strip()]
+    revision = git_revision()
+    print(f"[INFO] commit={revision['commit']}{' (dirty)' if revision['dirty'] else ''}")
+
+    results = run_benchmark(
+        multipliers, args.repeat, loaders=args.loaders, only=args.cases, regen=args.regen_fixtures
+    )
+
+    if args.compare:
+        previous = load_previous(revision["commit"])
+        if previous is None:
+            print("[WARN] 비교할 이전 커밋 기록이 없습니다.")
+        else:
+            print_comparison(results, previous)
+
+    if not args.no_save:
+        print(f"[INFO] 결과 저장: {save_results(results, revision)}")
+
+
+if __name__ == "__main__":
+    main()
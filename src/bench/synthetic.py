@@ -0,0 +1,676 @@
+# src/bench/synthetic.py
+
+from __future__ import annotations
+
+import argparse
+import csv
+import datetime
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+
+from src.db.connection import get_engine
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+SCHEMA_SQL = BASE_DIR / "src" / "db" / "init_schema.sql"
+RAW_BASE = BASE_DIR / "data" / "raw"
+SYNTHETIC_BASE = BASE_DIR / "data" / "bench" / "synthetic"
+WORDCLOUD_PLACEHOLDER = "data/bench/wordcloud_placeholder.png"
+
+# 적재 순서 (FK 의존 순서)
+TABLE_ORDER = [
+    "car_model",
+    "model_monthly_sales",
+    "model_monthly_interest",
+    "model_monthly_interest_detail",
+    "blog_article",
+    "blog_token_monthly",
+    "blog_wordcloud",
+]
+
+BASE_BRANDS = ["현대", "기아"]
+# ETL 로더가 인식하는 브랜드 코드 (load_danawa_*_to_db.BRAND_KR_MAP, 구글 파일명 규칙)
+BRAND_CODES = {"현대": "hyundai", "기아": "kia"}
+# 브랜드 하나당 평균 모델 수 (현대/기아 실제 규모 기준)
+MODELS_PER_BRAND = 50
+
+DETAIL_FILTERS = [
+    (device, gender) for device in ("pc", "mobile") for gender in ("male", "female")
+]
+# 네이버 데이터랩 실제 비중 근사: 모바일 ~75%, 남성 ~70%
+DEVICE_SHARE = {"pc": 0.25, "mobile": 0.75}
+GENDER_SHARE = {"male": 0.7, "female": 0.3}
+
+# 국내 신차 판매 월별 계절성 (1~2월 비수기, 3월/12월 성수기, 8월 휴가철 하락)
+SALES_SEASONALITY = np.array(
+    [0.82, 0.86, 1.10, 1.04, 1.05, 1.02, 0.98, 0.88, 1.00, 1.03, 1.05, 1.17]
+)
+# 검색 관심도 계절성 (연초 신차 발표, 여름 휴가/캠핑 시즌에 상승)
+INTEREST_SEASONALITY = np.array(
+    [1.12, 1.05, 1.04, 0.98, 0.97, 1.03, 1.08, 1.06, 0.94, 0.92, 0.93, 0.98]
+)
+
+NAME_PREFIXES = ["더 뉴", "올 뉴", "디 올 뉴", "", "", ""]
+NAME_STEMS = [
+    "아반떼", "쏘나타", "그랜저", "투싼", "싼타페", "팰리세이드", "캐스퍼", "코나", "아이오닉",
+    "스타리아", "포터", "모닝", "레이", "K3", "K5", "K8", "K9", "셀토스", "스포티지", "쏘렌토",
+    "카니발", "니로", "EV", "봉고",
+]
+NAME_SUFFIXES = ["", "", "하이브리드", "N 라인", "일렉트릭", "LPG", "밴"]
+
+# 블로그 본문 어휘: 앞쪽일수록 자주 등장 (Zipf 순위 = 리스트 순서)
+VOCAB = [
+    "차", "디자인", "연비", "가격", "옵션", "실내", "주행", "승차감", "후기", "시승",
+    "하이브리드", "트림", "출고", "계약", "가족", "공간", "트렁크", "소음", "안전", "전기차",
+    "충전", "반자율", "내비", "시트", "정비", "보험", "할인", "중고", "색상", "휠",
+    "캠핑", "차박", "주차", "브레이크", "핸들", "엔진", "변속기", "타이어", "블랙박스", "썬루프",
+]
+# 합성 명사를 만들 음절 (한국어처럼 보이는 2~4음절 단어)
+SYLLABLES = list(
+    "가나다라마바사아자차카타파하고노도로모보소오조초코토포호"
+    "구누두루무부수우주추쿠투푸후기니디리미비시이지치키티피히한신정성경민영상"
+)
+SENTENCE_ENDINGS = ["입니다.", "했어요.", "같아요.", "좋네요.", "아쉬워요.", "만족합니다."]
+
+
+@dataclass
+class SyntheticSpec:
+    """합성 데이터 규모. n_models × n_months 가 기본 단위."""
+
+    n_models: int = 100
+    n_months: int = 24
+    n_brands: Optional[int] = None  # None 이면 모델 수에 맞춰 자동 (MODELS_PER_BRAND)
+    blog_months: int = 3
+    articles_per_month: int = 3
+    tokens_per_month: int = 50
+    vocab_size: int = 3000
+    article_tokens: int = 250
+    end_month: Optional[datetime.date] = None
+    seed: int = 42
+
+
+def month_range(end_month: datetime.date, n_months: int) -> List[datetime.date]:
+    """end_month 를 마지막으로 하는 n_months 개의 월초 날짜 (오름차순)."""
+    idx = end_month.year * 12 + end_month.month - 1
+    return [
+        datetime.date(i // 12, i % 12 + 1, 1) for i in range(idx - n_months + 1, idx + 1)
+    ]
+
+
+def _default_end_month() -> datetime.date:
+    today = datetime.date.today().replace(day=1)
+    return (today - datetime.timedelta(days=1)).replace(day=1)
+
+
+def brand_names(n_models: int, n_brands: Optional[int] = None) -> List[str]:
+    """현대/기아 + 규모에 맞춰 가상 브랜드를 늘린다."""
+    if n_brands is None:
+        n_brands = max(len(BASE_BRANDS), -(-n_models // MODELS_PER_BRAND))
+    n_brands = max(1, n_brands)
+    extra = [f"브랜드{i:03d}" for i in range(len(BASE_BRANDS) + 1, n_brands + 1)]
+    return (BASE_BRANDS + extra)[:n_brands]
+
+
+def brand_code(brand_name: str) -> str:
+    if brand_name in BRAND_CODES:
+        return BRAND_CODES[brand_name]
+    return "brand" + re.sub(r"\D", "", brand_name)
+
+
+def zipf_probs(n: int, s: float = 1.07) -> np.ndarray:
+    """순위 1..n 의 Zipf 확률 (블로그 토큰 빈도 분포)."""
+    weights = 1.0 / np.arange(1, n + 1) ** s
+    return weights / weights.sum()
+
+
+def build_vocab(size: int, rng: np.random.Generator) -> np.ndarray:
+    """실제 자동차 어휘 + 한국어처럼 보이는 합성 명사 (중복 없이 size 개)."""
+    words = list(VOCAB) + list(NAME_STEMS)
+    seen = set(words)
+    while len(words) < size:
+        word = "".join(rng.choice(SYLLABLES, size=int(rng.integers(2, 5))))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return np.array(words[:size])
+
+
+# -----------------------------
+# 테이블별 생성
+# -----------------------------
+def generate_car_models(spec: SyntheticSpec, rng: np.random.Generator) -> pd.DataFrame:
+    brands = brand_names(spec.n_models, spec.n_brands)
+    ids = np.arange(1, spec.n_models + 1)
+
+    names: List[str] = []
+    seen = set()
+    for i in ids:
+        parts = [
+            NAME_PREFIXES[int(rng.integers(len(NAME_PREFIXES)))],
+            NAME_STEMS[int(rng.integers(len(NAME_STEMS)))],
+            NAME_SUFFIXES[int(rng.integers(len(NAME_SUFFIXES)))],
+        ]
+        name = " ".join(p for p in parts if p)
+        # (브랜드, 모델명) 으로 매칭하는 로더가 있으므로 모델명은 전체에서 유일하게
+        if name in seen:
+            name = f"{name} {i:05d}"
+        seen.add(name)
+        names.append(name)
+
+    return pd.DataFrame(
+        {
+            "model_id": ids,
+            "danawa_model_id": 100000 + ids,
+            "brand_name": [brands[i % len(brands)] for i in range(spec.n_models)],
+            "model_name_kr": names,
+            "danawa_model_url": [
+                f"https://auto.danawa.com/auto/?Work=model&Model={100000 + i}" for i in ids
+            ],
+        }
+    )
+
+
+def generate_sales(
+    models: pd.DataFrame, months: List[datetime.date], rng: np.random.Generator
+) -> pd.DataFrame:
+    """
+    판매량 = 모델 기본 수요(로그정규, 롱테일) × 월 계절성 × 출시 후 수명주기 × 잡음.
+    기본 수요 중앙값 ~200대, 상위 1% ~3,000대 이상 (국내 월 판매 분포 근사)
+    일부 모델은 기간 중간에 출시되어 출시 전 월에는 행이 없다.
+    """
+    n_models, n_months = len(models), len(months)
+    base = rng.lognormal(5.3, 1.2, size=n_models)
+
+    # 30% 는 기간 중 출시, 나머지는 기간 이전부터 판매
+    launch = np.where(
+        rng.random(n_models) < 0.3,
+        rng.integers(0, n_months, size=n_models),
+        -rng.integers(6, 60, size=n_models),
+    )
+    age = np.arange(n_months)[None, :] - launch[:, None]  # 출시 후 개월 수
+    # 출시 후 6개월간 증가, 3년 뒤부터 감소
+    lifecycle = np.clip(age + 1, 0, 6) / 6 * np.exp(-np.maximum(age - 36, 0) / 24)
+
+    season = SALES_SEASONALITY[[m.month - 1 for m in months]][None, :]
+    noise = rng.lognormal(0, 0.18, size=(n_models, n_months))
+    units = np.round(base[:, None] * season * lifecycle * noise).astype(int)
+
+    df = pd.DataFrame(
+        {
+            "model_id": np.repeat(models["model_id"].to_numpy(), n_months),
+            "month": months * n_models,
+            "sales_units": units.ravel(),
+            "on_sale": (age >= 0).ravel(),
+        }
+    )
+    df = df[df["on_sale"] & (df["sales_units"] > 0)].drop(columns="on_sale")
+    df["market_total_units"] = df.groupby("month")["sales_units"].transform("sum")
+    df["adoption_rate"] = (df["sales_units"] / df["market_total_units"]).round(4)
+    df["source"] = "SYNTHETIC"
+    return df.reset_index(drop=True)
+
+
+def _scale_to_100(values: pd.Series, groups: pd.Series) -> pd.Series:
+    """그룹(모델/브랜드) 내 최고값 = 100 으로 맞춘다. (네이버/구글 지수 산출 방식)"""
+    peak = values.groupby(groups).transform("max").replace(0, np.nan)
+    return (values / peak * 100).fillna(0)
+
+
+def generate_interest(
+    models: pd.DataFrame, sales: pd.DataFrame, rng: np.random.Generator
+) -> pd.DataFrame:
+    """
+    검색 관심도 = 판매량^0.6 (판매량보다 완만한 롱테일) × 관심도 계절성 × 잡음.
+    - naver_search_index: 모델별 기간 최고값 = 100
+    - google_trend_index: 브랜드별 최고값 = 100 (구글 트렌드 배치 비교 방식)
+    """
+    df = sales[["model_id", "month", "sales_units"]].merge(
+        models[["model_id", "brand_name"]], on="model_id"
+    )
+    season = INTEREST_SEASONALITY[[m.month - 1 for m in df["month"]]]
+    demand = df["sales_units"].to_numpy() ** 0.6 * season
+    naver_raw = pd.Series(demand * rng.lognormal(0, 0.15, size=len(df)), index=df.index)
+    google_raw = pd.Series(demand * rng.lognormal(0, 0.25, size=len(df)), index=df.index)
+
+    out = df[["model_id", "month"]].copy()
+    out["naver_search_index"] = _scale_to_100(naver_raw, df["model_id"]).round().astype(int)
+    out["google_trend_index"] = _scale_to_100(google_raw, df["brand_name"]).round().astype(int)
+    out["danawa_pop_rank"] = (
+        df.groupby("month")["sales_units"].rank(ascending=False, method="first").astype(int)
+    )
+    out["danawa_pop_rank_size"] = df.groupby("month")["model_id"].transform("count")
+    return out
+
+
+def generate_interest_detail(interest: pd.DataFrame, rng: np.random.Generator) -> pd.DataFrame:
+    """디바이스 × 성별 비중을 곱한 뒤 모델별 최고값 = 100 으로 다시 맞춘다."""
+    frames = []
+    model_tilt = rng.normal(0, 0.05, size=int(interest["model_id"].max()) + 1)
+    for device, gender in DETAIL_FILTERS:
+        part = interest[["model_id", "month"]].copy()
+        tilt = model_tilt[part["model_id"].to_numpy()] * (1 if gender == "male" else -1)
+        share = DEVICE_SHARE[device] * np.clip(GENDER_SHARE[gender] + tilt, 0.05, 0.95)
+        part["device"] = device
+        part["gender"] = gender
+        part["age_group"] = ""
+        part["ratio"] = (
+            interest["naver_search_index"].to_numpy()
+            * share
+            * rng.lognormal(0, 0.1, size=len(part))
+        )
+        frames.append(part)
+
+    detail = pd.concat(frames, ignore_index=True)
+    detail["ratio"] = _scale_to_100(detail["ratio"], detail["model_id"]).round(5)
+    return detail
+
+
+def _korean_text(words: np.ndarray, rng: np.random.Generator) -> str:
+    """토큰 배열을 5~9 단어 문장으로 묶고 문장 끝에 어미를 붙인다."""
+    sentences, i = [], 0
+    while i < len(words):
+        n = int(rng.integers(5, 10))
+        ending = SENTENCE_ENDINGS[int(rng.integers(len(SENTENCE_ENDINGS)))]
+        sentences.append(" ".join(words[i : i + n]) + " " + ending)
+        i += n
+    return " ".join(sentences)
+
+
+def generate_blog(
+    models: pd.DataFrame,
+    months: List[datetime.date],
+    spec: SyntheticSpec,
+    rng: np.random.Generator,
+) -> Dict[str, pd.DataFrame]:
+    """
+    모델별로 어휘 순위를 조금씩 섞은 Zipf 분포에서 본문 토큰을 뽑는다.
+    blog_token_monthly 는 실제 본문 토큰 빈도의 상위 tokens_per_month 개라 글과 일관된다.
+    """
+    blog_months = months[-spec.blog_months :] if spec.blog_months > 0 else []
+    vocab = build_vocab(spec.vocab_size, rng)
+    probs = zipf_probs(len(vocab))
+
+    articles, tokens, wordclouds = [], [], []
+    for model_id, model_name in zip(models["model_id"], models["model_name_kr"]):
+        # 상위 어휘는 공통, 중하위 순위는 모델마다 다르게 (모델별 특징 키워드)
+        order = np.concatenate([np.arange(20), 20 + rng.permutation(len(vocab) - 20)])
+        cdf = np.cumsum(probs[np.argsort(order)])
+
+        for month in blog_months:
+            month_counts: Dict[str, int] = {}
+            for rank in range(1, spec.articles_per_month + 1):
+                n_words = max(30, int(rng.normal(spec.article_tokens, spec.article_tokens * 0.3)))
+                idx = np.searchsorted(cdf, rng.random(n_words) * cdf[-1])
+                words = vocab[np.minimum(idx, len(vocab) - 1)]
+                for w in words:
+                    month_counts[w] = month_counts.get(w, 0) + 1
+                content = _korean_text(words, rng)
+                posted = datetime.datetime.combine(
+                    month + datetime.timedelta(days=int(rng.integers(0, 28))),
+                    datetime.time(int(rng.integers(0, 24)), int(rng.integers(0, 60))),
+                )
+                articles.append(
+                    {
+                        "model_id": int(model_id),
+                        "month": month,
+                        "search_keyword": model_name,
+                        "search_rank": rank,
+                        "title": f"{model_name} {' '.join(words[:3])} 후기",
+                        "url": f"https://blog.naver.com/synthetic{model_id}/{month:%Y%m}{rank:03d}",
+                        "summary": content[:150],
+                        "content_plain": content,
+                        "posted_at": posted,
+                    }
+                )
+
+            top = sorted(month_counts.items(), key=lambda kv: (-kv[1], kv[0]))
+            tokens.extend(
+                {
+                    "model_id": int(model_id),
+                    "month": month,
+                    "token": str(token),
+                    "total_count": int(count),
+                    "token_rank": token_rank,
+                }
+                for token_rank, (token, count) in enumerate(
+                    top[: spec.tokens_per_month], start=1
+                )
+            )
+            wordclouds.append(
+                {"model_id": int(model_id), "month": month, "image_path": WORDCLOUD_PLACEHOLDER}
+            )
+
+    return {
+        "blog_article": pd.DataFrame(articles),
+        "blog_token_monthly": pd.DataFrame(tokens),
+        "blog_wordcloud": pd.DataFrame(wordclouds),
+    }
+
+
+def generate_tables(spec: SyntheticSpec) -> Dict[str, pd.DataFrame]:
+    """스키마 테이블 이름 → DataFrame (TABLE_ORDER 순서로 적재하면 FK 가 맞는다)."""
+    rng = np.random.default_rng(spec.seed)
+    months = month_range(spec.end_month or _default_end_month(), spec.n_months)
+
+    models = generate_car_models(spec, rng)
+    sales = generate_sales(models, months, rng)
+    interest = generate_interest(models, sales, rng)
+    tables = {
+        "car_model": models,
+        "model_monthly_sales": sales,
+        "model_monthly_interest": interest,
+        "model_monthly_interest_detail": generate_interest_detail(interest, rng),
+    }
+    tables.update(generate_blog(models, months, spec, rng))
+    return tables
+
+
+# -----------------------------
+# DB 적재
+# -----------------------------
+def create_database(engine: Engine, drop: bool = False) -> None:
+    """engine URL 의 DB 를 (없으면) 만들고 init_schema.sql 을 적용한다."""
+    db_name = engine.url.database
+    server = create_engine(engine.url.set(database=""), future=True)
+    with server.begin() as conn:
+        if drop:
+            conn.execute(text(f"DROP DATABASE IF EXISTS `{db_name}`"))
+        exists = conn.execute(
+            text("SELECT 1 FROM information_schema.schemata WHERE schema_name = :db"),
+            {"db": db_name},
+        ).scalar()
+        if exists:
+            return
+        conn.execute(text(f"CREATE DATABASE `{db_name}` DEFAULT CHARSET utf8mb4"))
+    server.dispose()
+
+    sql = re.sub(r"^\s*--.*$", "", SCHEMA_SQL.read_text(encoding="utf-8"), flags=re.M)
+    with engine.begin() as conn:
+        for stmt in sql.split(";"):
+            if stmt.strip():
+                conn.exec_driver_sql(stmt)
+    print(f"[INFO] 벤치마크 DB 생성: {db_name}")
+
+
+def ensure_wordcloud_placeholder() -> None:
+    """blog_wordcloud.image_path 가 가리키는 공용 이미지 (없으면 한 번 생성)."""
+    path = BASE_DIR / WORDCLOUD_PLACEHOLDER
+    if path.exists():
+        return
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fig, ax = plt.subplots(figsize=(4, 2))
+    ax.text(0.5, 0.5, "synthetic", ha="center", va="center", fontsize=24)
+    ax.axis("off")
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def write_tables(
+    engine: Engine, tables: Dict[str, pd.DataFrame], chunk_size: int = 5000
+) -> Dict[str, int]:
+    """TABLE_ORDER 순서로 executemany insert. return: 테이블별 행 수"""
+    written: Dict[str, int] = {}
+    for table in TABLE_ORDER:
+        df = tables.get(table)
+        if df is None or df.empty:
+            continue
+        if table == "blog_wordcloud":
+            ensure_wordcloud_placeholder()
+        cols = list(df.columns)
+        stmt = text(
+            f"INSERT INTO {table} ({', '.join(cols)}) "
+            f"VALUES ({', '.join(':' + c for c in cols)})"
+        )
+        records = df.to_dict("records")
+        with engine.begin() as conn:
+            for start in range(0, len(records), chunk_size):
+                conn.execute(stmt, records[start : start + chunk_size])
+        written[table] = len(records)
+        print(f"[INFO] {table}: {len(records):,} rows")
+    return written
+
+
+def table_has_rows(engine: Engine, table: str = "car_model") -> bool:
+    with engine.connect() as conn:
+        try:
+            return bool(conn.execute(text(f"SELECT 1 FROM {table} LIMIT 1")).scalar())
+        except Exception:
+            return False
+
+
+def seed_database(engine: Engine, spec: SyntheticSpec, drop: bool = False) -> Dict[str, int]:
+    create_database(engine, drop=drop)
+    return write_tables(engine, generate_tables(spec))
+
+
+# -----------------------------
+# 파일 출력 (Parquet / CSV / ETL raw 형식)
+# -----------------------------
+def write_table_files(
+    tables: Dict[str, pd.DataFrame], out_dir: Path, fmt: str
+) -> Dict[str, int]:
+    """테이블별 <out_dir>/<table>.parquet|csv (parquet 은 pyarrow 필요)."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written: Dict[str, int] = {}
+    for table in TABLE_ORDER:
+        df = tables.get(table)
+        if df is None:
+            continue
+        path = out_dir / f"{table}.{fmt}"
+        if fmt == "parquet":
+            df.to_parquet(path, index=False)
+        else:
+            df.to_csv(path, index=False, encoding="utf-8-sig")
+        written[table] = len(df)
+        print(f"[INFO] {table}: {len(df):,} rows → {path}")
+    return written
+
+
+def _change_str(curr: int, prev: Optional[int]) -> str:
+    """다나와 전월/전년대비 표기: '<기준값> <증감>▲/▼'"""
+    if prev is None:
+        return "-"
+    diff = curr - prev
+    return f"{prev} {abs(diff)}{'▲' if diff >= 0 else '▼'}"
+
+
+def write_danawa_raw(tables: Dict[str, pd.DataFrame], run_id: str) -> int:
+    """
+    data/raw/danawa/<run_id>/<brand>/<brand>_model_sales_YYYY_MM_00.csv (+ _model_meta_)
+    크롤러(save_sales_csv / save_meta_csv) 출력과 같은 형식이라 normalize_folder → 로더 순서로 쓸 수 있다.
+    """
+    models = tables["car_model"].set_index("model_id")
+    sales = tables["model_monthly_sales"].join(models, on="model_id")
+    sales["ym"] = sales["month"].map(lambda m: m.year * 12 + m.month)
+    units_by_key = dict(zip(zip(sales["model_id"], sales["ym"]), sales["sales_units"]))
+
+    files = 0
+    for (brand, month), grp in sales.groupby(["brand_name", "month"], sort=True):
+        code = brand_code(brand)
+        brand_dir = RAW_BASE / "danawa" / run_id / code
+        brand_dir.mkdir(parents=True, exist_ok=True)
+        month_tag = f"{month:%Y_%m}_00"
+        grp = grp.sort_values("sales_units", ascending=False)
+        brand_total = grp["sales_units"].sum()
+
+        with (brand_dir / f"{code}_model_sales_{month_tag}.csv").open(
+            "w", newline="", encoding="utf-8-sig"
+        ) as f:
+            writer = csv.writer(f)
+            writer.writerow(["순위", "", "모델명", "판매량", "점유율", "전월대비", "전년대비"])
+            for rank, r in enumerate(grp.itertuples(index=False), start=1):
+                writer.writerow(
+                    [
+                        rank,
+                        "",
+                        r.model_name_kr,
+                        f"{r.sales_units:,}",
+                        f"{r.sales_units / brand_total * 100:.1f}%",
+                        _change_str(r.sales_units, units_by_key.get((r.model_id, r.ym - 1))),
+                        _change_str(r.sales_units, units_by_key.get((r.model_id, r.ym - 12))),
+                    ]
+                )
+
+        with (brand_dir / f"{code}_model_meta_{month_tag}.csv").open(
+            "w", newline="", encoding="utf-8-sig"
+        ) as f:
+            writer = csv.writer(f)
+            writer.writerow(["brand", "month", "rank", "model_name", "detail_url", "image_url"])
+            for rank, r in enumerate(grp.itertuples(index=False), start=1):
+                writer.writerow(
+                    [code, f"{month:%Y-%m}-00", rank, r.model_name_kr, r.danawa_model_url, ""]
+                )
+        files += 2
+    return files
+
+
+def write_naver_raw(tables: Dict[str, pd.DataFrame], run_id: str) -> int:
+    """data/raw/naver/<run_id>/naver_trend_<run_id>.csv (run_naver_trend_crawl 출력 형식)"""
+    models = tables["car_model"].set_index("model_id")
+    detail = tables["model_monthly_interest_detail"].join(models, on="model_id")
+    out = pd.DataFrame(
+        {
+            "model_id": detail["model_id"],
+            "brand_name": detail["brand_name"],
+            "model_name": detail["model_name_kr"],
+            "date": detail["month"].map(lambda m: m.strftime("%Y-%m-%d")),
+            "device": detail["device"],
+            "gender": detail["gender"],
+            "age_group": detail["age_group"],
+            "ratio": detail["ratio"],
+        }
+    )
+    out_dir = RAW_BASE / "naver" / run_id
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out.to_csv(out_dir / f"naver_trend_{run_id}.csv", index=False, encoding="utf-8-sig")
+    return len(out)
+
+
+def write_google_raw(tables: Dict[str, pd.DataFrame], run_id: str) -> int:
+    """
+    data/raw/google/<run_id>/google_trend_<run_id>_<brand>_all.csv
+    구글 트렌드 내보내기 wide 형식 (1행 '카테고리: 자동차', 컬럼 '<모델명>: (대한민국)').
+    월 지수를 그 달의 주 단위 행으로 펼친다.
+    """
+    models = tables["car_model"].set_index("model_id")
+    interest = tables["model_monthly_interest"].join(models, on="model_id")
+    out_dir = RAW_BASE / "google" / run_id
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    files = 0
+    for brand, grp in interest.groupby("brand_name"):
+        wide = grp.pivot_table(
+            index="month", columns="model_name_kr", values="google_trend_index", aggfunc="first"
+        )
+        wide.index = pd.to_datetime(wide.index)
+        weeks = pd.date_range(
+            wide.index.min(), wide.index.max() + pd.offsets.MonthEnd(0), freq="W-SUN"
+        )
+        weekly = wide.reindex(weeks.to_period("M").to_timestamp())
+        weekly.index = weeks.strftime("%Y-%m-%d")
+        weekly.index.name = "주"
+        weekly.columns = [f"{c}: (대한민국)" for c in weekly.columns]
+
+        with (out_dir / f"google_trend_{run_id}_{brand_code(brand)}_all.csv").open(
+            "w", newline="", encoding="utf-8-sig"
+        ) as f:
+            f.write("카테고리: 자동차\n")
+            weekly.fillna(0).astype(int).to_csv(f)
+        files += 1
+    return files
+
+
+def write_raw_files(tables: Dict[str, pd.DataFrame], run_id: str) -> None:
+    """
+    ETL 입력 형식 그대로 data/raw/ 아래에 쓴다.
+    다나와/구글 로더는 현대/기아 코드만 인식하므로 로더 부하 테스트는 --brands 2 로 생성한다.
+    """
+    print(f"[INFO] danawa raw CSV: {write_danawa_raw(tables, run_id)} files")
+    print(f"[INFO] naver raw CSV: {write_naver_raw(tables, run_id):,} rows")
+    print(f"[INFO] google raw CSV: {write_google_raw(tables, run_id)} files")
+    unknown = sorted(set(tables["car_model"]["brand_name"]) - set(BRAND_CODES))
+    if unknown:
+        print(
+            f"[WARN] ETL 로더가 모르는 브랜드 {len(unknown)}개는 적재 시 건너뜁니다. (--brands 2 권장)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="car_trend 스키마용 합성 데이터 생성 (N 모델 × M 개월)"
+    )
+    parser.add_argument("--models", type=int, default=100, help="모델 수")
+    parser.add_argument("--months", type=int, default=24, help="개월 수")
+    parser.add_argument(
+        "--brands", type=int, default=None, help="브랜드 수 (default: 모델 50개당 1개)"
+    )
+    parser.add_argument(
+        "--blog-months", type=int, default=3, help="블로그 글/토큰을 만들 최근 개월 수"
+    )
+    parser.add_argument("--articles", type=int, default=3, help="모델·월별 블로그 글 수")
+    parser.add_argument("--end-month", default=None, help="마지막 월 YYYY-MM (default: 지난달)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--target",
+        choices=["db", "parquet", "csv", "raw"],
+        default="db",
+        help="db: 벤치마크 DB 적재 / parquet·csv: 테이블별 파일 / raw: ETL 입력(data/raw) 형식",
+    )
+    parser.add_argument(
+        "--db-name", default=None, help="적재할 DB 이름 (default: car_trend_bench_<models>)"
+    )
+    parser.add_argument(
+        "--drop", action="store_true", help="같은 이름의 DB 가 있으면 지우고 다시 생성"
+    )
+    parser.add_argument(
+        "--out-dir",
+        default=None,
+        help="parquet/csv 출력 폴더 (default: data/bench/synthetic/<models>)",
+    )
+    parser.add_argument(
+        "--run-id", default=None, help="raw 출력 run_id (default: synthetic_<models>)"
+    )
+    args = parser.parse_args()
+
+    end_month = (
+        datetime.datetime.strptime(args.end_month[:7] + "-01", "%Y-%m-%d").date()
+        if args.end_month
+        else None
+    )
+    spec = SyntheticSpec(
+        n_models=args.models,
+        n_months=args.months,
+        n_brands=args.brands,
+        blog_months=args.blog_months,
+        articles_per_month=args.articles,
+        end_month=end_month,
+        seed=args.seed,
+    )
+
+    if args.target == "db":
+        os.environ["DB_NAME"] = args.db_name or f"car_trend_bench_{args.models}"
+        seed_database(get_engine(echo=False), spec, drop=args.drop)
+        return
+
+    tables = generate_tables(spec)
+    if args.target == "raw":
+        write_raw_files(tables, args.run_id or f"synthetic_{args.models}")
+    else:
+        out_dir = Path(args.out_dir) if args.out_dir else SYNTHETIC_BASE / str(args.models)
+        write_table_files(tables, out_dir, args.target)
+
+
+if __name__ == "__main__":
+    main()
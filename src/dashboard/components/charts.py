@@ -63,3 +63,73 @@ def build_interest_chart(df_top: pd.DataFrame) -> go.Figure:
     )
 
     return fig
+
+
+def build_etl_run_chart(df_runs: pd.DataFrame, metric: str, title: str) -> go.Figure:
+    """
+    etl_run 기록의 단계별 추이 (x=started_at, 색=stage, 실패 실행은 X 마커)
+    df_runs: started_at, stage, status, <metric>
+    """
+    chart_df = df_runs.copy()
+    chart_df[metric] = pd.to_numeric(chart_df[metric], errors="coerce")
+
+    fig = px.line(
+        chart_df,
+        x="started_at",
+        y=metric,
+        color="stage",
+        symbol="status",
+        symbol_map={"success": "circle", "failed": "x"},
+        markers=True,
+        hover_data=["run_id", "rows_read", "rows_written", "errors"],
+        title=title,
+    )
+    fig.update_layout(
+        xaxis=dict(title="실행 시각"),
+        yaxis=dict(title=metric, rangemode="tozero"),
+        margin=dict(l=40, r=40, t=40, b=40),
+        legend=dict(orientation="h", y=-0.2),
+    )
+    return fig
+
+
+def build_profile_waterfall(df_spans: pd.DataFrame) -> go.Figure:
+    """
+    rerun 프로파일 워터폴 (가로 막대: 시작 시점 ~ 종료 시점, 색=구간 종류)
+    df_spans: label, kind, depth, start_ms, duration_ms (기록 순서)
+    """
+    chart_df = df_spans.reset_index(drop=True).copy()
+    # 같은 라벨이 여러 번 나와도 각각 한 줄로 보이도록 순번을 붙인다.
+    chart_df["row"] = [
+        f"{i:02d} {'  ' * int(d)}{label}"
+        for i, (d, label) in enumerate(zip(chart_df["depth"], chart_df["label"]))
+    ]
+
+    colors = {"page": "#9e9e9e", "section": "#4c78a8", "query": "#f58518", "image": "#54a24b"}
+    fig = go.Figure()
+    for kind, grp in chart_df.groupby("kind", sort=False):
+        fig.add_trace(
+            go.Bar(
+                y=grp["row"],
+                x=grp["duration_ms"],
+                base=grp["start_ms"],
+                orientation="h",
+                name=kind,
+                marker_color=colors.get(kind),
+                hovertemplate="%{y}<br>start %{base:.0f}ms · %{x:.1f}ms<extra></extra>",
+            )
+        )
+
+    fig.update_layout(
+        barmode="overlay",
+        height=max(240, 22 * len(chart_df) + 80),
+        xaxis=dict(title="rerun 시작 후 경과 (ms)"),
+        yaxis=dict(
+            categoryorder="array",
+            categoryarray=list(reversed(chart_df["row"].tolist())),
+            title="",
+        ),
+        margin=dict(l=40, r=40, t=20, b=40),
+        legend=dict(orientation="h", y=-0.15),
+    )
+    return fig
@@ -2,6 +2,8 @@
 import pathlib
 import streamlit as st
 
+from utils.profiler import timed
+
 # 현재 파일: .../src/dashboard/components/images.py
 # 프로젝트 루트: .../SKN22-1st-3Team
 PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[3]
@@ -43,7 +45,8 @@ def image_card(title: str, image_url: str, caption: str | None = None):
             st.caption(caption)
         return
 
-    st.image(str(img_path), width="stretch")
+    with timed(f"image: {img_path.name}", "image"):
+        st.image(str(img_path), width="stretch")
 
     if caption:
         st.caption(caption)
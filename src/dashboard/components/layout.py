@@ -3,6 +3,8 @@ from typing import Iterator, Optional
 
 import streamlit as st
 
+from utils.profiler import timed
+
 
 def page_header(title: str, subtitle: Optional[str] = None) -> None:
     """Render a consistent dashboard page header."""
@@ -22,7 +24,7 @@ def section(
 ) -> Iterator[None]:
     """Container wrapper that standardizes section headings."""
     container = st.container()
-    with container:
+    with timed(f"section: {title or '(untitled)'}", "section"), container:
         if title:
             st.markdown(
                 f"<div class='section-title'>{title}</div>", unsafe_allow_html=True
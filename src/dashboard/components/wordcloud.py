@@ -0,0 +1,139 @@
+# src/dashboard/components/wordcloud.py
+import json
+from typing import Iterable, List, Sequence, Tuple, Union
+
+import pandas as pd
+import streamlit as st
+import streamlit.components.v1 as components
+
+TokenInput = Union[pd.DataFrame, Sequence[Tuple[str, int]]]
+
+# generate_wordcloud.py 의 WordCloud 기본 팔레트(viridis)와 비슷한 색
+PALETTE = ["#440154", "#3b528b", "#21918c", "#5ec962", "#2c728e", "#472d7b", "#28ae80"]
+
+# 브라우저에서 캔버스에 아르키메데스 나선으로 단어를 배치한다.
+# (외부 스크립트/폰트 로드 없음, 토큰 JSON 만 전달)
+_TEMPLATE = """
+<div id="wc-root" style="width:100%;height:__HEIGHT__px;position:relative;">
+  <canvas id="wc-canvas" style="width:100%;height:100%;display:block;"></canvas>
+</div>
+<script>
+(function () {
+  const WORDS = __WORDS__;
+  const PALETTE = __PALETTE__;
+  const FONT = '"Apple SD Gothic Neo","Malgun Gothic","Nanum Gothic","Noto Sans KR",sans-serif';
+  const root = document.getElementById("wc-root");
+  const canvas = document.getElementById("wc-canvas");
+  const ctx = canvas.getContext("2d");
+  let placed = [];
+
+  function overlaps(a, b) {
+    return a.x < b.x + b.w && a.x + a.w > b.x && a.y < b.y + b.h && a.y + a.h > b.y;
+  }
+
+  function draw() {
+    const dpr = window.devicePixelRatio || 1;
+    const W = root.clientWidth, H = root.clientHeight;
+    canvas.width = W * dpr;
+    canvas.height = H * dpr;
+    ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+    ctx.clearRect(0, 0, W, H);
+    ctx.textAlign = "center";
+    ctx.textBaseline = "middle";
+    placed = [];
+    if (!WORDS.length) return;
+
+    const counts = WORDS.map(w => w[1]);
+    const cMax = Math.max(...counts), cMin = Math.min(...counts);
+    const maxSize = Math.max(14, Math.min(W, H) / 5.5), minSize = 10;
+    const cx = W / 2, cy = H / 2, aspect = W / H;
+
+    WORDS.forEach(([text, count], i) => {
+      const ratio = cMax === cMin ? 1 : (count - cMin) / (cMax - cMin);
+      let size = minSize + (maxSize - minSize) * Math.sqrt(ratio);
+      for (let attempt = 0; attempt < 3; attempt++, size *= 0.8) {
+        ctx.font = "700 " + size + "px " + FONT;
+        const w = ctx.measureText(text).width + 4, h = size * 1.05;
+        for (let t = 0; t < 600; t += 0.35) {
+          const x = cx + t * Math.cos(t) * aspect * 0.9 - w / 2;
+          const y = cy + t * Math.sin(t) * 0.9 - h / 2;
+          if (x < 0 || y < 0 || x + w > W || y + h > H) continue;
+          const box = { x: x, y: y, w: w, h: h };
+          if (placed.some(p => overlaps(box, p))) continue;
+          ctx.fillStyle = PALETTE[i % PALETTE.length];
+          ctx.fillText(text, x + w / 2, y + h / 2);
+          placed.push(Object.assign(box, { text: text, count: count }));
+          return;
+        }
+      }
+    });
+  }
+
+  canvas.addEventListener("mousemove", (e) => {
+    const r = canvas.getBoundingClientRect();
+    const mx = e.clientX - r.left, my = e.clientY - r.top;
+    const hit = placed.find(p => mx >= p.x && mx <= p.x + p.w && my >= p.y && my <= p.y + p.h);
+    canvas.title = hit ? hit.text + ": " + hit.count + "회" : "";
+  });
+
+  let timer = null;
+  window.addEventListener("resize", () => {
+    clearTimeout(timer);
+    timer = setTimeout(draw, 100);
+  });
+  draw();
+})();
+</script>
+"""
+
+
+def _to_pairs(tokens: TokenInput, max_words: int) -> List[Tuple[str, int]]:
+    """DataFrame(token, total_count) 또는 (token, count) 리스트 → 빈도 내림차순 상위 max_words."""
+    if isinstance(tokens, pd.DataFrame):
+        if tokens.empty:
+            return []
+        pairs: Iterable = zip(tokens["token"], tokens["total_count"])
+    else:
+        pairs = tokens
+
+    cleaned = [(str(t), int(c)) for t, c in pairs if t and c and int(c) > 0]
+    cleaned.sort(key=lambda x: (-x[1], x[0]))
+    return cleaned[:max_words]
+
+
+def build_wordcloud_html(tokens: TokenInput, height: int = 360, max_words: int = 100) -> str:
+    """토큰 빈도를 캔버스 워드클라우드 HTML 문자열로 만든다."""
+    words = json.dumps(_to_pairs(tokens, max_words), ensure_ascii=True)
+    return (
+        _TEMPLATE.replace("__HEIGHT__", str(int(height)))
+        .replace("__WORDS__", words.replace("</", "<\\/"))
+        .replace("__PALETTE__", json.dumps(PALETTE))
+    )
+
+
+def wordcloud_card(
+    title: str,
+    tokens: TokenInput,
+    caption: str | None = None,
+    height: int = 360,
+    max_words: int = 100,
+):
+    """
+    blog_token_monthly 행으로 브라우저에서 바로 그리는 워드클라우드.
+    (generate_wordcloud.py 로 만든 PNG 파일이 없어도 표시된다)
+    """
+    st.markdown(f"**{title}**")
+
+    if not _to_pairs(tokens, 1):
+        st.info("워드클라우드를 그릴 토큰 데이터가 없습니다.")
+        if caption:
+            st.caption(caption)
+        return
+
+    components.html(
+        build_wordcloud_html(tokens, height=height, max_words=max_words),
+        height=height + 10,
+    )
+
+    if caption:
+        st.caption(caption)
@@ -5,8 +5,9 @@ import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
-from components.images import image_card
+from components.wordcloud import wordcloud_card
 from components.layout import page_header, section, two_columns_ratio
+from utils.profiler import profile_page
 from utils.ui import load_global_css
 
 import queries
@@ -235,31 +236,25 @@ def render():
             with section(
                 title=f"워드클라우드 – {_format_month(blog_month)}", spacing=False
             ):
-                image_path = queries.get_blog_wordcloud_image_path(
-                    selected_model_id, blog_month
-                )
-                if image_path:
-                    image_card(
-                        title="Word Cloud",
-                        image_url=image_path,
-                        caption=f"{selected_model_name} – {_format_month(blog_month)} 기준",
-                    )
-                else:
-                    st.info("워드클라우드 이미지가 없습니다.")
-
+                # 워드클라우드(상위 50개)와 표(상위 20개)를 한 번의 조회로 같이 쓴다
                 tokens_df = queries.get_blog_tokens_for_model_month(
-                    selected_model_id, blog_month, top_n=20
+                    selected_model_id, blog_month, top_n=50
                 )
+                wordcloud_card(
+                    title="Word Cloud",
+                    tokens=tokens_df,
+                    caption=f"{selected_model_name} – {_format_month(blog_month)} 기준",
+                )
+
                 if tokens_df.empty:
                     st.info("토큰 분석 데이터가 없습니다.")
                 else:
-                    tokens_df.rename(
+                    tokens_df = tokens_df.head(20).rename(
                         columns={
                             "token": "단어",
                             "total_count": "등장 횟수",
                             "token_rank": "순위",
                         },
-                        inplace=True,
                     )
                     st.dataframe(tokens_df, width="stretch", height=300)
 
@@ -283,4 +278,5 @@ def render():
 
 
 if __name__ == "__main__":
-    render()
+    with profile_page("01_Overview"):
+        render()
@@ -9,10 +9,14 @@ import streamlit as st
 
 from components.layout import two_columns_ratio
 from components.charts import build_interest_chart
+from utils.profiler import profile_page
 from utils.ui import load_global_css
 
 import queries
 
+# RAW 표 한 페이지 행 수
+RAW_PAGE_SIZE = 500
+
 
 def _format_month(d: DateType) -> str:
     return d.strftime("%Y-%m")
@@ -223,21 +227,36 @@ def render():
         unsafe_allow_html=True,
     )
 
-    detail_df = queries.load_interest_detail(month, brand_param)
+    detail_total = queries.count_interest_detail(month, brand_param)
 
-    if detail_df.empty:
+    if detail_total == 0:
         st.info(
             "해당 월에 대해 저장된 네이버 디테일 데이터가 없습니다. "
             "model_monthly_interest_detail 로더를 확인해주세요."
         )
         return
 
-    # RAW 표 먼저 보여주기
+    # RAW 표 먼저 보여주기 (연령대까지 포함해 행이 많으므로 페이지 단위로 조회)
     with st.expander("RAW 데이터 보기 (model_monthly_interest_detail)", expanded=False):
+        page_count = (detail_total - 1) // RAW_PAGE_SIZE + 1
+        page = st.number_input(
+            f"페이지 (총 {detail_total:,}행, {page_count}페이지)",
+            min_value=1,
+            max_value=page_count,
+            value=1,
+            step=1,
+        )
+        detail_df = queries.load_interest_detail(
+            month,
+            brand_param,
+            limit=RAW_PAGE_SIZE,
+            offset=(int(page) - 1) * RAW_PAGE_SIZE,
+        )
         st.dataframe(detail_df, height=400)
 
-    # 모델 × (device, gender) 피벗 집계
-    pivot_df = detail_df.pivot_table(
+    # 모델 × (device, gender) 피벗 집계 (DB 에서 청크로 읽으며 부분합 누적)
+    segment_df = queries.sum_interest_detail_by_segment(month, brand_param)
+    pivot_df = segment_df.pivot_table(
         index=["brand_name", "model_name_kr"],
         columns=["device", "gender"],
         values="ratio",
@@ -259,4 +278,5 @@ def render():
 
 
 if __name__ == "__main__":
-    render()
+    with profile_page("02_관심도 분석"):
+        render()
@@ -7,9 +7,13 @@ import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
+from utils.profiler import profile_page
 from utils.ui import load_global_css
 import queries
 
+# RAW 표 한 페이지 행 수
+RAW_PAGE_SIZE = 500
+
 
 def _format_month(d: DateType) -> str:
     return d.strftime("%Y-%m")
@@ -210,12 +214,27 @@ def render():
         unsafe_allow_html=True,
     )
 
-    raw_df = queries.get_monthly_sales_raw(month, brand_param)
+    raw_total = queries.count_monthly_sales_raw(month, brand_param)
 
-    if raw_df.empty:
+    if raw_total == 0:
         st.info("해당 조건에 대한 RAW 판매 데이터가 없습니다.")
         return
 
+    page_count = (raw_total - 1) // RAW_PAGE_SIZE + 1
+    page = st.number_input(
+        f"페이지 (총 {raw_total:,}개 모델, {page_count}페이지)",
+        min_value=1,
+        max_value=page_count,
+        value=1,
+        step=1,
+    )
+    raw_df = queries.get_monthly_sales_raw(
+        month,
+        brand_param,
+        limit=RAW_PAGE_SIZE,
+        offset=(int(page) - 1) * RAW_PAGE_SIZE,
+    )
+
     raw_df["adoption_rate_pct"] = (
         pd.to_numeric(raw_df["adoption_rate"], errors="coerce").fillna(0.0) * 100.0
     )
@@ -247,4 +266,5 @@ def render():
 
 
 if __name__ == "__main__":
-    render()
+    with profile_page("03_보급률 분석"):
+        render()
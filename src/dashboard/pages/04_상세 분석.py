@@ -8,8 +8,9 @@ import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
-from components.images import image_card
+from components.wordcloud import wordcloud_card
 from components.layout import page_header, section
+from utils.profiler import profile_page
 from utils.ui import load_global_css
 
 import queries
@@ -204,6 +205,41 @@ def render():
         )
         st.plotly_chart(fig2, width="stretch")
 
+    with section(title="🔎 블로그 리뷰 검색"):
+        col_q, col_scope = st.columns([3, 2])
+        with col_q:
+            search_term = st.text_input(
+                "검색어 (공백으로 여러 단어 입력 시 모두 포함된 글)",
+                placeholder="예: 승차감 소음",
+            )
+        with col_scope:
+            only_model = st.checkbox(f"{model_name_kr} 글만", value=True)
+            only_period = st.checkbox("선택 기간 내 월만", value=False)
+
+        if search_term.strip():
+            period_months = (
+                list(pd.date_range(start_date, end_date, freq="MS").date)
+                if only_period
+                else None
+            )
+            result_df = queries.search_blog_articles(
+                search_term,
+                model_id=model_id if only_model else None,
+                months=period_months,
+                limit=30,
+            )
+            if result_df.empty:
+                st.info("검색 결과가 없습니다. (2글자 이상 단어로 검색)")
+            else:
+                st.caption(f"검색 결과 {len(result_df)}건 (관련도 순)")
+                for _, row in result_df.iterrows():
+                    st.markdown(f"**[{strip_tags(row['title'])}]({row['url']})**")
+                    st.caption(
+                        f"{row['brand_name']} {row['model_name_kr']} · "
+                        f"{_format_month(row['month'])} · 관련도 {float(row['score']):.2f}"
+                    )
+                    st.write(strip_tags(row["snippet"]) + "…")
+
     with section(title="블로그 / 워드클라우드 스냅샷"):
         blog_months = queries.get_model_blog_months(model_id)
 
@@ -222,7 +258,6 @@ def render():
 
         tokens_df = queries.get_model_blog_tokens(model_id, selected_month)
         articles_df = queries.get_model_blog_articles(model_id, selected_month)
-        image_path = queries.get_blog_wordcloud_image_path(model_id, selected_month)
 
         col_t, col_w = st.columns([2, 1])
 
@@ -244,14 +279,43 @@ def render():
 
         with col_w:
             with section(title="워드클라우드", spacing=False):
-                if image_path:
-                    image_card(
-                        title="Word Cloud",
-                        image_url=image_path,
-                        caption=f"{brand_name} {model_name_kr} – {_format_month(selected_month)} 기준",
-                    )
-                else:
-                    st.info("워드클라우드 이미지가 없습니다.")
+                wordcloud_card(
+                    title="Word Cloud",
+                    tokens=tokens_df,
+                    caption=f"{brand_name} {model_name_kr} – {_format_month(selected_month)} 기준",
+                )
+
+        with section(title="📈 키워드 급상승 / 급하락 (전월·최근 3개월 대비)", spacing=False):
+            trend_df = queries.get_model_trending_keywords(
+                model_id, selected_month, limit=10
+            )
+            if trend_df.empty:
+                st.info("해당 월의 키워드 증감 데이터가 없습니다. (이전 월 데이터 필요)")
+            else:
+                trend_columns = {
+                    "trend_rank": "순위",
+                    "token": "키워드",
+                    "curr_count": "이번 달",
+                    "prev_count": "전월",
+                    "trailing_avg": "최근 평균",
+                    "mom_lift": "전월 대비(log2)",
+                }
+                col_up, col_down = st.columns(2)
+                for col, direction, label in (
+                    (col_up, "up", "🔺 급상승"),
+                    (col_down, "down", "🔻 급하락"),
+                ):
+                    with col:
+                        st.markdown(f"**{label}**")
+                        part = trend_df[trend_df["direction"] == direction]
+                        if part.empty:
+                            st.caption("해당 키워드 없음")
+                            continue
+                        st.dataframe(
+                            part[list(trend_columns)].rename(columns=trend_columns),
+                            hide_index=True,
+                            height=300,
+                        )
 
         with section(title="📄 블로그 상위 3개 글", spacing=False):
             if articles_df.empty:
@@ -276,4 +340,5 @@ def render():
 
 
 if __name__ == "__main__":
-    render()
+    with profile_page("04_상세 분석"):
+        render()
@@ -8,6 +8,7 @@ import plotly.express as px
 import streamlit as st
 
 import queries
+from utils.profiler import profile_page
 from utils.ui import load_global_css
 
 
@@ -195,4 +196,5 @@ def render():
 
 
 if __name__ == "__main__":
-    render()
+    with profile_page("05_시장 포지션"):
+        render()
@@ -1,24 +1,26 @@
 from __future__ import annotations
 
-import os
-import shlex
-import subprocess
-import sys
+import json
 import re
 from datetime import date, datetime
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import pandas as pd
 import streamlit as st
 
+from components.charts import build_etl_run_chart
 from components.layout import page_header, section
+from utils.query_stats import (
+    SLOW_QUERY_MS,
+    get_latency_stats,
+    get_slow_queries,
+    reset_query_stats,
+)
 from utils.ui import load_global_css
 
 import queries
-
-PROJECT_ROOT = Path(__file__).resolve().parents[3]
-
+from db.connection import get_write_engine
+from etl.job_runner import enqueue_job, format_command, request_cancel, tail_log
 
 def _default_run_id() -> str:
     return datetime.now().strftime("%y_%m_%d")
@@ -37,6 +39,7 @@ def _split_multi_value(value: str) -> List[str]:
 
 ETL_PIPELINES: List[Dict[str, Any]] = [
     {
+        "key": "danawa",
         "title": "① 다나와 → 모델 메타 + 월간 판매량",
         "summary": "Selenium 크롤링 → CSV 정규화 → car_model/car_model_image 및 model_monthly_sales 적재",
         "tables": [
@@ -82,6 +85,7 @@ ETL_PIPELINES: List[Dict[str, Any]] = [
         ],
     },
     {
+        "key": "naver",
         "title": "② 네이버 데이터랩 → 월간 관심도",
         "summary": "Naver DataLab API RAW 적재 → detail 테이블 → model_monthly_interest 집계",
         "tables": [
@@ -131,11 +135,14 @@ ETL_PIPELINES: List[Dict[str, Any]] = [
                 "label": "detail → interest 집계",
                 "description": "aggregate_naver_interest.py – model_monthly_interest_detail → model_monthly_interest 집계",
                 "script": "src/etl/interest/aggregate_naver_interest.py",
-                "params": [],
+                "params": [
+                    {"name": "incremental", "label": "증분 집계 (워터마크 이후 변경분만 DB 내부 집계)", "type": "checkbox", "default": True, "flag_when_true": "--incremental"},
+                ],
             },
         ],
     },
     {
+        "key": "google",
         "title": "③ 구글 트렌드 보조 지표",
         "summary": "wide-format CSV 정규화 → google_trend_index 업데이트",
         "tables": [
@@ -151,6 +158,31 @@ ETL_PIPELINES: List[Dict[str, Any]] = [
             "google_trend_index upsert",
         ],
         "commands": [
+            {
+                "key": "google_crawl",
+                "label": "구글 트렌드 수집",
+                "description": (
+                    "run_google_trend_crawl.py – 앵커 모델 1개 + 4개씩 배치 수집 후 하나의 스케일로 스티칭, "
+                    "data/raw/google/<run_id>/ 에 브랜드별 wide CSV 저장"
+                ),
+                "script": "src/etl/interest/run_google_trend_crawl.py",
+                "params": [
+                    {"name": "run_id", "label": "Run ID", "type": "text", "arg": "--run-id", "default": _default_run_id},
+                    {"name": "timeframe", "label": "기간 (pytrends timeframe)", "type": "text", "arg": "--timeframe", "default": "today 12-m"},
+                    {"name": "anchor", "label": "앵커 모델명 (선택)", "type": "text", "arg": "--anchor", "default": ""},
+                    {"name": "workers", "label": "동시 요청 워커 수", "type": "int", "arg": "--workers", "default": 2, "min_value": 1, "max_value": 8},
+                ],
+            },
+            {
+                "key": "google_normalize",
+                "label": "wide CSV 정규화",
+                "description": "normalize_google_trend_wide.py – 벡터화 경로로 wide CSV → 월별 normalized CSV",
+                "script": "src/etl/interest/normalize_google_trend_wide.py",
+                "params": [
+                    {"name": "run_id", "label": "Run ID", "type": "text", "arg": "--run-id", "default": _default_run_id},
+                    {"name": "vectorized", "label": "벡터화 경로 사용", "type": "checkbox", "default": True, "flag_when_true": "--vectorized"},
+                ],
+            },
             {
                 "key": "google_trend",
                 "label": "구글 트렌드 반영",
@@ -166,8 +198,9 @@ ETL_PIPELINES: List[Dict[str, Any]] = [
         ],
     },
     {
+        "key": "blog",
         "title": "④ 네이버 블로그 + 워드클라우드",
-        "summary": "블로그 3건 검색→ 본문 정제 → 토큰/워드클라우드 생성",
+        "summary": "블로그 검색 페이지 스트리밍(수렴 시 중단) → 본문 정제 → 토큰/워드클라우드 생성",
         "tables": [
             {"name": "blog_article", "label": "blog_article", "dataset_key": "blog_article"},
             {
@@ -180,12 +213,18 @@ ETL_PIPELINES: List[Dict[str, Any]] = [
                 "label": "blog_wordcloud",
                 "dataset_key": "blog_wordcloud",
             },
+            {
+                "name": "blog_token_trend",
+                "label": "blog_token_trend",
+                "dataset_key": "blog_token_trend",
+            },
         ],
         "steps": [
             "네이버 검색 API로 상위 글 수집",
             "본문 크롤링 + 형태소 분석",
             "blog_article/blog_token_monthly 저장",
             "blog_token 기반 워드클라우드 이미지 생성",
+            "전체 토큰 빈도 기반 키워드 급상승/급하락 계산",
         ],
         "commands": [
             {
@@ -196,8 +235,15 @@ ETL_PIPELINES: List[Dict[str, Any]] = [
                 "params": [
                     {"name": "run_id", "label": "Run ID", "type": "text", "arg": "--run-id", "default": _default_run_id},
                     {"name": "limit_models", "label": "모델 제한 (0=전체)", "type": "int", "arg": "--limit-models", "default": 0, "min_value": 0, "skip_if": lambda v: v is None or int(v) <= 0},
-                    {"name": "max_articles", "label": "모델별 수집 글 개수", "type": "int", "arg": "--max-articles", "default": 3, "min_value": 1, "step": 1},
+                    {"name": "max_articles", "label": "모델별 최대 수집 글 수 (예산)", "type": "int", "arg": "--max-articles", "default": 100, "min_value": 1, "step": 10},
+                    {"name": "min_articles", "label": "수렴 판정 전 최소 글 수", "type": "int", "arg": "--min-articles", "default": 30, "min_value": 1, "step": 5},
+                    {"name": "max_pages", "label": "모델별 검색 API 페이지 예산", "type": "int", "arg": "--max-pages", "default": 10, "min_value": 1, "max_value": 50},
+                    {"name": "model_concurrency", "label": "동시 수집 모델 수", "type": "int", "arg": "--model-concurrency", "default": 4, "min_value": 1, "max_value": 16},
                     {"name": "summary_length", "label": "본문 요약 길이", "type": "int", "arg": "--summary-length", "default": 500, "min_value": 100, "step": 50},
+                    {"name": "concurrency", "label": "본문 동시 요청 수", "type": "int", "arg": "--concurrency", "default": 16, "min_value": 1, "max_value": 64},
+                    {"name": "per_host", "label": "호스트별 동시 요청 수", "type": "int", "arg": "--per-host", "default": 4, "min_value": 1, "max_value": 16},
+                    {"name": "dedup_threshold", "label": "유사 중복 판정 기준 (MinHash 유사도)", "type": "float", "arg": "--dedup-threshold", "default": 0.8, "min_value": 0.5, "max_value": 1.0, "step": 0.05},
+                    {"name": "dedup", "label": "유사 중복 글 필터 사용", "type": "checkbox", "default": True, "flag_when_false": "--no-dedup"},
                 ],
             },
             {
@@ -213,12 +259,48 @@ ETL_PIPELINES: List[Dict[str, Any]] = [
                     {"name": "width", "label": "이미지 가로(px)", "type": "int", "arg": "--width", "default": 800, "min_value": 100},
                     {"name": "height", "label": "이미지 세로(px)", "type": "int", "arg": "--height", "default": 600, "min_value": 100},
                     {"name": "max_words", "label": "최대 단어 수", "type": "int", "arg": "--max-words", "default": 100, "min_value": 10},
+                    {"name": "workers", "label": "렌더링 프로세스 수", "type": "int", "arg": "--workers", "default": 4, "min_value": 1, "max_value": 32},
+                    {"name": "force", "label": "변경 없는 모델도 다시 생성", "type": "checkbox", "default": False, "flag_when_true": "--force"},
+                ],
+            },
+            {
+                "key": "blog_token_trend",
+                "label": "키워드 증감 계산",
+                "description": "compute_token_trends.py – blog_token_counts 전체 빈도로 전월/최근 평균 대비 급상승·급하락 키워드를 blog_token_trend에 저장",
+                "script": "src/etl/blog/compute_token_trends.py",
+                "params": [
+                    {"name": "run_id", "label": "Run ID", "type": "text", "arg": "--run-id", "default": _default_run_id},
+                    {"name": "month", "label": "기준 월 (YYYY-MM, 비우면 최신)", "type": "text", "arg": "--month", "default": ""},
+                    {"name": "trailing_months", "label": "비교 개월 수", "type": "int", "arg": "--trailing-months", "default": 3, "min_value": 1, "max_value": 12},
+                    {"name": "top_k", "label": "방향별 저장 개수", "type": "int", "arg": "--top-k", "default": 20, "min_value": 5},
+                    {"name": "min_count", "label": "최소 등장 횟수", "type": "int", "arg": "--min-count", "default": 3, "min_value": 1},
+                    {"name": "backfill", "label": "전체 빈도 없는 월은 본문 재토큰화로 백필", "type": "checkbox", "default": False, "flag_when_true": "--backfill"},
                 ],
             },
         ],
     },
 ]
 
+ORCHESTRATOR_COMMAND: Dict[str, Any] = {
+    "key": "etl_orchestrator",
+    "pipeline": "orchestrator",
+    "label": "전체 ETL 일괄 실행 (DAG)",
+    "description": (
+        "orchestrator.py – 다나와/네이버/구글/블로그 파이프라인을 병렬로 실행하고, "
+        "단계별 체크포인트로 실패 지점부터 재개하며 입력이 바뀌지 않은 단계는 스킵합니다."
+    ),
+    "script": "src/etl/orchestrator.py",
+    "params": [
+        {"name": "run_id", "label": "Run ID", "type": "text", "arg": "--run-id", "default": _default_run_id},
+        {"name": "only", "label": "대상 파이프라인/단계 (비우면 전체, 예: naver blog)", "type": "text", "arg": "--only", "default": "", "split": True},
+        {"name": "from_stage", "label": "시작 단계 (선택, 예: naver_normalize)", "type": "text", "arg": "--from", "default": ""},
+        {"name": "workers", "label": "동시 실행 단계 수", "type": "int", "arg": "--workers", "default": 4, "min_value": 1, "max_value": 8},
+        {"name": "skip_crawl", "label": "수집 단계 제외 (이미 받은 파일 사용)", "type": "checkbox", "default": False, "flag_when_true": "--skip-crawl"},
+        {"name": "force", "label": "체크포인트 무시하고 전부 실행", "type": "checkbox", "default": False, "flag_when_true": "--force"},
+        {"name": "dry_run", "label": "실행 계획만 보기 (dry-run)", "type": "checkbox", "default": True, "flag_when_true": "--dry-run"},
+    ],
+}
+
 ADMIN_ACTIONS: List[str] = [
     "다나와 최신 데이터 수집",
     "CSV → DB 반영",
@@ -332,36 +414,90 @@ def _build_cli_args(param_defs: List[Dict[str, Any]], values: Dict[str, Any]) ->
     return args
 
 
-def run_etl_command(script_rel_path: str, cli_args: List[str]) -> tuple[bool, str, str]:
-    script_path = PROJECT_ROOT / script_rel_path
-    if not script_path.exists():
-        message = f"스크립트를 찾을 수 없습니다: {script_path}"
-        return False, script_rel_path, message
+JOB_STATUS_ICONS = {
+    "queued": "⏳ 대기",
+    "running": "🏃 실행 중",
+    "success": "✅ 성공",
+    "failed": "⚠️ 실패",
+    "cancelled": "⛔ 취소",
+}
+ACTIVE_JOB_STATUSES = ("queued", "running")
+LOG_VIEW_CHARS = 20000  # 화면에 유지할 로그 꼬리 길이
 
-    cmd = [sys.executable, str(script_path), *cli_args]
-    command_str = " ".join(shlex.quote(part) for part in cmd)
-    env = os.environ.copy()
-    env["PYTHONPATH"] = str(PROJECT_ROOT)
 
+def _enqueue_command(action: Dict[str, Any], pipeline_key: str, args: List[str]) -> Optional[int]:
     try:
-        result = subprocess.run(
-            cmd,
-            cwd=PROJECT_ROOT,
-            capture_output=True,
-            text=True,
-            env=env,
+        return enqueue_job(
+            get_write_engine(),
+            pipeline=pipeline_key,
+            command_key=action["key"],
+            script=action["script"],
+            args=args,
+            requested_by=st.session_state.get("etl_operator") or None,
         )
-        output = result.stdout
-        if result.stderr:
-            output = (output or "") + ("\n" if output else "") + result.stderr
-        if not output:
-            output = "(no output)"
-        return result.returncode == 0, command_str, output
     except Exception as exc:  # pragma: no cover - Streamlit runtime guard
-        return False, command_str, f"명령 실행 실패: {exc}"
-
+        st.error(f"작업 등록 실패: {exc}")
+        return None
+
+
+def _render_job(job: Dict[str, Any], slot: str) -> None:
+    """작업 상태와 로그. 로그는 지난번 offset 이후 추가분만 읽는다."""
+    job_id = int(job["job_id"])
+    buffers = st.session_state.setdefault("etl_log_buffers", {})
+    buf = buffers.setdefault(job_id, {"offset": 0, "text": ""})
+    if job.get("log_path"):
+        new_text, buf["offset"] = tail_log(job["log_path"], buf["offset"])
+        if new_text:
+            buf["text"] = (buf["text"] + new_text)[-LOG_VIEW_CHARS:]
+
+    status = JOB_STATUS_ICONS.get(job["status"], job["status"])
+    if job["status"] == "running" and job.get("started_at"):
+        elapsed = f"{(datetime.now() - job['started_at']).total_seconds():.0f}s 경과"
+    elif job.get("duration_sec") is not None:
+        elapsed = f"{job['duration_sec']:.1f}s"
+    else:
+        elapsed = "-"
+    cancel_note = " · 취소 요청됨" if job.get("cancel_requested") else ""
+    st.write(
+        f"작업 #{job_id} · {status} · {elapsed} · 요청 {job['created_at']:%Y-%m-%d %H:%M:%S}{cancel_note}"
+    )
 
-def render_etl_command(action: Dict[str, Any]) -> None:
+    command = format_command(job["script"], json.loads(job["args_json"] or "[]"))
+    st.code(f"$ {command}\n\n{buf['text'] or '(로그 대기 중)'}", language="bash")
+
+    if job["status"] in ACTIVE_JOB_STATUSES and not job.get("cancel_requested"):
+        if st.button("작업 취소", key=f"cancel_{slot}_{job_id}"):
+            request_cancel(get_write_engine(), job_id)
+            st.toast(f"작업 #{job_id} 취소를 요청했습니다.")
+
+
+@st.fragment(run_every=2)
+def _poll_job(job_id: int, slot: str) -> None:
+    """queued/running 작업만 2초마다 폴링한다. 작업이 끝나면 페이지를 다시 그려 폴링을 멈춘다."""
+    job = queries.get_etl_job(job_id)
+    if job is None:
+        st.warning(f"작업 #{job_id} 을 찾을 수 없습니다.")
+        return
+    if job["status"] not in ACTIVE_JOB_STATUSES:
+        st.rerun()
+    _render_job(job, slot)
+
+
+def render_job_monitor(job_id: int, slot: str) -> None:
+    """끝난 작업(success/failed/cancelled)은 한 번만 그리고, 진행 중인 작업만 폴링한다."""
+    job = queries.get_etl_job(job_id)
+    if job is None:
+        st.warning(f"작업 #{job_id} 을 찾을 수 없습니다.")
+    elif job["status"] in ACTIVE_JOB_STATUSES:
+        _poll_job(job_id, slot)
+    else:
+        _render_job(job, slot)
+
+
+def render_etl_command(
+    action: Dict[str, Any], pipeline_key: str, latest_job_ids: Dict[str, int]
+) -> None:
+    """latest_job_ids: queries.get_latest_etl_job_ids() (한 번 조회해 모든 명령이 같이 씀)"""
     st.markdown(f"**{action['label']}**")
     if action.get("description"):
         st.caption(action["description"])
@@ -373,25 +509,164 @@ def render_etl_command(action: Dict[str, Any]) -> None:
             values[param["name"]] = _render_param_input(param, prefix=form_key)
         submitted = st.form_submit_button("실행")
 
-    logs = st.session_state.setdefault("etl_logs", {})
-    log_entry = logs.get(action["key"])
+    # 명령별로 마지막에 넣은 작업을 기억해 두고 (탭을 새로고침해도 etl_job 에 남아 있음) 모니터링
+    watched = st.session_state.setdefault("etl_watched_jobs", {})
 
     if submitted:
         args = _build_cli_args(action.get("params", []), values)
-        with st.spinner("명령 실행 중..."):
-            success, command_str, output = run_etl_command(action["script"], args)
-        log_entry = {
-            "success": success,
-            "command": command_str,
-            "output": output,
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        }
-        logs[action["key"]] = log_entry
-
-    if log_entry:
-        status = "✅ 성공" if log_entry["success"] else "⚠️ 실패"
-        st.write(f"{status} · {log_entry['timestamp']}")
-        st.code(f"$ {log_entry['command']}\n\n{log_entry['output']}", language="bash")
+        job_id = _enqueue_command(action, pipeline_key, args)
+        if job_id is not None:
+            watched[action["key"]] = job_id
+            st.success(f"작업 #{job_id} 을 큐에 넣었습니다. 워커가 가져가면 로그가 이어서 표시됩니다.")
+
+    job_id = watched.get(action["key"]) or latest_job_ids.get(action["key"])
+    if job_id is not None:
+        render_job_monitor(job_id, slot=action["key"])
+
+
+def render_job_queue() -> None:
+    counts = queries.get_etl_job_status_counts()
+    cols = st.columns(len(JOB_STATUS_ICONS))
+    for col, (status, label) in zip(cols, JOB_STATUS_ICONS.items()):
+        col.metric(label, f"{counts.get(status, 0):,}")
+
+    if counts.get("queued", 0) and not counts.get("running", 0):
+        st.warning(
+            "대기 중인 작업이 있지만 실행 중인 작업이 없습니다. 워커가 떠 있는지 확인하세요: "
+            "`python src/etl/job_runner.py --workers 2`"
+        )
+
+    jobs = queries.get_etl_jobs(limit=30)
+    if jobs.empty:
+        st.info("등록된 작업이 없습니다.")
+        return
+
+    display_df = jobs[
+        [
+            "job_id",
+            "pipeline",
+            "command_key",
+            "status",
+            "requested_by",
+            "worker",
+            "created_at",
+            "duration_sec",
+            "returncode",
+        ]
+    ]
+    st.dataframe(display_df, width="stretch", hide_index=True)
+
+    job_ids = jobs["job_id"].astype(int).tolist()
+    selected = st.selectbox(
+        "로그 보기",
+        job_ids,
+        format_func=lambda j: f"#{j} · {jobs.loc[jobs['job_id'] == j, 'command_key'].iloc[0]}",
+        key="etl_queue_selected",
+    )
+    if selected is not None:
+        render_job_monitor(int(selected), slot="queue")
+
+
+def summarize_run_regressions(runs: pd.DataFrame, window: int = 10) -> pd.DataFrame:
+    """
+    단계별 마지막 성공 실행을 직전 window 회 성공 실행의 중앙값과 비교한다.
+    (소요 시간 +50% 이상 / 처리량 -33% 이상이면 회귀 의심)
+    """
+    ok = runs[runs["status"] == "success"].sort_values("started_at")
+    rows = []
+    for stage, grp in ok.groupby("stage", sort=True):
+        last = grp.iloc[-1]
+        prev = grp.iloc[-window - 1 : -1]
+        base_sec = prev["duration_sec"].median() if not prev.empty else None
+        base_rps = prev["rows_per_sec"].median() if not prev.empty else None
+        sec_change = (last["duration_sec"] / base_sec - 1) if base_sec else None
+        rps_change = (
+            (last["rows_per_sec"] / base_rps - 1)
+            if base_rps and pd.notna(last["rows_per_sec"])
+            else None
+        )
+        suspect = (sec_change is not None and sec_change >= 0.5) or (
+            rps_change is not None and rps_change <= -0.33
+        )
+        rows.append(
+            {
+                "stage": stage,
+                "last_run": last["started_at"],
+                "duration_sec": round(float(last["duration_sec"]), 2),
+                "median_sec": round(float(base_sec), 2) if base_sec else None,
+                "duration_change": f"{sec_change:+.0%}" if sec_change is not None else "-",
+                "rows_per_sec": last["rows_per_sec"],
+                "rps_change": f"{rps_change:+.0%}" if rps_change is not None else "-",
+                "regression": "⚠️" if suspect else "",
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def render_run_ledger() -> None:
+    scripts = queries.get_etl_run_scripts()
+    if not scripts:
+        st.info("ETL 실행 기록이 아직 없습니다.")
+        return
+
+    col_script, col_days = st.columns([3, 1])
+    script = col_script.selectbox("스크립트", scripts, key="ledger_script")
+    days = col_days.selectbox("기간(일)", [7, 30, 90, 365], index=2, key="ledger_days")
+
+    runs = queries.get_etl_runs(script=script, days=days)
+    if runs.empty:
+        st.info("선택한 기간에 실행 기록이 없습니다.")
+        return
+
+    st.plotly_chart(
+        build_etl_run_chart(runs, "duration_sec", "단계별 소요 시간(초)"), width="stretch"
+    )
+    rps = runs.dropna(subset=["rows_per_sec"])
+    if not rps.empty:
+        st.plotly_chart(
+            build_etl_run_chart(rps, "rows_per_sec", "단계별 처리량 (rows/sec)"), width="stretch"
+        )
+
+    st.markdown("**마지막 실행 vs 직전 10회 중앙값**")
+    st.dataframe(summarize_run_regressions(runs), width="stretch", hide_index=True)
+
+    with st.expander("최근 실행 기록"):
+        st.dataframe(
+            runs.sort_values("started_at", ascending=False).head(100),
+            width="stretch",
+            hide_index=True,
+        )
+
+
+def render_query_stats() -> None:
+    stats = get_latency_stats()
+    if stats.empty:
+        st.info("아직 수집된 쿼리 실행 기록이 없습니다. 다른 페이지를 열어본 뒤 다시 확인하세요.")
+        return
+
+    st.markdown("**쿼리 함수별 지연 시간 (ms)**")
+    st.dataframe(stats, width="stretch", hide_index=True)
+
+    slow = get_slow_queries(top_n=20)
+    st.markdown(f"**느린 쿼리 Top {len(slow)}** (>{SLOW_QUERY_MS:.0f}ms)")
+    if not slow:
+        st.caption("기준 시간을 넘긴 쿼리가 없습니다.")
+    for idx, entry in enumerate(slow, start=1):
+        label = (
+            f"{idx}. {entry['function']} · {entry['elapsed_ms']:.0f}ms · "
+            f"{entry['rows']} rows · {entry['at']:%H:%M:%S}"
+        )
+        with st.expander(label):
+            st.code(entry["statement"], language="sql")
+            st.caption(f"params: {entry['parameters']}")
+            if entry["plan"] is not None:
+                st.dataframe(entry["plan"], width="stretch", hide_index=True)
+            else:
+                st.caption("EXPLAIN 결과 없음")
+
+    if st.button("통계 초기화", key="query_stats_reset"):
+        reset_query_stats()
+        st.rerun()
 
 
 def render():
@@ -430,7 +705,10 @@ def render():
             )
             st.dataframe(display_df.sort_values("dataset"), width="stretch")
 
+    latest_job_ids = queries.get_latest_etl_job_ids()
+
     with section("ETL 라인 점검"):
+        st.text_input("요청자 (선택, 작업 큐에 기록)", key="etl_operator")
         for pipeline in ETL_PIPELINES:
             with st.expander(pipeline["title"], expanded=False):
                 st.caption(pipeline["summary"])
@@ -462,9 +740,39 @@ def render():
                 if pipeline.get("commands"):
                     st.markdown("**수동 실행**")
                     for command in pipeline["commands"]:
-                        render_etl_command(command)
+                        render_etl_command(command, pipeline["key"], latest_job_ids)
                         st.markdown("---")
 
+    with section("전체 ETL 일괄 실행"):
+        st.caption(
+            "docs/etl_planning.md 2.5 – 체크포인트: data/processed/state/orchestrator/<run_id>.json"
+        )
+        render_etl_command(
+            ORCHESTRATOR_COMMAND, ORCHESTRATOR_COMMAND["pipeline"], latest_job_ids
+        )
+
+    with section("ETL 작업 큐"):
+        st.caption(
+            "실행 버튼은 etl_job 큐에 작업만 넣고 바로 돌아옵니다. "
+            "워커(`python src/etl/job_runner.py`)가 파이프라인별 동시 실행 상한에 맞춰 가져가 실행하며, "
+            "로그는 data/logs/etl_jobs/ 에 저장됩니다."
+        )
+        render_job_queue()
+
+    with section("ETL 실행 기록"):
+        st.caption(
+            "src/etl/run_ledger.py 가 스크립트 단계마다 etl_run 테이블과 "
+            "data/logs/etl_runs.jsonl 에 남긴 소요 시간/처리량 기록입니다."
+        )
+        render_run_ledger()
+
+    with section("쿼리 성능"):
+        st.caption(
+            "queries.py 함수별 SQL 실행 시간(최근 500회 기준 백분위)과 느린 쿼리의 EXPLAIN 결과입니다. "
+            "대시보드 서버 프로세스 메모리에만 보관되며, 기준 시간은 DASHBOARD_SLOW_QUERY_MS 로 조정합니다."
+        )
+        render_query_stats()
+
     with section("운영 체크리스트"):
         st.markdown(
             "docs/etl_planning.md 3장에 정리된 추천 순서입니다. "
@@ -2,31 +2,63 @@
 
 from __future__ import annotations
 
-from datetime import date as DateType, datetime
+import re
+import sys
+from datetime import date as DateType, datetime, timedelta
 from dataclasses import dataclass
 from datetime import date
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
 
 import pandas as pd
 from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
 
-from db.connection import get_engine
+from db.connection import fallback_to_primary, get_backend, get_read_engine, get_write_engine
+from db.streaming import iter_dataframes
+from utils.profiler import instrument_queries
+from utils.query_stats import install_query_hooks
+
+# 쿼리 함수별 실행 시간/느린 쿼리 EXPLAIN 수집 (Admin 페이지 "쿼리 성능" 섹션)
+install_query_hooks()
 
 Params = Optional[Dict[str, Any]]
+T = TypeVar("T")
+
+
+def _run_read(run: Callable[[Engine], T], engine: Optional[Engine] = None) -> T:
+    """
+    engine 이 없으면 조회용 엔진으로 실행한다.
+    replica 접속 오류(OperationalError)면 primary 로 바꾸고 한 번만 다시 실행.
+    """
+    if engine is not None:
+        return run(engine)
+    engine = get_read_engine()
+    try:
+        return run(engine)
+    except OperationalError:
+        primary = fallback_to_primary(engine)
+        if primary is None:
+            raise
+        return run(primary)
+
 
+def _fetch_all(query: str, params: Params = None, engine: Optional[Engine] = None):
+    """SELECT 쿼리를 실행해 모든 행을 반환하는 공통 함수. (engine 기본값: 조회용 replica/스냅샷)"""
+    def run(eng: Engine):
+        with eng.connect() as conn:
+            return conn.execute(text(query), params or {}).fetchall()
 
-def _fetch_all(query: str, params: Params = None):
-    """SELECT 쿼리를 실행해 모든 행을 반환하는 공통 함수."""
-    engine = get_engine()
-    with engine.connect() as conn:
-        return conn.execute(text(query), params or {}).fetchall()
+    return _run_read(run, engine)
 
 
-def _fetch_one(query: str, params: Params = None):
+def _fetch_one(query: str, params: Params = None, engine: Optional[Engine] = None):
     """SELECT 쿼리를 실행해 단일 행을 반환한다."""
-    engine = get_engine()
-    with engine.connect() as conn:
-        return conn.execute(text(query), params or {}).fetchone()
+    def run(eng: Engine):
+        with eng.connect() as conn:
+            return conn.execute(text(query), params or {}).fetchone()
+
+    return _run_read(run, engine)
 
 
 def _fetch_value(query: str, params: Params = None):
@@ -40,10 +72,37 @@ def _fetch_value(query: str, params: Params = None):
         return row
 
 
-def _read_df(query: str, params: Params = None) -> pd.DataFrame:
+def _read_df(query: str, params: Params = None, engine: Optional[Engine] = None) -> pd.DataFrame:
     """pd.read_sql 호출을 공통화."""
-    engine = get_engine()
-    return pd.read_sql(text(query), engine, params=params)
+    return _run_read(lambda eng: pd.read_sql(text(query), eng, params=params), engine)
+
+
+def _iter_df(query: str, params: Params = None) -> Iterator[pd.DataFrame]:
+    """큰 RAW 조회를 서버 측 커서로 청크씩 읽는다. (집계만 할 때 전체 결과를 메모리에 올리지 않음)"""
+    return iter_dataframes(get_read_engine(), query, params)
+
+
+def _paginate(query: str, params: Dict[str, Any], limit: Optional[int], offset: int) -> str:
+    """limit 이 있으면 LIMIT/OFFSET 을 붙인다. (RAW 표 페이지 단위 조회)"""
+    if limit is None:
+        return query
+    params["limit"] = int(limit)
+    params["offset"] = int(offset)
+    return query + " LIMIT :limit OFFSET :offset"
+
+
+def _as_date(value: Any) -> Optional[DateType]:
+    """
+    MAX(month) / UNION 결과 등 집계 컬럼의 월 값을 date 로 맞춘다.
+    (SQLite 스냅샷은 집계 결과의 선언 타입이 사라져 'YYYY-MM-DD' 문자열로 돌아온다)
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    return value
 
 
 # -------------------------------------------------------
@@ -60,13 +119,8 @@ def get_latest_month_for_overview() -> Optional[DateType]:
     """
     latest = _fetch_value("SELECT MAX(month) AS latest_month FROM model_monthly_sales")
 
-    if latest is None:
-        return None
-
-    # datetime으로 들어오면 date만 추출
-    if isinstance(latest, datetime):
-        return latest.date()
-    return latest
+    # datetime / 문자열(SQLite 스냅샷)으로 들어오면 date로 맞춘다
+    return _as_date(latest)
 
 
 def get_brand_list() -> List[str]:
@@ -276,13 +330,15 @@ def get_latest_blog_month_for_model(model_id: int) -> Optional[date]:
     해당 모델에 대해 blog_token_monthly 기준으로 가장 최신 month 반환.
     블로그 데이터 없으면 None.
     """
-    return _fetch_value(
-        """
-        SELECT MAX(month) AS latest_month
-        FROM blog_token_monthly
-        WHERE model_id = :model_id
-        """,
-        {"model_id": model_id},
+    return _as_date(
+        _fetch_value(
+            """
+            SELECT MAX(month) AS latest_month
+            FROM blog_token_monthly
+            WHERE model_id = :model_id
+            """,
+            {"model_id": model_id},
+        )
     )
 
 
@@ -362,11 +418,34 @@ def get_blog_articles_for_model_month(
     )
 
 
-def load_interest_detail(month: DateType, brand_name: Optional[str]) -> pd.DataFrame:
+INTEREST_DETAIL_FROM = """
+    FROM model_monthly_interest_detail d
+    JOIN car_model c ON c.model_id = d.model_id
+    WHERE d.month = :month
+"""
+
+
+def _interest_detail_filter(month: DateType, brand_name: Optional[str]):
+    sql = INTEREST_DETAIL_FROM
+    params: Dict[str, Any] = {"month": month}
+    if brand_name is not None:
+        sql += " AND c.brand_name = :brand_name"
+        params["brand_name"] = brand_name
+    return sql, params
+
+
+def load_interest_detail(
+    month: DateType,
+    brand_name: Optional[str],
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> pd.DataFrame:
     """
     model_monthly_interest_detail 테이블에서
     해당 월(+제조사 필터)의 RAW 네이버 디테일 데이터를 불러온다.
+    limit 을 주면 offset 부터 limit 행만 (RAW 표 페이지 단위 조회)
     """
+    from_sql, params = _interest_detail_filter(month, brand_name)
     base_sql = """
         SELECT
             d.model_id,
@@ -376,28 +455,50 @@ def load_interest_detail(month: DateType, brand_name: Optional[str]) -> pd.DataF
             d.gender,
             d.age_group,
             d.ratio
-        FROM model_monthly_interest_detail d
-        JOIN car_model c ON c.model_id = d.model_id
-        WHERE d.month = :month
-    """
-    params = {"month": month}
-
-    if brand_name is not None:
-        base_sql += " AND c.brand_name = :brand_name"
-        params["brand_name"] = brand_name
-
-    base_sql += """
+    """ + from_sql + """
         ORDER BY
             c.brand_name,
             c.model_name_kr,
+            d.model_id,
             d.device,
             d.gender,
             d.age_group
     """
+    base_sql = _paginate(base_sql, params, limit, offset)
 
     return _read_df(base_sql, params=params)
 
 
+def count_interest_detail(month: DateType, brand_name: Optional[str]) -> int:
+    """load_interest_detail 의 전체 행 수 (페이지 수 계산용)"""
+    from_sql, params = _interest_detail_filter(month, brand_name)
+    return int(_fetch_value("SELECT COUNT(*)" + from_sql, params) or 0)
+
+
+def sum_interest_detail_by_segment(month: DateType, brand_name: Optional[str]) -> pd.DataFrame:
+    """
+    모델 × (device, gender) 별 ratio 합계.
+    연령대까지 들어간 RAW 행을 청크로 읽으며 부분합만 누적하므로,
+    메모리는 RAW 행 수가 아니라 (모델 × device × gender) 수에 비례한다.
+
+    columns: brand_name, model_name_kr, device, gender, ratio
+    """
+    keys = ["brand_name", "model_name_kr", "device", "gender"]
+    from_sql, params = _interest_detail_filter(month, brand_name)
+    sql = "SELECT c.brand_name, c.model_name_kr, d.device, d.gender, d.ratio" + from_sql
+
+    partials = [
+        chunk.assign(ratio=pd.to_numeric(chunk["ratio"], errors="coerce"))
+        .groupby(keys, as_index=False)["ratio"]
+        .sum()
+        for chunk in _iter_df(sql, params)
+    ]
+    totals = pd.concat(partials, ignore_index=True)
+    if totals.empty:
+        return pd.DataFrame(columns=keys + ["ratio"])
+    return totals.groupby(keys, as_index=False)["ratio"].sum()
+
+
 def get_monthly_sales_top_models(
     month: DateType,
     brand_name: Optional[str],
@@ -446,14 +547,33 @@ def get_monthly_sales_top_models(
     return _read_df(base_sql, params=params)
 
 
+MONTHLY_SALES_RAW_FROM = """
+    FROM model_monthly_sales ms
+    JOIN car_model c ON c.model_id = ms.model_id
+    WHERE ms.month = :month
+"""
+
+
+def _monthly_sales_raw_filter(month: DateType, brand_name: Optional[str]):
+    sql = MONTHLY_SALES_RAW_FROM
+    params: Dict[str, Any] = {"month": month}
+    if brand_name is not None:
+        sql += " AND c.brand_name = :brand_name"
+        params["brand_name"] = brand_name
+    return sql, params
+
+
 def get_monthly_sales_raw(
     month: DateType,
     brand_name: Optional[str],
+    limit: Optional[int] = None,
+    offset: int = 0,
 ) -> pd.DataFrame:
     """
     해당 월 전체 모델의 판매/보급률 RAW 데이터 조회.
-    (테이블 아래쪽에 그대로 깔아줄 용도)
+    (테이블 아래쪽에 그대로 깔아줄 용도, limit 을 주면 offset 부터 limit 행만)
     """
+    from_sql, params = _monthly_sales_raw_filter(month, brand_name)
     base_sql = """
         SELECT
             ms.model_id,
@@ -464,26 +584,23 @@ def get_monthly_sales_raw(
             ms.market_total_units,
             ms.adoption_rate,
             ms.source
-        FROM model_monthly_sales ms
-        JOIN car_model c ON c.model_id = ms.model_id
-        WHERE ms.month = :month
-    """
-
-    params = {"month": month}
-
-    if brand_name is not None:
-        base_sql += " AND c.brand_name = :brand_name"
-        params["brand_name"] = brand_name
-
-    base_sql += """
+    """ + from_sql + """
         ORDER BY
             c.brand_name,
-            ms.sales_units DESC
+            ms.sales_units DESC,
+            ms.model_id
     """
+    base_sql = _paginate(base_sql, params, limit, offset)
 
     return _read_df(base_sql, params=params)
 
 
+def count_monthly_sales_raw(month: DateType, brand_name: Optional[str]) -> int:
+    """get_monthly_sales_raw 의 전체 행 수 (페이지 수 계산용)"""
+    from_sql, params = _monthly_sales_raw_filter(month, brand_name)
+    return int(_fetch_value("SELECT COUNT(*)" + from_sql, params) or 0)
+
+
 def get_models_by_brand(brand_name: str) -> pd.DataFrame:
     """
     특정 브랜드의 모델 목록을 반환.
@@ -558,6 +675,35 @@ def get_model_blog_tokens(model_id: int, month: DateType) -> pd.DataFrame:
     return _read_df(sql, params={"model_id": model_id, "month": month})
 
 
+def get_model_trending_keywords(
+    model_id: int, month: DateType, limit: int = 10
+) -> pd.DataFrame:
+    """
+    blog_token_trend에서 특정 모델/월의 급상승(up)·급하락(down) 키워드 조회.
+    (compute_token_trends.py 가 미리 계산해 둔 결과를 순위대로 그대로 읽는다)
+    """
+    sql = """
+        SELECT
+            direction,
+            trend_rank,
+            token,
+            curr_count,
+            prev_count,
+            trailing_avg,
+            mom_lift,
+            trailing_lift,
+            trend_score
+        FROM blog_token_trend
+        WHERE model_id = :model_id
+          AND month = :month
+          AND trend_rank <= :limit
+        ORDER BY direction DESC, trend_rank ASC
+        """
+    return _read_df(
+        sql, params={"model_id": model_id, "month": month, "limit": int(limit)}
+    )
+
+
 def get_model_blog_articles(model_id: int, month: DateType) -> pd.DataFrame:
     """
     blog_article에서 특정 모델/월의 상위 3개 글 조회.
@@ -601,6 +747,150 @@ def get_model_wordcloud_path(model_id: int, month: DateType) -> Optional[str]:
         return row[0]
 
 
+# 불리언 모드에서 연산자로 해석되는 문자
+_FULLTEXT_OPERATORS = re.compile(r'[+\-<>()~*"@]')
+
+
+def _build_boolean_query(term: str) -> str:
+    """
+    검색어 → MATCH ... AGAINST 불리언 모드 질의문.
+    공백으로 나눈 단어마다 +"단어" (모두 포함, 단어 내부는 ngram 구문 일치)
+    """
+    words = [w for w in _FULLTEXT_OPERATORS.sub(" ", term).split() if len(w) >= 2]
+    return " ".join(f'+"{w}"' for w in words)
+
+
+def _article_filters(
+    params: Dict[str, Any], model_id: Optional[int], months: Optional[List[DateType]]
+) -> List[str]:
+    """blog_article 검색 공통 조건 (모델 / 월). params 에 바인딩 값을 채운다."""
+    where: List[str] = []
+    if model_id is not None:
+        where.append("a.model_id = :model_id")
+        params["model_id"] = int(model_id)
+    if months:
+        names = []
+        for i, m in enumerate(months):
+            params[f"m{i}"] = m
+            names.append(f":m{i}")
+        where.append(f"a.month IN ({', '.join(names)})")
+    return where
+
+
+def search_blog_articles(
+    term: str,
+    model_id: Optional[int] = None,
+    months: Optional[List[DateType]] = None,
+    limit: int = 30,
+) -> pd.DataFrame:
+    """
+    blog_article 본문/제목 키워드 검색 (FULLTEXT ngram 인덱스, 관련도 순).
+
+    - term: 검색어 (공백 구분 단어는 모두 포함해야 매칭, 2글자 이상만 사용)
+    - model_id: 지정하면 해당 모델 글만
+    - months: 지정하면 해당 월(YYYY-MM-01) 글만
+    - snippet: 본문에서 첫 단어가 처음 나오는 위치 주변 200자
+    - 임베디드 스냅샷(SQLite/DuckDB)에는 FULLTEXT 가 없어 LIKE 검색으로 대체
+    """
+    columns = [
+        "article_id",
+        "model_id",
+        "brand_name",
+        "model_name_kr",
+        "month",
+        "title",
+        "url",
+        "snippet",
+        "score",
+    ]
+    query = _build_boolean_query(term or "")
+    if not query:
+        return pd.DataFrame(columns=columns)
+    if get_backend() != "mysql":
+        words = query.split('"')[1::2]
+        return _search_blog_articles_like(words, model_id, months, limit, columns)
+
+    first_word = query.split('"')[1]
+    params: Dict[str, Any] = {"q": query, "first": first_word, "limit": int(limit)}
+    where = ["MATCH (a.title, a.content_plain) AGAINST (:q IN BOOLEAN MODE)"]
+    where += _article_filters(params, model_id, months)
+
+    sql = f"""
+        SELECT
+            a.article_id,
+            a.model_id,
+            cm.brand_name,
+            cm.model_name_kr,
+            a.month,
+            a.title,
+            a.url,
+            SUBSTRING(
+                a.content_plain,
+                GREATEST(LOCATE(:first, a.content_plain) - 60, 1),
+                200
+            ) AS snippet,
+            MATCH (a.title, a.content_plain) AGAINST (:q IN BOOLEAN MODE) AS score
+        FROM blog_article a
+        JOIN car_model cm
+          ON cm.model_id = a.model_id
+        WHERE {" AND ".join(where)}
+        ORDER BY score DESC, a.month DESC, a.search_rank ASC
+        LIMIT :limit
+    """
+    rows = _fetch_all(sql, params)
+    return pd.DataFrame(rows, columns=columns)
+
+
+def _search_blog_articles_like(
+    words: List[str],
+    model_id: Optional[int],
+    months: Optional[List[DateType]],
+    limit: int,
+    columns: List[str],
+) -> pd.DataFrame:
+    """
+    search_blog_articles 의 LIKE 버전. 단어마다 제목 일치 2점 + 본문 일치 1점으로 점수를 매기고,
+    snippet 은 MySQL 버전과 같은 위치(첫 단어 앞 60자부터 200자)를 파이썬에서 자른다.
+    """
+    params: Dict[str, Any] = {"limit": int(limit)}
+    where: List[str] = []
+    score: List[str] = []
+    for i, word in enumerate(words):
+        params[f"w{i}"] = f"%{word}%"
+        where.append(f"(a.title LIKE :w{i} OR a.content_plain LIKE :w{i})")
+        score.append(
+            f"(CASE WHEN a.title LIKE :w{i} THEN 2 ELSE 0 END)"
+            f" + (CASE WHEN a.content_plain LIKE :w{i} THEN 1 ELSE 0 END)"
+        )
+    where += _article_filters(params, model_id, months)
+
+    sql = f"""
+        SELECT
+            a.article_id,
+            a.model_id,
+            cm.brand_name,
+            cm.model_name_kr,
+            a.month,
+            a.title,
+            a.url,
+            a.content_plain,
+            {" + ".join(score)} AS score
+        FROM blog_article a
+        JOIN car_model cm
+          ON cm.model_id = a.model_id
+        WHERE {" AND ".join(where)}
+        ORDER BY score DESC, a.month DESC, a.search_rank ASC
+        LIMIT :limit
+    """
+    rows = _fetch_all(sql, params)
+    df = pd.DataFrame(rows, columns=columns[:-2] + ["content_plain", "score"])
+    df["snippet"] = [
+        content[max(content.find(words[0]) - 60, 0) :][:200] if content else content
+        for content in df["content_plain"]
+    ]
+    return df[columns]
+
+
 # ================================
 #  블로그 글 3개 조회
 # ================================
@@ -660,7 +950,7 @@ def get_position_months() -> List[date]:
         """
     )
 
-    return [row[0] for row in rows]
+    return [_as_date(row[0]) for row in rows]
 
 def get_model_position_map(month: date) -> pd.DataFrame:
     """
@@ -745,6 +1035,8 @@ def get_admin_table_counts() -> pd.DataFrame:
         SELECT 'blog_token_monthly', COUNT(*) FROM blog_token_monthly
         UNION ALL
         SELECT 'blog_wordcloud', COUNT(*) FROM blog_wordcloud
+        UNION ALL
+        SELECT 'blog_token_trend', COUNT(*) FROM blog_token_trend
         """
     )
     return pd.DataFrame(rows, columns=["table_name", "cnt"])
@@ -765,6 +1057,132 @@ def get_admin_latest_months() -> pd.DataFrame:
         SELECT 'blog_token_monthly', MAX(month) FROM blog_token_monthly
         UNION ALL
         SELECT 'blog_wordcloud', MAX(month) FROM blog_wordcloud
+        UNION ALL
+        SELECT 'blog_token_trend', MAX(month) FROM blog_token_trend
         """
     )
     return pd.DataFrame(rows, columns=["dataset", "latest_month"])
+
+
+# -------------------------------------------------------
+# Admin: ETL 작업 큐 (etl_job)
+#   작업 등록/취소가 primary 에 쓰므로 상태도 primary 에서 읽는다.
+#   (replica 지연이나 스냅샷 백엔드에서 방금 등록한 작업이 안 보이는 문제 방지)
+# -------------------------------------------------------
+
+
+def get_etl_jobs(limit: int = 30) -> pd.DataFrame:
+    """최근 ETL 작업 목록 (job_id 내림차순)."""
+    return _read_df(
+        """
+        SELECT
+            job_id,
+            pipeline,
+            command_key,
+            status,
+            cancel_requested,
+            requested_by,
+            worker,
+            returncode,
+            created_at,
+            started_at,
+            finished_at,
+            duration_sec,
+            log_path,
+            script,
+            args_json
+        FROM etl_job
+        ORDER BY job_id DESC
+        LIMIT :limit
+        """,
+        {"limit": int(limit)},
+        engine=get_write_engine(),
+    )
+
+
+def get_latest_etl_job_ids() -> Dict[str, int]:
+    """명령(command_key)별 마지막 작업 id. (관리자 페이지 명령마다 따로 조회하지 않도록 한 번에)"""
+    rows = _fetch_all(
+        "SELECT command_key, MAX(job_id) FROM etl_job GROUP BY command_key",
+        engine=get_write_engine(),
+    )
+    return {command_key: int(job_id) for command_key, job_id in rows}
+
+
+def get_etl_job(job_id: int) -> Optional[Dict[str, Any]]:
+    """작업 한 건 (상태 폴링용)."""
+    row = _fetch_one(
+        """
+        SELECT
+            job_id, pipeline, command_key, status, cancel_requested,
+            worker, returncode, created_at, started_at, finished_at,
+            duration_sec, log_path, script, args_json
+        FROM etl_job
+        WHERE job_id = :job_id
+        """,
+        {"job_id": int(job_id)},
+        engine=get_write_engine(),
+    )
+    return dict(row._mapping) if row is not None else None
+
+
+def get_etl_job_status_counts() -> Dict[str, int]:
+    """status 별 작업 수 (queued/running 현황 표시용)."""
+    rows = _fetch_all(
+        "SELECT status, COUNT(*) FROM etl_job GROUP BY status", engine=get_write_engine()
+    )
+    return {status: int(cnt) for status, cnt in rows}
+
+
+# -------------------------------------------------------
+# Admin: ETL 실행 기록 (etl_run) - RunLedger 가 primary 에 기록하므로 primary 에서 읽는다.
+# -------------------------------------------------------
+
+
+def get_etl_run_scripts() -> List[str]:
+    """실행 기록이 있는 스크립트 목록."""
+    rows = _fetch_all(
+        "SELECT DISTINCT script FROM etl_run ORDER BY script", engine=get_write_engine()
+    )
+    return [r[0] for r in rows]
+
+
+def get_etl_runs(script: Optional[str] = None, days: int = 90, limit: int = 2000) -> pd.DataFrame:
+    """최근 days 일의 단계별 실행 기록 (최근 limit 건, started_at 오름차순으로 정렬해 반환)."""
+    where = "AND script = :script" if script else ""
+    df = _read_df(
+        f"""
+        SELECT
+            run_uuid,
+            run_id,
+            job_id,
+            script,
+            stage,
+            status,
+            started_at,
+            duration_sec,
+            rows_read,
+            rows_written,
+            rows_skipped,
+            api_calls,
+            bytes,
+            errors,
+            rows_per_sec
+        FROM etl_run
+        WHERE started_at >= :since
+          {where}
+        ORDER BY started_at DESC
+        LIMIT :limit
+        """,
+        {
+            "since": datetime.now() - timedelta(days=int(days)),
+            "script": script,
+            "limit": int(limit),
+        },
+        engine=get_write_engine(),
+    )
+    return df.sort_values("started_at").reset_index(drop=True)
+
+
+# 프로파일링 모드(?profile=1)에서 페이지 워터폴에 queries.* 호출 시간을 표시
+instrument_queries(sys.modules[__name__])
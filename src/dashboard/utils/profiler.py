@@ -0,0 +1,202 @@
+# src/dashboard/utils/profiler.py
+
+from __future__ import annotations
+
+import cProfile
+import functools
+import os
+import pathlib
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import ModuleType
+from typing import Iterator, List, Optional
+
+import pandas as pd
+import streamlit as st
+
+# 프로젝트 루트: .../src/dashboard/utils/profiler.py 기준 3단계 위
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[3]
+PROFILE_DIR = PROJECT_ROOT / "data" / "profiles"
+
+# 환경 변수 또는 ?profile=... 쿼리 파라미터로 켠다.
+#   1 / true  : 구간 타이머 + 워터폴만
+#   cprofile  : + cProfile 결과(.prof) 저장
+#   pyinstrument : + pyinstrument HTML 저장 (설치된 경우)
+PROFILE_ENV = "DASHBOARD_PROFILE"
+PROFILE_PARAM = "profile"
+DUMP_MODES = ("cprofile", "pyinstrument")
+
+_local = threading.local()
+
+
+@dataclass
+class Span:
+    label: str
+    kind: str
+    depth: int
+    start_ms: float
+    duration_ms: float = 0.0
+
+
+@dataclass
+class RerunProfile:
+    page: str
+    mode: str
+    started: float = field(default_factory=time.perf_counter)
+    spans: List[Span] = field(default_factory=list)
+    depth: int = 0
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            [
+                {
+                    "label": s.label,
+                    "kind": s.kind,
+                    "depth": s.depth,
+                    "start_ms": round(s.start_ms, 1),
+                    "duration_ms": round(s.duration_ms, 1),
+                }
+                for s in self.spans
+            ],
+            columns=["label", "kind", "depth", "start_ms", "duration_ms"],
+        )
+
+
+def _profile_mode() -> Optional[str]:
+    """프로파일링 모드. 꺼져 있으면 None."""
+    value = ""
+    try:
+        value = st.query_params.get(PROFILE_PARAM, "")
+    except Exception:
+        pass
+    value = (value or os.getenv(PROFILE_ENV, "")).strip().lower()
+    if value in ("", "0", "false", "off"):
+        return None
+    return value if value in DUMP_MODES else "timer"
+
+
+def _current() -> Optional[RerunProfile]:
+    return getattr(_local, "profile", None)
+
+
+@contextmanager
+def timed(label: str, kind: str = "block") -> Iterator[None]:
+    """현재 rerun 을 프로파일링 중일 때만 구간 시간을 기록한다. (아니면 아무것도 안 함)"""
+    profile = _current()
+    if profile is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    span = Span(label, kind, profile.depth, (start - profile.started) * 1000)
+    profile.spans.append(span)
+    profile.depth += 1
+    try:
+        yield
+    finally:
+        profile.depth -= 1
+        span.duration_ms = (time.perf_counter() - start) * 1000
+
+
+def instrument_queries(module: ModuleType) -> None:
+    """
+    module 의 공개 함수(queries.get_* 등)를 timed 로 감싼다.
+    프로파일링이 꺼져 있으면 _current() 확인 한 번만 추가된다.
+    """
+    for name, func in list(vars(module).items()):
+        if name.startswith("_") or not callable(func) or isinstance(func, type):
+            continue
+        if getattr(func, "__module__", None) != module.__name__:
+            continue
+
+        def make_wrapper(f, label):
+            @functools.wraps(f)
+            def wrapper(*args, **kwargs):
+                if _current() is None:
+                    return f(*args, **kwargs)
+                with timed(label, "query"):
+                    return f(*args, **kwargs)
+
+            return wrapper
+
+        setattr(module, name, make_wrapper(func, f"queries.{name}"))
+
+
+def _dump_path(page: str, suffix: str) -> pathlib.Path:
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    return PROFILE_DIR / f"{page}_{stamp}.{suffix}"
+
+
+@contextmanager
+def profile_page(page: str) -> Iterator[None]:
+    """
+    페이지 render() 전체를 감싼다.
+    프로파일링 모드일 때 구간(section / queries.* / 이미지) 타이머를 켜고,
+    rerun 이 끝나면 페이지 하단에 워터폴을 그린다.
+    """
+    mode = _profile_mode()
+    if mode is None:
+        yield
+        return
+
+    profile = RerunProfile(page=page, mode=mode)
+    _local.profile = profile
+
+    profiler = None
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+    elif mode == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            print("[WARN] pyinstrument 가 설치되어 있지 않아 타이머만 기록합니다.")
+        else:
+            profiler = Profiler()
+            profiler.start()
+
+    try:
+        with timed(f"page: {page}", "page"):
+            yield
+    finally:
+        _local.profile = None
+        dump_path = None
+        if isinstance(profiler, cProfile.Profile):
+            profiler.disable()
+            dump_path = _dump_path(page, "prof")
+            profiler.dump_stats(str(dump_path))
+        elif profiler is not None:
+            profiler.stop()
+            dump_path = _dump_path(page, "html")
+            dump_path.write_text(profiler.output_html(), encoding="utf-8")
+        render_profile(profile, dump_path)
+
+
+def render_profile(profile: RerunProfile, dump_path: Optional[pathlib.Path] = None) -> None:
+    from components.charts import build_profile_waterfall
+
+    df = profile.to_frame()
+    total = df["duration_ms"].iloc[0] if not df.empty else 0.0
+    with st.expander(f"⏱ 렌더 프로파일 – {profile.page} ({total:,.0f}ms)", expanded=True):
+        if df.empty:
+            st.caption("기록된 구간이 없습니다.")
+            return
+        st.plotly_chart(build_profile_waterfall(df), width="stretch")
+
+        by_kind = (
+            df[df["kind"] != "page"]
+            .groupby("kind")["duration_ms"]
+            .agg(["count", "sum"])
+            .round(1)
+            .reset_index()
+        )
+        st.dataframe(by_kind, width="stretch", hide_index=True)
+        st.dataframe(
+            df.sort_values("duration_ms", ascending=False), width="stretch", hide_index=True
+        )
+        if dump_path is not None:
+            st.caption(f"프로파일 저장: {dump_path}")
@@ -0,0 +1,183 @@
+# src/dashboard/utils/query_stats.py
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+import pandas as pd
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 이 시간(ms)을 넘긴 SELECT 는 느린 쿼리로 기록하고 EXPLAIN 을 함께 남긴다.
+SLOW_QUERY_MS = float(os.getenv("DASHBOARD_SLOW_QUERY_MS", "500"))
+
+# 함수별로 최근 몇 개의 실행 시간을 유지할지 (백분위 계산 창)
+LATENCY_WINDOW = 500
+SLOW_LOG_SIZE = 50
+
+# 호출 함수 추적 시 건너뛸 모듈 (DB 드라이버/라이브러리 내부 프레임)
+_SKIP_MODULES = (
+    "sqlalchemy", "pandas", "pymysql", "duckdb_engine", "utils.query_stats", "contextlib",
+)
+
+# duckdb(스냅샷/parquet)는 제외: duckdb_engine 의 커서는 연결 하나를 공유해서
+# EXPLAIN 을 돌리면 아직 읽지 않은 SELECT 결과가 EXPLAIN 결과로 바뀐다 (느린 쿼리 기록만 남김)
+EXPLAIN_PREFIX = {"mysql": "EXPLAIN ", "sqlite": "EXPLAIN QUERY PLAN "}
+
+_lock = threading.Lock()
+_latencies: Dict[str, Deque[float]] = {}
+_totals: Dict[str, Dict[str, float]] = {}
+_slow_log: Deque[Dict[str, Any]] = deque(maxlen=SLOW_LOG_SIZE)
+_plans: Dict[str, Optional[pd.DataFrame]] = {}
+_installed = False
+
+
+def _caller_name() -> str:
+    """
+    쿼리를 실행한 dashboard 함수 이름.
+    queries.py 의 공통 헬퍼(_fetch_all 등)와 라이브러리 프레임은 건너뛴다.
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        func = frame.f_code.co_name
+        if not module.startswith(_SKIP_MODULES) and not func.startswith(("_", "<")):
+            return func if module == "queries" else f"{module}.{func}"
+        frame = frame.f_back
+    return "(unknown)"
+
+
+def _capture_plan(cursor, statement: str, parameters, dialect: str) -> Optional[pd.DataFrame]:
+    """
+    같은 DB 연결에서 별도 커서로 EXPLAIN 실행.
+    (SQLAlchemy 이벤트를 다시 타지 않도록 DBAPI 커서를 직접 사용)
+    """
+    prefix = EXPLAIN_PREFIX.get(dialect)
+    if prefix is None:
+        return None
+    try:
+        explain_cursor = cursor.connection.cursor()
+        try:
+            explain_cursor.execute(prefix + statement, parameters)
+            cols = [d[0] for d in explain_cursor.description]
+            return pd.DataFrame(list(explain_cursor.fetchall()), columns=cols)
+        finally:
+            explain_cursor.close()
+    except Exception as e:
+        print(f"[WARN] EXPLAIN 실패: {e}")
+        return None
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("query_start")
+    if not starts:
+        return
+    elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+    func = _caller_name()
+    rows = cursor.rowcount if cursor.rowcount is not None and cursor.rowcount >= 0 else 0
+
+    with _lock:
+        _latencies.setdefault(func, deque(maxlen=LATENCY_WINDOW)).append(elapsed_ms)
+        total = _totals.setdefault(func, {"calls": 0, "rows": 0, "total_ms": 0.0})
+        total["calls"] += 1
+        total["rows"] += rows
+        total["total_ms"] += elapsed_ms
+
+    if elapsed_ms < SLOW_QUERY_MS or executemany:
+        return
+    if not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+        return
+
+    # 같은 SQL 문은 처음 느렸을 때 한 번만 EXPLAIN
+    # 서버 측 커서(stream_results, MySQL SSCursor)는 결과를 다 읽기 전까지 연결을 잡고 있어
+    # 같은 연결에서 EXPLAIN 을 돌리면 남은 결과가 버려진다 → 느린 쿼리 기록만 남긴다.
+    key = " ".join(statement.split())
+    streaming = context is not None and context.execution_options.get("stream_results", False)
+    with _lock:
+        need_plan = key not in _plans and not streaming
+    plan = (
+        _capture_plan(cursor, statement, parameters, conn.dialect.name) if need_plan else None
+    )
+    with _lock:
+        if need_plan:
+            _plans[key] = plan
+        _slow_log.append(
+            {
+                "at": datetime.now(),
+                "function": func,
+                "elapsed_ms": round(elapsed_ms, 1),
+                "rows": rows,
+                "statement": key,
+                "parameters": repr(parameters)[:500],
+            }
+        )
+
+
+def install_query_hooks() -> None:
+    """모든 Engine 에 쿼리 시간 측정 이벤트를 건다. (여러 번 호출해도 한 번만 등록)"""
+    global _installed
+    if _installed:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    _installed = True
+
+
+def get_latency_stats() -> pd.DataFrame:
+    """함수별 호출 수 / 평균 반환 행 수 / 최근 LATENCY_WINDOW 회 기준 p50·p95·p99 (ms)."""
+    with _lock:
+        snapshot = {func: list(values) for func, values in _latencies.items()}
+        totals = {func: dict(t) for func, t in _totals.items()}
+
+    rows = []
+    for func, values in snapshot.items():
+        s = pd.Series(values)
+        t = totals[func]
+        rows.append(
+            {
+                "function": func,
+                "calls": int(t["calls"]),
+                "avg_rows": round(t["rows"] / t["calls"], 1),
+                "total_ms": round(t["total_ms"], 1),
+                "p50_ms": round(s.quantile(0.5), 1),
+                "p95_ms": round(s.quantile(0.95), 1),
+                "p99_ms": round(s.quantile(0.99), 1),
+                "max_ms": round(s.max(), 1),
+            }
+        )
+    if not rows:
+        return pd.DataFrame(
+            columns=[
+                "function", "calls", "avg_rows", "total_ms",
+                "p50_ms", "p95_ms", "p99_ms", "max_ms",
+            ]
+        )
+    return pd.DataFrame(rows).sort_values("p95_ms", ascending=False).reset_index(drop=True)
+
+
+def get_slow_queries(top_n: int = 20) -> List[Dict[str, Any]]:
+    """느린 쿼리 기록 (느린 순). 각 항목에 EXPLAIN 결과(plan)를 붙여 반환."""
+    with _lock:
+        entries = [dict(e) for e in _slow_log]
+        for e in entries:
+            e["plan"] = _plans.get(e["statement"])
+    entries.sort(key=lambda e: e["elapsed_ms"], reverse=True)
+    return entries[:top_n]
+
+
+def reset_query_stats() -> None:
+    with _lock:
+        _latencies.clear()
+        _totals.clear()
+        _slow_log.clear()
+        _plans.clear()
@@ -1,10 +1,43 @@
 # src/db/connection.py
+import datetime
 import os
+import sqlite3
+import threading
+import time
 from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SNAPSHOT_DIR = PROJECT_ROOT / "data" / "snapshot"
+
+# DB_BACKEND 별 기본 스냅샷 파일 (DB_SNAPSHOT_PATH 로 변경 가능)
+SNAPSHOT_FILES = {
+    "sqlite": "car_trend.sqlite",
+    "duckdb": "car_trend.duckdb",
+}
+# parquet: export_snapshot.py 가 만든 세대별 Parquet 스냅샷을 DuckDB 뷰로 읽는다.
+BACKENDS = ("mysql", *SNAPSHOT_FILES, "parquet")
+
+# replica 접속 실패로 primary 를 쓰는 중이면 이 시간(초) 뒤에 replica 를 다시 시도
+REPLICA_RETRY_SEC = 60
+# replica 접속 대기 시간(초). 죽은 replica 에 막혀 조회가 오래 멈추지 않게 짧게 둔다.
+REPLICA_CONNECT_TIMEOUT_SEC = 3
+POOL_RECYCLE_SEC = 3600
+
+_parquet_engines: Dict[str, Engine] = {}
+# 체크섬 확인에 실패한 세대 (LATEST 가 바뀔 때까지 다시 검증하지 않음)
+_bad_generations: Set[str] = set()
+_parquet_lock = threading.Lock()
+
+# get_read_engine / get_write_engine 캐시: (역할, URL, pid) → Engine
+# pid 를 키에 넣어 fork 된 워커 프로세스가 부모의 커넥션 풀을 공유하지 않게 한다.
+_engines: Dict[Tuple[str, str, int], Engine] = {}
+_replica_failed_at: Dict[Tuple[str, str, int], float] = {}
+_engines_lock = threading.Lock()
 
 
 def load_env():
@@ -24,24 +57,336 @@ def load_env():
         pass
 
 
-def get_engine(echo: bool = False) -> Engine:
+def get_backend() -> str:
     """
-    SQLAlchemy Engine 생성
+    현재 DB 백엔드 이름 (mysql / sqlite / duckdb / parquet).
+    DB_URL 이 있으면 URL 의 드라이버, 없으면 DB_BACKEND (default: mysql).
+    """
+    load_env()
+    url = os.getenv("DB_URL")
+    if url:
+        return make_url(url).get_backend_name()
+    backend = os.getenv("DB_BACKEND", "mysql").strip().lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"지원하지 않는 DB_BACKEND: {backend} ({', '.join(BACKENDS)})")
+    return backend
+
+
+def get_mysql_url(
+    host: Optional[str] = None,
+    port: Optional[str] = None,
+    user: Optional[str] = None,
+    password: Optional[str] = None,
+) -> str:
+    """
+    .env 의 DB_USER / DB_PASSWORD / DB_HOST / DB_PORT / DB_NAME 으로 만든 MySQL URL.
+    인자를 넘기면 해당 값만 바꾼다. (replica 접속용)
     """
     load_env()
 
-    user = os.getenv("DB_USER", "root")
-    password = os.getenv("DB_PASSWORD", "")
-    host = os.getenv("DB_HOST", "127.0.0.1")
-    port = os.getenv("DB_PORT", "3306")
+    user = user or os.getenv("DB_USER", "root")
+    password = password if password is not None else os.getenv("DB_PASSWORD", "")
+    host = host or os.getenv("DB_HOST", "127.0.0.1")
+    port = port or os.getenv("DB_PORT", "3306")
     db_name = os.getenv("DB_NAME", "car_trend")
 
     # mysql+pymysql URL 구성
-    url = f"mysql+pymysql://{user}:{password}@{host}:{port}/{db_name}?charset=utf8mb4"
+    return f"mysql+pymysql://{user}:{password}@{host}:{port}/{db_name}?charset=utf8mb4"
+
+
+def get_replica_url() -> Optional[str]:
+    """
+    조회 전용 replica URL.
+    DB_READ_URL 이 있으면 그대로, 없으면 DB_READ_HOST (+ DB_READ_PORT / DB_READ_USER / DB_READ_PASSWORD)
+    로 만든다. 둘 다 없으면 None (primary 사용).
+    """
+    load_env()
+    url = os.getenv("DB_READ_URL")
+    if url:
+        return url
+    host = os.getenv("DB_READ_HOST")
+    if not host:
+        return None
+    return get_mysql_url(
+        host=host,
+        port=os.getenv("DB_READ_PORT"),
+        user=os.getenv("DB_READ_USER"),
+        password=os.getenv("DB_READ_PASSWORD"),
+    )
+
+
+def get_snapshot_path(backend: str) -> Path:
+    """임베디드 백엔드가 읽는 스냅샷 파일 경로."""
+    load_env()
+    path = os.getenv("DB_SNAPSHOT_PATH")
+    return Path(path) if path else SNAPSHOT_DIR / SNAPSHOT_FILES[backend]
+
+
+def register_sqlite_types() -> None:
+    """
+    스냅샷의 DATE / DATETIME 컬럼을 MySQL 과 같은 date / datetime 객체로 돌려받는다.
+    (sqlite3 기본 변환기는 3.12 부터 deprecated 라 직접 등록)
+    """
+    sqlite3.register_adapter(datetime.date, lambda d: d.isoformat())
+    sqlite3.register_adapter(datetime.datetime, lambda d: d.isoformat(" "))
+    sqlite3.register_converter("DATE", lambda b: datetime.date.fromisoformat(b.decode()))
+    for decl in ("DATETIME", "TIMESTAMP"):
+        sqlite3.register_converter(
+            decl, lambda b: datetime.datetime.fromisoformat(b.decode())
+        )
+
+
+def _parquet_engine(echo: bool = False) -> Engine:
+    """
+    LATEST 세대의 Parquet 파일을 뷰로 건 DuckDB(in-memory) 엔진.
+    세대별로 한 번만 만들어 재사용하고, LATEST 가 바뀌면 체크섬 확인 후 새 세대로 교체한다.
+    (체크섬이 맞지 않으면 그 세대를 기억해 두고 이전 세대를 계속 사용)
+    """
+    from .snapshot import latest_generation, table_paths, verify_generation
+
+    gen_id = latest_generation()
+    if gen_id is None:
+        raise FileNotFoundError(
+            "Parquet 스냅샷이 없습니다. python -m src.db.export_snapshot --backend parquet 로 먼저 생성하세요."
+        )
+
+    with _parquet_lock:
+        engine = _parquet_engines.get(gen_id)
+        if engine is not None:
+            return engine
+        if gen_id in _bad_generations and _parquet_engines:
+            return next(iter(_parquet_engines.values()))
+
+        try:
+            paths = table_paths(gen_id, verify_generation(gen_id))
+        except (OSError, ValueError) as e:
+            if not _parquet_engines:
+                raise
+            _bad_generations.add(gen_id)
+            print(f"[WARN] 스냅샷 세대 {gen_id} 를 사용할 수 없어 이전 세대를 유지합니다: {e}")
+            return next(iter(_parquet_engines.values()))
+
+        engine = create_engine("duckdb:///:memory:", echo=echo, future=True)
+
+        # DuckDB 는 Parquet 을 필요한 컬럼/row group 만 읽는다. 연결마다 뷰를 건다.
+        @event.listens_for(engine, "connect")
+        def _create_views(dbapi_conn, _record):
+            for table, path in paths.items():
+                dbapi_conn.execute(
+                    f"CREATE VIEW {table} AS SELECT * FROM read_parquet('{path.as_posix()}')"
+                )
+
+        for old in _parquet_engines.values():
+            old.dispose()
+        _parquet_engines.clear()
+        _parquet_engines[gen_id] = engine
+        print(f"[INFO] 대시보드 스냅샷 세대 로드: {gen_id}")
+        return engine
+
+
+def _engine_args(backend: str) -> Tuple[str, Dict[str, Any]]:
+    """백엔드별 접속 URL 과 DBAPI connect_args. (DB_URL 이 있으면 그 URL)"""
+    url = os.getenv("DB_URL")
+    connect_args: Dict[str, Any] = {}
+
+    if backend == "sqlite":
+        register_sqlite_types()
+        connect_args["detect_types"] = sqlite3.PARSE_DECLTYPES
+        connect_args["check_same_thread"] = False
+        if not url:
+            path = get_snapshot_path(backend)
+            url = f"sqlite:///file:{path}?mode=ro&uri=true"
+    elif backend == "duckdb":
+        if not url:
+            url = f"duckdb:///{get_snapshot_path(backend)}"
+            connect_args["read_only"] = True
+    elif not url:
+        url = get_mysql_url()
+    return url, connect_args
+
 
+def get_engine(echo: bool = False) -> Engine:
+    """
+    SQLAlchemy Engine 생성
+
+    - DB_URL 이 있으면 그대로 사용 (예: sqlite:///data/snapshot/car_trend.sqlite)
+    - DB_BACKEND=mysql (기본): .env 의 MySQL 접속 정보
+    - DB_BACKEND=sqlite / duckdb: export_snapshot.py 로 만든 스냅샷 파일을 읽기 전용으로 연다.
+      (duckdb 는 duckdb-engine 패키지 필요)
+    - DB_BACKEND=parquet: 최신 Parquet 세대를 DuckDB 로 읽는다. (세대가 바뀔 때까지 같은 엔진)
+
+    호출할 때마다 새 엔진을 만든다. 대시보드 조회는 get_read_engine, ETL 적재는 get_write_engine 사용.
+    """
+    backend = get_backend()
+    if backend == "parquet" and not os.getenv("DB_URL"):
+        return _parquet_engine(echo)
+
+    url, connect_args = _engine_args(backend)
     engine = create_engine(
         url,
         echo=echo,       # True로 두면 실행되는 SQL 출력
         future=True,     # SQLAlchemy 2.x 스타일
+        connect_args=connect_args,
+    )
+    return engine
+
+
+def _set_session_read_only(dbapi_conn, _record) -> None:
+    cursor = dbapi_conn.cursor()
+    try:
+        cursor.execute("SET SESSION TRANSACTION READ ONLY")
+    finally:
+        cursor.close()
+
+
+def _create_read_engine(
+    url: str, check: bool, connect_timeout: Optional[int] = None
+) -> Engine:
+    """READ ONLY 세션 MySQL 엔진. check=True 면 바로 접속해 보고 실패 시 예외."""
+    connect_args: Dict[str, Any] = {}
+    if connect_timeout is not None:
+        connect_args["connect_timeout"] = connect_timeout
+    engine = create_engine(
+        url,
+        future=True,
+        pool_pre_ping=True,
+        pool_recycle=POOL_RECYCLE_SEC,
+        connect_args=connect_args,
     )
-    return engine
\ No newline at end of file
+    event.listen(engine, "connect", _set_session_read_only)
+    if check:
+        try:
+            with engine.connect():
+                pass
+        except Exception:
+            engine.dispose()
+            raise
+    return engine
+
+
+def _mysql_read_target() -> Tuple[Tuple[str, str, int], str, Optional[str]]:
+    """MySQL 조회 엔진의 캐시 키, primary URL, replica URL."""
+    primary = os.getenv("DB_URL") or get_mysql_url()
+    replica = get_replica_url()
+    return ("read", f"{replica}|{primary}", os.getpid()), primary, replica
+
+
+def get_read_engine() -> Engine:
+    """
+    대시보드 조회용 엔진 (프로세스당 하나, 캐시).
+
+    - sqlite / duckdb / parquet 백엔드: 스냅샷 (이미 읽기 전용)
+    - mysql: replica(DB_READ_URL / DB_READ_HOST) 로 조회하고, 설정이 없거나 접속에 실패하면 primary.
+      primary 로 대체된 동안에는 REPLICA_RETRY_SEC 마다 replica 를 다시 시도한다.
+      (접속 시도는 락 밖에서 한 스레드만 하고, 그동안 다른 스레드는 현재 엔진을 그대로 쓴다)
+      세션은 READ ONLY 로 열어 조회 경로에서 쓰기가 나가지 않게 한다.
+    """
+    backend = get_backend()
+    if backend == "parquet" and not os.getenv("DB_URL"):
+        return _parquet_engine()
+
+    if backend != "mysql":
+        url, connect_args = _engine_args(backend)
+        key = ("read", url, os.getpid())
+        with _engines_lock:
+            if key not in _engines:
+                _engines[key] = create_engine(url, future=True, connect_args=connect_args)
+            return _engines[key]
+
+    key, primary, replica = _mysql_read_target()
+
+    with _engines_lock:
+        engine = _engines.get(key)
+        failed_at = _replica_failed_at.get(key)
+        if engine is not None and (
+            failed_at is None or time.monotonic() - failed_at < REPLICA_RETRY_SEC
+        ):
+            return engine
+        if not replica:
+            engine = _engines[key] = _create_read_engine(primary, check=False)
+            return engine
+        if engine is not None:
+            # 재시도하는 동안 다른 스레드는 지금 엔진(primary)을 계속 쓴다
+            _replica_failed_at[key] = time.monotonic()
+
+    try:
+        new_engine: Optional[Engine] = _create_read_engine(
+            replica, check=True, connect_timeout=REPLICA_CONNECT_TIMEOUT_SEC
+        )
+    except Exception as e:
+        print(f"[WARN] replica 접속 실패 → primary 로 조회합니다: {e}")
+        new_engine = None
+
+    with _engines_lock:
+        current = _engines.get(key)
+        if new_engine is None:
+            _replica_failed_at[key] = time.monotonic()
+            if current is None:
+                current = _engines[key] = _create_read_engine(primary, check=False)
+            return current
+        if current is not None and current is not engine:
+            # 다른 스레드가 먼저 교체했다
+            new_engine.dispose()
+            return current
+        _replica_failed_at.pop(key, None)
+        if current is not None:
+            current.dispose()
+        _engines[key] = new_engine
+        return new_engine
+
+
+def fallback_to_primary(engine: Engine) -> Optional[Engine]:
+    """
+    get_read_engine() 이 준 replica 엔진으로 조회하다 접속 오류가 났을 때 호출한다.
+    캐시를 primary 로 바꾸고 REPLICA_RETRY_SEC 뒤에 replica 를 다시 시도하게 한 뒤, 재시도할 엔진을 돌려준다.
+    engine 이 replica 가 아니면(이미 primary / 스냅샷) None.
+    """
+    if get_backend() != "mysql":
+        return None
+    key, primary, replica = _mysql_read_target()
+    with _engines_lock:
+        current = _engines.get(key)
+        if not replica or current is None:
+            return None
+        if current is not engine:
+            return current  # 다른 스레드가 이미 교체
+        if key in _replica_failed_at:
+            return None  # 이미 primary 로 조회 중
+        print("[WARN] replica 조회 실패 → primary 로 조회합니다")
+        _replica_failed_at[key] = time.monotonic()
+        current = _engines[key] = _create_read_engine(primary, check=False)
+    engine.dispose()
+    return current
+
+
+def get_write_engine() -> Engine:
+    """
+    ETL 적재용 primary 엔진 (프로세스당 하나, 캐시).
+    DB_BACKEND 가 스냅샷(sqlite / duckdb / parquet)이어도 항상 primary (DB_URL 또는 .env 의 MySQL).
+    """
+    load_env()
+    if os.getenv("DB_URL"):
+        url, connect_args = _engine_args(get_backend())
+    else:
+        url, connect_args = get_mysql_url(), {}
+
+    key = ("write", url, os.getpid())
+    with _engines_lock:
+        if key not in _engines:
+            _engines[key] = create_engine(
+                url,
+                future=True,
+                pool_pre_ping=True,
+                pool_recycle=POOL_RECYCLE_SEC,
+                connect_args=connect_args,
+            )
+        return _engines[key]
+
+
+def reset_engines() -> None:
+    """캐시된 읽기/쓰기 엔진을 모두 닫는다. (DB 설정을 바꾼 뒤 다시 만들 때)"""
+    with _engines_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+        _replica_failed_at.clear()
@@ -0,0 +1,326 @@
+# src/db/export_snapshot.py
+
+from __future__ import annotations
+
+import argparse
+import decimal
+import os
+import shutil
+import sqlite3
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import create_engine, inspect, text, types
+from sqlalchemy.engine import Engine, make_url
+
+from src.db.connection import (
+    SNAPSHOT_FILES,
+    get_mysql_url,
+    get_snapshot_path,
+    register_sqlite_types,
+)
+from src.db.streaming import iter_record_batches
+from src.db.snapshot import (
+    file_sha256,
+    generations_dir,
+    new_generation_id,
+    prune_generations,
+    publish_generation,
+    write_manifest,
+)
+from src.etl.run_ledger import RunLedger
+
+# 대시보드(queries.py)가 읽는 테이블
+# (etl_job / etl_run 은 Admin 페이지가 항상 primary 에서 읽으므로 제외)
+SNAPSHOT_TABLES = [
+    "car_model",
+    "car_model_image",
+    "model_monthly_sales",
+    "model_monthly_interest",
+    "model_monthly_interest_detail",
+    "blog_article",
+    "blog_token_monthly",
+    "blog_wordcloud",
+    "blog_token_trend",
+]
+
+CHUNK_SIZE = 20000
+PARQUET_COMPRESSION = "zstd"
+DEFAULT_KEEP_GENERATIONS = 3
+
+
+def column_ddl_type(col_type: types.TypeEngine, backend: str) -> str:
+    """MySQL 컬럼 타입 → 스냅샷 DDL 타입. (DATE / TIMESTAMP 는 date / datetime 으로 읽히도록 유지)"""
+    if isinstance(col_type, types.Boolean):
+        return "BOOLEAN" if backend == "duckdb" else "INTEGER"
+    if isinstance(col_type, types.Integer):
+        return "BIGINT" if backend == "duckdb" else "INTEGER"
+    if isinstance(col_type, types.Numeric):
+        return "DOUBLE" if backend == "duckdb" else "REAL"
+    if isinstance(col_type, types.DateTime):
+        return "TIMESTAMP"
+    if isinstance(col_type, types.Date):
+        return "DATE"
+    return "VARCHAR" if backend == "duckdb" else "TEXT"
+
+
+def column_arrow_type(col_type: types.TypeEngine):
+    """MySQL 컬럼 타입 → Parquet(Arrow) 타입. DECIMAL 은 정밀도 그대로 (pyarrow 필요)"""
+    import pyarrow as pa
+
+    if isinstance(col_type, types.Integer):
+        return pa.int64()
+    if isinstance(col_type, types.Float):
+        return pa.float64()
+    if isinstance(col_type, types.Numeric):
+        return pa.decimal128(col_type.precision or 38, col_type.scale or 0)
+    if isinstance(col_type, types.DateTime):
+        return pa.timestamp("us")
+    if isinstance(col_type, types.Date):
+        return pa.date32()
+    if isinstance(col_type, types._Binary):
+        return pa.binary()
+    return pa.string()
+
+
+def _value_converter(col_type: types.TypeEngine) -> Optional[Callable[[Any], Any]]:
+    # DECIMAL 은 sqlite3 / duckdb 파라미터로 바로 못 넘기므로 float 로
+    if isinstance(col_type, types.Numeric):
+        return lambda v: float(v) if isinstance(v, decimal.Decimal) else v
+    return None
+
+
+class SnapshotWriter:
+    """sqlite3 / duckdb DB-API 연결에 테이블을 만들고 청크 단위로 insert."""
+
+    def __init__(self, backend: str, path: Path):
+        self.backend = backend
+        if backend == "duckdb":
+            import duckdb  # 선택 의존성 (duckdb / duckdb-engine)
+
+            self.conn = duckdb.connect(str(path))
+        else:
+            register_sqlite_types()
+            self.conn = sqlite3.connect(str(path))
+
+    def execute(self, sql: str) -> None:
+        self.conn.execute(sql)
+
+    def insert(self, table: str, columns: List[str], rows: List[tuple]) -> None:
+        placeholders = ", ".join("?" for _ in columns)
+        self.conn.executemany(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})", rows
+        )
+
+    def close(self) -> None:
+        if self.backend == "sqlite":
+            self.conn.commit()
+            self.conn.execute("ANALYZE")
+        else:
+            self.conn.execute("CHECKPOINT")
+        self.conn.close()
+
+
+def copy_table(source: Engine, writer: SnapshotWriter, table: str) -> int:
+    """MySQL 테이블 하나를 스키마(PK/인덱스 포함) + 데이터 그대로 스냅샷에 복사."""
+    insp = inspect(source)
+    cols = insp.get_columns(table)
+    names = [c["name"] for c in cols]
+    pk = insp.get_pk_constraint(table).get("constrained_columns") or []
+
+    col_defs = [f"{c['name']} {column_ddl_type(c['type'], writer.backend)}" for c in cols]
+    if pk:
+        col_defs.append(f"PRIMARY KEY ({', '.join(pk)})")
+    writer.execute(f"CREATE TABLE {table} ({', '.join(col_defs)})")
+
+    converters = [_value_converter(c["type"]) for c in cols]
+    rows = 0
+    with source.connect() as conn:
+        result = conn.execution_options(stream_results=True).execute(
+            text(f"SELECT {', '.join(names)} FROM {table}")
+        )
+        while True:
+            chunk = result.fetchmany(CHUNK_SIZE)
+            if not chunk:
+                break
+            values = [
+                tuple(conv(v) if conv else v for conv, v in zip(converters, row))
+                for row in chunk
+            ]
+            writer.insert(table, names, values)
+            rows += len(values)
+
+    # FULLTEXT(ngram) 인덱스는 임베디드 DB 에 없으므로 제외 (검색은 LIKE 로 대체)
+    for idx in insp.get_indexes(table):
+        if idx.get("dialect_options", {}).get("mysql_prefix") == "FULLTEXT":
+            continue
+        unique = "UNIQUE " if idx.get("unique") else ""
+        writer.execute(
+            f"CREATE {unique}INDEX {table}__{idx['name']} "
+            f"ON {table} ({', '.join(idx['column_names'])})"
+        )
+    return rows
+
+
+def export_snapshot(
+    backend: str,
+    out_path: Optional[Path] = None,
+    tables: Optional[List[str]] = None,
+) -> Dict[str, int]:
+    """
+    MySQL → 임베디드(sqlite / duckdb) 스냅샷 파일.
+    임시 파일에 다 쓴 뒤 os.replace 로 바꿔치기하므로 읽는 쪽은 항상 완성된 파일만 본다.
+    return: 테이블별 행 수
+    """
+    out_path = out_path or get_snapshot_path(backend)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    source = create_engine(get_mysql_url(), future=True)
+    existing = set(inspect(source).get_table_names())
+    counts: Dict[str, int] = {}
+
+    ledger = RunLedger("export_snapshot", engine=source)
+    with ledger.stage(f"export_{backend}") as m:
+        writer = SnapshotWriter(backend, tmp_path)
+        try:
+            for table in tables or SNAPSHOT_TABLES:
+                if table not in existing:
+                    print(f"[WARN] MySQL 에 테이블이 없어 건너뜀: {table}")
+                    continue
+                counts[table] = copy_table(source, writer, table)
+                print(f"[INFO] {table}: {counts[table]:,} rows")
+        finally:
+            writer.close()
+
+        os.replace(tmp_path, out_path)
+        m.add(rows_read=sum(counts.values()), rows_written=sum(counts.values()))
+        m.add(bytes=out_path.stat().st_size)
+        m.extra.update(backend=backend, path=str(out_path), tables=len(counts))
+
+    source.dispose()
+    print(f"[INFO] 스냅샷 저장 완료: {out_path} ({out_path.stat().st_size / 1024 / 1024:.1f}MB)")
+    return counts
+
+
+def write_parquet_table(source: Engine, table: str, path: Path) -> Tuple[int, Dict[str, str]]:
+    """
+    MySQL 테이블 하나를 CHUNK_SIZE 행씩 스트리밍으로 읽어 Parquet 파일에 이어 쓴다. (pyarrow 필요)
+    스키마는 MySQL 컬럼 타입에서 정하므로 청크마다 타입이 달라지지 않는다.
+    return: (행 수, {컬럼: Arrow 타입})
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    cols = inspect(source).get_columns(table)
+    schema = pa.schema([(c["name"], column_arrow_type(c["type"])) for c in cols])
+    sql = f"SELECT {', '.join(c['name'] for c in cols)} FROM {table}"
+
+    rows = 0
+    with pq.ParquetWriter(path, schema, compression=PARQUET_COMPRESSION) as writer:
+        for batch in iter_record_batches(source, sql, chunk_size=CHUNK_SIZE, schema=schema):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows, {field.name: str(field.type) for field in schema}
+
+
+def export_generation(
+    tables: Optional[List[str]] = None,
+    keep: int = DEFAULT_KEEP_GENERATIONS,
+) -> Dict[str, int]:
+    """
+    MySQL → 새 Parquet 세대 (테이블별 zstd 압축 파일 + manifest.json).
+    <gen_id>.tmp 에 다 쓴 뒤 폴더 이름을 바꾸고 LATEST 를 교체하므로,
+    대시보드 워커는 완성되고 체크섬이 기록된 세대만 보게 된다.
+    return: 테이블별 행 수
+    """
+    base = generations_dir()
+    gen_id = new_generation_id()
+    gen_dir = base / gen_id
+    tmp_dir = base / f"{gen_id}.tmp"
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    tmp_dir.mkdir(parents=True)
+
+    source = create_engine(get_mysql_url(), future=True)
+    existing = set(inspect(source).get_table_names())
+    entries: Dict[str, Dict[str, Any]] = {}
+
+    ledger = RunLedger("export_snapshot", engine=source)
+    with ledger.stage("export_parquet") as m:
+        for table in tables or SNAPSHOT_TABLES:
+            if table not in existing:
+                print(f"[WARN] MySQL 에 테이블이 없어 건너뜀: {table}")
+                continue
+            path = tmp_dir / f"{table}.parquet"
+            rows, columns = write_parquet_table(source, table, path)
+            entries[table] = {
+                "file": path.name,
+                "rows": rows,
+                "bytes": path.stat().st_size,
+                "sha256": file_sha256(path),
+                "columns": columns,
+            }
+            print(f"[INFO] {table}: {rows:,} rows, {entries[table]['bytes'] / 1024:.0f}KB")
+
+        write_manifest(
+            tmp_dir,
+            gen_id,
+            entries,
+            source=make_url(get_mysql_url()).database,
+            compression=PARQUET_COMPRESSION,
+        )
+        os.replace(tmp_dir, gen_dir)
+        publish_generation(gen_id)
+        removed = prune_generations(keep)
+
+        rows = sum(e["rows"] for e in entries.values())
+        m.add(rows_read=rows, rows_written=rows, bytes=sum(e["bytes"] for e in entries.values()))
+        m.extra.update(backend="parquet", generation=gen_id, tables=len(entries), pruned=len(removed))
+
+    source.dispose()
+    print(f"[INFO] 스냅샷 세대 게시: {gen_dir} (LATEST={gen_id}, 정리한 세대 {len(removed)}개)")
+    return {table: e["rows"] for table, e in entries.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="MySQL → 대시보드용 임베디드 스냅샷 (DB_BACKEND=sqlite|duckdb 로 읽기)"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=[*SNAPSHOT_FILES, "parquet"],
+        default="sqlite",
+        help="스냅샷 형식 (duckdb 는 duckdb 패키지, parquet 은 pyarrow 필요)",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="출력 파일 (default: data/snapshot/car_trend.<backend>, parquet 은 무시)",
+    )
+    parser.add_argument(
+        "--keep",
+        type=int,
+        default=DEFAULT_KEEP_GENERATIONS,
+        help="parquet: 남겨둘 최근 세대 수",
+    )
+    parser.add_argument(
+        "--tables", nargs="+", default=None, help="복사할 테이블 (default: 대시보드 테이블 전체)"
+    )
+    args = parser.parse_args()
+
+    if args.backend == "parquet":
+        export_generation(tables=args.tables, keep=args.keep)
+        return
+
+    export_snapshot(
+        args.backend,
+        out_path=Path(args.output) if args.output else None,
+        tables=args.tables,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -169,5 +169,142 @@ CREATE TABLE model_monthly_interest_detail (
     CONSTRAINT fk_interest_detail_model FOREIGN KEY (model_id) REFERENCES car_model(model_id)
 ) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4 COMMENT = '네이버 검색량 상세 지표 (디바이스/성별/연령대 단위 RAW)';
 
+-- =====================================================
+-- 10. model_monthly_interest_detail 수정: 증분 집계용 updated_at 추가
+--     (ratio 값이 실제로 바뀐 행만 갱신되어 aggregate_naver_interest --incremental 의 워터마크로 사용)
+-- =====================================================
+ALTER TABLE
+    model_monthly_interest_detail
+ADD
+    COLUMN updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '레코드 수정 시각'
+AFTER
+    created_at,
+ADD
+    KEY idx_detail_updated_at (updated_at);
+
+
+-- =====================================================
+-- 11. blog_token_counts: 모델/월별 전체 토큰 빈도 (희소 벡터)
+--     blog_token_monthly 는 상위 50개 스냅샷이라 월간 증감 계산에 쓰기 어렵기 때문에
+--     전체 {token: count} 를 zlib 압축 JSON 으로 한 행에 보관한다.
+-- =====================================================
+CREATE TABLE IF NOT EXISTS blog_token_counts (
+    model_id INT UNSIGNED NOT NULL COMMENT 'FK → car_model.model_id',
+    month DATE NOT NULL COMMENT '기준 월',
+    vocab_size INT NOT NULL COMMENT '고유 토큰 수',
+    total_tokens INT NOT NULL COMMENT '전체 토큰 수',
+    counts_blob MEDIUMBLOB NOT NULL COMMENT 'zlib(JSON {token: count})',
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정 시각',
+    PRIMARY KEY (model_id, month),
+    KEY idx_token_counts_month (month),
+    CONSTRAINT fk_token_counts_model FOREIGN KEY (model_id) REFERENCES car_model(model_id) ON DELETE CASCADE
+) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4 COMMENT '월간 블로그 전체 토큰 빈도 (압축)';
+
+-- =====================================================
+-- 12. blog_token_trend: 전월/최근 평균 대비 키워드 증감 (compute_token_trends.py)
+-- =====================================================
+CREATE TABLE IF NOT EXISTS blog_token_trend (
+    id INT UNSIGNED AUTO_INCREMENT PRIMARY KEY,
+    model_id INT UNSIGNED NOT NULL COMMENT 'FK → car_model.model_id',
+    month DATE NOT NULL COMMENT '기준 월',
+    token VARCHAR(100) NOT NULL COMMENT '단어(명사)',
+    direction VARCHAR(10) NOT NULL COMMENT 'up(급상승) / down(급하락)',
+    trend_rank INT NOT NULL COMMENT 'direction 내 순위 (1 = 변화 최대)',
+    curr_count INT NOT NULL COMMENT '기준 월 등장 횟수',
+    prev_count INT NOT NULL COMMENT '전월 등장 횟수',
+    trailing_avg FLOAT NOT NULL COMMENT '직전 N개월 평균 등장 횟수',
+    mom_lift FLOAT NOT NULL COMMENT 'log2(기준 월 비중 / 전월 비중), 스무딩 적용',
+    trailing_lift FLOAT NOT NULL COMMENT 'log2(기준 월 비중 / 직전 N개월 평균 비중)',
+    trend_score FLOAT NOT NULL COMMENT '정렬용 점수 (lift × log 빈도)',
+    computed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '계산 시각',
+    UNIQUE KEY uk_trend_model_month_token (model_id, month, token),
+    KEY idx_trend_lookup (model_id, month, direction, trend_rank),
+    CONSTRAINT fk_trend_model FOREIGN KEY (model_id) REFERENCES car_model(model_id) ON DELETE CASCADE
+) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4 COMMENT '월간 블로그 키워드 증감';
+
+
+-- =====================================================
+-- 13. blog_article 수정: 본문 검색용 FULLTEXT(ngram) 인덱스 추가
+--     (한국어는 공백 단위 토큰화가 맞지 않으므로 ngram 파서, ngram_token_size 기본값 2 사용)
+--     INSERT 시 InnoDB 가 인덱스를 자동 갱신하므로 ETL 쪽 추가 작업은 없음.
+--     대량 적재 후에는 OPTIMIZE TABLE blog_article 로 FULLTEXT 보조 테이블 병합 권장.
+-- =====================================================
+ALTER TABLE
+    blog_article
+ADD
+    FULLTEXT KEY ft_blog_title_content (title, content_plain) WITH PARSER ngram;
+
+
+-- =====================================================
+-- 14. blog_article_signature: 유사 중복 글 판정용 MinHash 시그니처 (src/etl/blog/minhash.py)
+--     body_sig    = 본문 문자 5-gram MinHash (uint32 × 64, little-endian)
+--     snippet_sig = 검색 API description MinHash (본문 fetch 전 중복 판정용)
+-- =====================================================
+CREATE TABLE IF NOT EXISTS blog_article_signature (
+    article_id INT UNSIGNED NOT NULL PRIMARY KEY COMMENT 'FK → blog_article.article_id',
+    model_id INT UNSIGNED NOT NULL COMMENT 'FK → car_model.model_id',
+    month DATE NOT NULL COMMENT '기준 월',
+    body_sig VARBINARY(256) NOT NULL COMMENT '본문 MinHash 시그니처',
+    snippet_sig VARBINARY(256) NULL COMMENT '검색 스니펫 MinHash 시그니처',
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성 시각',
+    KEY idx_signature_month (month),
+    CONSTRAINT fk_signature_article FOREIGN KEY (article_id) REFERENCES blog_article(article_id) ON DELETE CASCADE
+) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4 COMMENT '블로그 글 유사 중복 판정 시그니처';
+
+-- =====================================================
+-- 15. etl_job: 관리자 페이지 ETL 실행 큐 (src/etl/job_runner.py)
+--     관리자 페이지는 queued 행만 넣고, 워커 프로세스가 가져가 실행/상태 갱신한다.
+--     status: queued → running → success / failed / cancelled
+-- =====================================================
+CREATE TABLE IF NOT EXISTS etl_job (
+    job_id BIGINT UNSIGNED AUTO_INCREMENT PRIMARY KEY,
+    pipeline VARCHAR(30) NOT NULL COMMENT '파이프라인 (danawa/naver/google/blog/orchestrator), 동시 실행 상한 단위',
+    command_key VARCHAR(50) NOT NULL COMMENT '관리자 페이지 명령 key',
+    script VARCHAR(255) NOT NULL COMMENT '프로젝트 루트 기준 스크립트 경로',
+    args_json TEXT NOT NULL COMMENT 'CLI 인자 (JSON 배열)',
+    status VARCHAR(20) NOT NULL DEFAULT 'queued' COMMENT 'queued/running/success/failed/cancelled',
+    cancel_requested TINYINT(1) NOT NULL DEFAULT 0 COMMENT '실행 중 취소 요청',
+    requested_by VARCHAR(50) NULL COMMENT '요청자',
+    worker VARCHAR(100) NULL COMMENT '실행 워커 (host:pid)',
+    pid INT NULL COMMENT '자식 프로세스 pid',
+    returncode INT NULL COMMENT '종료 코드',
+    log_path VARCHAR(255) NULL COMMENT '로그 파일 (data/logs/etl_jobs/...)',
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '요청 시각',
+    started_at DATETIME NULL COMMENT '시작 시각',
+    finished_at DATETIME NULL COMMENT '종료 시각',
+    duration_sec FLOAT NULL COMMENT '실행 시간(초)',
+    KEY idx_etl_job_status (status, job_id),
+    KEY idx_etl_job_pipeline (pipeline, status),
+    KEY idx_etl_job_command (command_key, job_id)
+) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4 COMMENT '관리자 ETL 실행 큐';
+
+-- =====================================================
+-- 16. etl_run: ETL 스크립트 단계별 실행 기록 (src/etl/run_ledger.py)
+--     스크립트 1회 실행(run_uuid) × 단계(stage) 당 한 행. data/logs/etl_runs.jsonl 에도 같은 내용을 남긴다.
+-- =====================================================
+CREATE TABLE IF NOT EXISTS etl_run (
+    id BIGINT UNSIGNED AUTO_INCREMENT PRIMARY KEY,
+    run_uuid CHAR(32) NOT NULL COMMENT '스크립트 1회 실행 식별자',
+    run_id VARCHAR(50) NULL COMMENT 'ETL 실행 ID (--run-id)',
+    job_id BIGINT UNSIGNED NULL COMMENT 'etl_job.job_id (작업 큐로 실행된 경우)',
+    script VARCHAR(100) NOT NULL COMMENT '스크립트 이름',
+    stage VARCHAR(50) NOT NULL COMMENT '단계 이름',
+    status VARCHAR(20) NOT NULL COMMENT 'success / failed',
+    started_at DATETIME NOT NULL COMMENT '시작 시각',
+    finished_at DATETIME NOT NULL COMMENT '종료 시각',
+    duration_sec FLOAT NOT NULL COMMENT '소요 시간(초)',
+    rows_read INT NOT NULL DEFAULT 0 COMMENT '읽은 행 수',
+    rows_written INT NOT NULL DEFAULT 0 COMMENT '쓴 행 수',
+    rows_skipped INT NOT NULL DEFAULT 0 COMMENT '건너뛴 행 수',
+    api_calls INT NOT NULL DEFAULT 0 COMMENT '외부 API/페이지 요청 수',
+    bytes BIGINT NOT NULL DEFAULT 0 COMMENT '읽거나 쓴 바이트 수',
+    errors INT NOT NULL DEFAULT 0 COMMENT '오류 수',
+    rows_per_sec FLOAT NULL COMMENT 'max(rows_read, rows_written) / duration_sec',
+    host VARCHAR(100) NULL COMMENT '실행 호스트',
+    extra_json TEXT NULL COMMENT '스크립트별 추가 통계 (JSON)',
+    KEY idx_etl_run_script (script, stage, started_at),
+    KEY idx_etl_run_started (started_at)
+) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4 COMMENT 'ETL 단계별 실행 기록';
+
 SET
     FOREIGN_KEY_CHECKS = 1;
\ No newline at end of file
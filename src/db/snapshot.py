@@ -0,0 +1,107 @@
+# src/db/snapshot.py
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .connection import SNAPSHOT_DIR, load_env
+
+# 세대(generation)별 Parquet 스냅샷
+#   data/snapshot/generations/<gen_id>/<table>.parquet
+#   data/snapshot/generations/<gen_id>/manifest.json   (행 수 / 크기 / sha256 / 컬럼)
+#   data/snapshot/generations/LATEST                    (현재 세대 id, 원자적으로 교체)
+MANIFEST_FILE = "manifest.json"
+LATEST_FILE = "LATEST"
+
+
+def generations_dir() -> Path:
+    """세대 폴더. DB_SNAPSHOT_DIR 로 변경 (DB_SNAPSHOT_PATH 는 sqlite/duckdb 스냅샷 파일 전용)"""
+    load_env()
+    path = os.getenv("DB_SNAPSHOT_DIR")
+    return Path(path) if path else SNAPSHOT_DIR / "generations"
+
+
+def new_generation_id() -> str:
+    return datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+
+
+def file_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def write_manifest(gen_dir: Path, gen_id: str, tables: Dict[str, Dict[str, Any]], **meta) -> Path:
+    manifest = {
+        "generation": gen_id,
+        "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        **meta,
+        "tables": tables,
+    }
+    path = gen_dir / MANIFEST_FILE
+    path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
+
+
+def publish_generation(gen_id: str) -> None:
+    """LATEST 포인터를 gen_id 로 교체. (임시 파일 → os.replace 라 읽는 쪽은 이전/새 값 중 하나만 본다)"""
+    base = generations_dir()
+    tmp = base / f"{LATEST_FILE}.tmp"
+    tmp.write_text(gen_id, encoding="utf-8")
+    os.replace(tmp, base / LATEST_FILE)
+
+
+def latest_generation() -> Optional[str]:
+    path = generations_dir() / LATEST_FILE
+    if not path.exists():
+        return None
+    return path.read_text(encoding="utf-8").strip() or None
+
+
+def load_manifest(gen_id: str) -> Dict[str, Any]:
+    path = generations_dir() / gen_id / MANIFEST_FILE
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def verify_generation(gen_id: str) -> Dict[str, Any]:
+    """manifest 의 sha256 과 실제 파일을 비교. 맞지 않으면 ValueError. return: manifest"""
+    manifest = load_manifest(gen_id)
+    gen_dir = generations_dir() / gen_id
+    for table, entry in manifest["tables"].items():
+        path = gen_dir / entry["file"]
+        if not path.exists():
+            raise ValueError(f"스냅샷 파일 없음: {path}")
+        if file_sha256(path) != entry["sha256"]:
+            raise ValueError(f"스냅샷 체크섬 불일치: {table} ({path})")
+    return manifest
+
+
+def table_paths(gen_id: str, manifest: Dict[str, Any]) -> Dict[str, Path]:
+    gen_dir = generations_dir() / gen_id
+    return {table: gen_dir / entry["file"] for table, entry in manifest["tables"].items()}
+
+
+def prune_generations(keep: int) -> List[str]:
+    """최근 keep 개 세대만 남긴다. (LATEST 가 가리키는 세대는 항상 유지) return: 삭제한 세대"""
+    base = generations_dir()
+    latest = latest_generation()
+    gens = sorted(
+        p.name
+        for p in base.iterdir()
+        if p.is_dir() and not p.name.endswith(".tmp") and (p / MANIFEST_FILE).exists()
+    )
+    removed = []
+    for gen_id in gens[: max(len(gens) - keep, 0)]:
+        if gen_id == latest:
+            continue
+        shutil.rmtree(base / gen_id, ignore_errors=True)
+        removed.append(gen_id)
+    return removed
@@ -0,0 +1,82 @@
+# src/db/streaming.py
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Optional
+
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Engine, RowMapping
+
+# 큰 조회 결과를 한 번에 받지 않고 청크 단위로 읽는 헬퍼
+#   - stream_results=True → MySQL(pymysql) 은 SSCursor(서버 측 커서)로 행을 받아온다.
+#     SQLite / DuckDB 스냅샷은 원래 행 단위로 가져오므로 옵션만 무시된다.
+#   - 스트리밍 중에는 커넥션 하나를 점유한다. 다 읽거나 제너레이터를 닫으면 반환된다.
+#   - 한 커넥션에서 스트리밍과 다른 쿼리를 섞지 말 것 (SSCursor 는 결과를 다 읽기 전까지 커넥션을 잡고 있음)
+DEFAULT_CHUNK_SIZE = 10000
+
+Params = Optional[Dict[str, Any]]
+
+
+def iter_row_chunks(
+    engine: Engine,
+    sql: str,
+    params: Params = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[List[RowMapping]]:
+    """SELECT 결과를 chunk_size 행씩 RowMapping 리스트로 돌려준다."""
+    with engine.connect() as conn:
+        result = conn.execution_options(
+            stream_results=True, max_row_buffer=chunk_size
+        ).execute(text(sql), params or {})
+        for chunk in result.mappings().partitions(chunk_size):
+            yield chunk
+
+
+def iter_dataframes(
+    engine: Engine,
+    sql: str,
+    params: Params = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """
+    SELECT 결과를 chunk_size 행씩 DataFrame 으로 돌려준다.
+    결과가 없으면 컬럼만 있는 빈 DataFrame 하나를 돌려준다.
+    """
+    with engine.connect() as conn:
+        result = conn.execution_options(
+            stream_results=True, max_row_buffer=chunk_size
+        ).execute(text(sql), params or {})
+        columns = list(result.keys())
+        empty = True
+        for chunk in result.partitions(chunk_size):
+            empty = False
+            yield pd.DataFrame.from_records(chunk, columns=columns)
+        if empty:
+            yield pd.DataFrame(columns=columns)
+
+
+def iter_record_batches(
+    engine: Engine,
+    sql: str,
+    params: Params = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    schema=None,
+):
+    """
+    iter_dataframes 와 같지만 pyarrow RecordBatch 로 돌려준다. (pyarrow 필요)
+    schema(pa.Schema, 컬럼 순서 = SELECT 순서)를 주면 pandas 를 거치지 않고 행을 그 타입으로 바로 변환한다.
+    (청크마다 타입 추론이 달라지지 않으므로 ParquetWriter 로 이어 쓸 때 사용)
+    """
+    import pyarrow as pa
+
+    if schema is None:
+        for df in iter_dataframes(engine, sql, params, chunk_size):
+            yield pa.RecordBatch.from_pandas(df, preserve_index=False)
+        return
+
+    for chunk in iter_row_chunks(engine, sql, params, chunk_size):
+        arrays = [
+            pa.array([row[field.name] for row in chunk], type=field.type) for field in schema
+        ]
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
@@ -0,0 +1,226 @@
+# src/etl/blog/bench_html_extract.py
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import requests
+from sqlalchemy import text
+
+from src.db.connection import get_engine
+from src.etl.blog.blog_fetcher import DEFAULT_HEADERS
+from src.etl.blog.html_extractor import (
+    BlogHtmlExtractor,
+    available_backends,
+    to_postview_url,
+)
+
+BASE_DIR = Path(__file__).resolve().parents[3]
+# 저장소에 커밋된 기본 코퍼스 (네이버 블로그 페이지 구조별 샘플, README.md 참고)
+DEFAULT_CORPUS_DIR = BASE_DIR / "data" / "bench" / "html"
+COLLECT_DIR = BASE_DIR / "data" / "fixtures" / "blog_html"
+
+# 코퍼스와 별도로 모든 백엔드에서 예외 없이 bs4 와 같은 텍스트가 나와야 하는 입력
+#   (lxml 은 빈 문서에 ParserError, encoding 선언이 있는 str 에 ValueError 를 냈었음)
+EDGE_CASES = {
+    "empty": "",
+    "whitespace_only": " \n\t",
+    "xml_prolog_outer": (
+        '<?xml version="1.0" encoding="euc-kr"?>\n'
+        '<html><body><div class="se-main-container"><p>아이오닉5 시승기</p></div></body></html>'
+    ),
+    "xml_prolog_inner.postview": (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<html><body><div id="postViewArea"><p>쏘렌토 하이브리드 연비</p></div></body></html>'
+    ),
+}
+
+
+def collect_corpus(corpus_dir: Path, limit: int, sleep_sec: float = 0.5) -> int:
+    """
+    blog_article 에 저장된 URL 들의 HTML 을 받아 벤치마크용 코퍼스로 저장한다.
+    파일명: <article_id>.html (PostView 로 받은 페이지는 <article_id>.postview.html)
+    """
+    engine = get_engine(echo=False)
+    sql = text(
+        """
+        SELECT article_id, url
+        FROM blog_article
+        ORDER BY collected_at DESC
+        LIMIT :limit
+        """
+    )
+    with engine.connect() as conn:
+        rows = conn.execute(sql, {"limit": int(limit)}).mappings().all()
+
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+    saved = 0
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+
+    for row in rows:
+        url = row["url"]
+        fetch_url = to_postview_url(url)
+        suffix = ".postview.html" if fetch_url != url else ".html"
+        out_path = corpus_dir / f"{row['article_id']}{suffix}"
+        if out_path.exists():
+            continue
+        try:
+            resp = session.get(fetch_url, timeout=10)
+            resp.raise_for_status()
+        except Exception as e:
+            print(f"[WARN] 코퍼스 수집 실패: {fetch_url} ({e})")
+            continue
+        out_path.write_text(resp.text, encoding="utf-8")
+        saved += 1
+        time.sleep(sleep_sec)
+
+    print(f"[INFO] 코퍼스 저장 완료: {saved} 개 → {corpus_dir}")
+    return saved
+
+
+def load_corpus(corpus_dir: Path) -> List[tuple[str, str]]:
+    """(파일명, HTML) 목록."""
+    files = sorted(corpus_dir.glob("*.html"))
+    return [(p.name, p.read_text(encoding="utf-8", errors="replace")) for p in files]
+
+
+def _extract_words(extractor: BlogHtmlExtractor, name: str, html: str) -> int:
+    if ".postview" in name:
+        body = extractor.extract_inner(html)
+    else:
+        body, _iframe = extractor.extract(html)
+    return len((body or "").split())
+
+
+def check_edge_cases(backends: List[str]) -> List[str]:
+    """EDGE_CASES 를 백엔드별로 추출해 예외가 나거나 bs4 와 단어 수가 다른 경우를 돌려준다."""
+    baseline = BlogHtmlExtractor(backend="bs4")
+    failures: List[str] = []
+    for name in backends:
+        extractor = BlogHtmlExtractor(backend=name)
+        for case, html in EDGE_CASES.items():
+            try:
+                words = _extract_words(extractor, case, html)
+            except Exception as e:
+                failures.append(f"{name}/{case}: {type(e).__name__}: {e}")
+                continue
+            expected = _extract_words(baseline, case, html)
+            if words != expected:
+                failures.append(f"{name}/{case}: words={words} (bs4={expected})")
+    return failures
+
+
+def run_benchmark(
+    corpus: List[tuple[str, str]],
+    backends: List[str],
+    repeat: int = 3,
+) -> List[Dict[str, object]]:
+    """
+    백엔드별로 코퍼스 전체를 repeat 번 추출해
+    pages/sec, MB/sec, 추출 단어 수(bs4 대비)를 잰다.
+    """
+    total_bytes = sum(len(html.encode("utf-8")) for _, html in corpus)
+    results: List[Dict[str, object]] = []
+    baseline_words: Dict[str, int] = {}
+
+    for name in backends:
+        extractor = BlogHtmlExtractor(backend=name)
+
+        words: Dict[str, int] = {}
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for fname, html in corpus:
+                words[fname] = _extract_words(extractor, fname, html)
+            best = min(best, time.perf_counter() - started)
+
+        if name == "bs4":
+            baseline_words = words
+
+        results.append(
+            {
+                "backend": name,
+                "pages": len(corpus),
+                "seconds": best,
+                "pages_per_sec": len(corpus) / best if best > 0 else 0.0,
+                "mb_per_sec": total_bytes / 1e6 / best if best > 0 else 0.0,
+                "words": sum(words.values()),
+                "_words": words,
+            }
+        )
+
+    # bs4 결과와 추출 단어 수가 ±5% 이내인 페이지 비율
+    for r in results:
+        words = r.pop("_words")
+        if baseline_words:
+            agree = sum(
+                1
+                for k, v in words.items()
+                if abs(v - baseline_words.get(k, 0)) <= max(1, baseline_words.get(k, 0) * 0.05)
+            )
+            r["agree_with_bs4"] = agree / len(words) if words else 1.0
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="블로그 본문 추출 백엔드 벤치마크 (저장된 HTML 코퍼스 기준)"
+    )
+    parser.add_argument(
+        "--corpus-dir",
+        type=Path,
+        default=None,
+        help="HTML 코퍼스 디렉터리 (기본: data/bench/html, --collect 시 data/fixtures/blog_html)",
+    )
+    parser.add_argument(
+        "--collect",
+        type=int,
+        default=0,
+        help="blog_article 최근 N개 URL 로 코퍼스를 먼저 수집 (DB/네트워크 필요)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=None,
+        help="측정할 백엔드 (기본: 설치된 전부)",
+    )
+    args = parser.parse_args()
+
+    # 수집한 실제 페이지는 커밋된 기본 코퍼스와 섞이지 않게 별도 폴더에 저장
+    corpus_dir = args.corpus_dir or (COLLECT_DIR if args.collect else DEFAULT_CORPUS_DIR)
+    if args.collect:
+        collect_corpus(corpus_dir, limit=args.collect)
+
+    if not corpus_dir.exists():
+        raise FileNotFoundError(
+            f"코퍼스 디렉터리가 없습니다: {corpus_dir} (--collect N 으로 먼저 수집)"
+        )
+    corpus = load_corpus(corpus_dir)
+    if not corpus:
+        print("[WARN] 코퍼스에 HTML 파일이 없습니다.")
+        return
+
+    backends = args.backends or available_backends()
+    print(f"[INFO] 코퍼스 {len(corpus)} 페이지, 백엔드: {backends}")
+
+    for failure in check_edge_cases(backends):
+        print(f"[WARN] 예외 입력 처리 불일치: {failure}")
+
+    for r in run_benchmark(corpus, backends, repeat=args.repeat):
+        agree = r.get("agree_with_bs4")
+        agree_str = f", agree_with_bs4={agree:.0%}" if agree is not None else ""
+        print(
+            f"  {r['backend']:>10}: {r['pages_per_sec']:8.1f} pages/s, "
+            f"{r['mb_per_sec']:6.2f} MB/s, best={r['seconds']:.3f}s, "
+            f"words={r['words']}{agree_str}"
+        )
+
+
+if __name__ == "__main__":
+    main()
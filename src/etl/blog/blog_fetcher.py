@@ -0,0 +1,167 @@
+# src/etl/blog/blog_fetcher.py
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    )
+}
+
+# 재시도할 HTTP 상태 코드 (그 외 4xx 는 바로 실패 처리)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class AsyncRateLimiter:
+    """
+    여러 코루틴이 공유하는 호출 간격 제한기.
+    wait() 를 통과하는 호출 시작 간격을 min_interval 초 이상으로 맞춘다. (검색 API 페이싱용)
+    """
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self.calls = 0
+        self._lock: Optional[asyncio.Lock] = None
+        self._last_start = 0.0
+
+    async def wait(self) -> None:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            delay = self._last_start + self.min_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._last_start = time.monotonic()
+            self.calls += 1
+
+
+class AsyncBlogFetcher:
+    """
+    블로그 HTML 을 동시에 가져오는 비동기 fetch 스테이지.
+
+    - 하나의 requests.Session(커넥션 풀)을 모든 요청이 공유
+    - 전체 동시 요청 수(concurrency) + 호스트별 동시 요청 수(per_host) 제한
+    - 같은 호스트에 대해 요청 시작 간격을 host_delay 초 이상 유지 (politeness, 대기 중에는 전체 슬롯을 쓰지 않음)
+    - timeout / 429·5xx 재시도(지수 백오프)
+
+    requests 는 블로킹이므로 실제 I/O 는 스레드 풀에서 수행하고,
+    스케줄링/제한은 asyncio 로 관리한다.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 16,
+        per_host: int = 4,
+        host_delay: float = 0.3,
+        timeout: float = 10.0,
+        max_retries: int = 2,
+        backoff: float = 1.0,
+    ):
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.host_delay = host_delay
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._executor = ThreadPoolExecutor(max_workers=concurrency)
+        self._global_sem: Optional[asyncio.Semaphore] = None
+        self._host_sems: Dict[str, asyncio.Semaphore] = {}
+        self._host_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._host_last_start: Dict[str, float] = defaultdict(float)
+
+        self.stats: Dict[str, int] = {"requests": 0, "retries": 0, "failures": 0}
+
+    async def __aenter__(self) -> "AsyncBlogFetcher":
+        self._global_sem = asyncio.Semaphore(self.concurrency)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+    def _host_sem(self, host: str) -> asyncio.Semaphore:
+        if host not in self._host_sems:
+            self._host_sems[host] = asyncio.Semaphore(self.per_host)
+        return self._host_sems[host]
+
+    def _politeness_wait(self, host: str) -> float:
+        """같은 호스트의 직전 요청 시작 후 host_delay 까지 남은 시간 (초)."""
+        return self.host_delay - (time.monotonic() - self._host_last_start[host])
+
+    async def _acquire_slot(self, host: str) -> None:
+        """
+        호스트별 간격(host_delay)을 지킨 상태로 전체 슬롯(global_sem)을 잡는다.
+        간격 대기는 전체 슬롯 없이 하므로, 한 호스트에 몰린 요청이 다른 호스트의 슬롯을 막지 않는다.
+        (호출 전에 호스트 세마포어를 잡고 있어야 함)
+        """
+        while True:
+            wait = self._politeness_wait(host)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            await self._global_sem.acquire()
+            async with self._host_locks[host]:
+                if self._politeness_wait(host) <= 0:
+                    self._host_last_start[host] = time.monotonic()
+                    return
+            # 전체 슬롯을 기다리는 사이 같은 호스트의 다른 요청이 먼저 시작함 → 슬롯 반납 후 다시 대기
+            self._global_sem.release()
+
+    def _get(self, url: str) -> requests.Response:
+        return self.session.get(url, timeout=self.timeout)
+
+    async def fetch(self, url: str) -> str:
+        """URL 하나의 HTML 을 가져온다. 재시도 후에도 실패하면 예외를 던진다."""
+        if self._global_sem is None:
+            raise RuntimeError("AsyncBlogFetcher 는 async with 블록 안에서 사용해야 합니다.")
+
+        host = urlparse(url).netloc
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(self.max_retries + 1):
+            # 호스트 세마포어 → 전체 세마포어 순서로 잡는다. (호스트 대기 중에 전체 슬롯을 쥐고 있지 않음)
+            async with self._host_sem(host):
+                await self._acquire_slot(host)
+                try:
+                    self.stats["requests"] += 1
+                    resp = await loop.run_in_executor(self._executor, self._get, url)
+                    if resp.status_code in RETRY_STATUS:
+                        raise requests.HTTPError(
+                            f"{resp.status_code} for {url}", response=resp
+                        )
+                    resp.raise_for_status()
+                    return resp.text
+                except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+                    status = getattr(getattr(e, "response", None), "status_code", None)
+                    retryable = status is None or status in RETRY_STATUS
+                    if not retryable or attempt >= self.max_retries:
+                        self.stats["failures"] += 1
+                        raise
+                finally:
+                    self._global_sem.release()
+            # 세마포어를 반납한 뒤 백오프 대기 (다른 요청은 계속 진행)
+            self.stats["retries"] += 1
+            await asyncio.sleep(self.backoff * (2**attempt))
+
+        raise RuntimeError("unreachable")
@@ -0,0 +1,316 @@
+# src/etl/blog/compute_token_trends.py
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import math
+import time
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import Engine
+
+from src.db.connection import get_write_engine
+from src.etl.blog.kiwi_tokenizer import count_tokens_by_group
+from src.etl.blog.token_store import (
+    build_counts_row,
+    load_token_counts,
+    write_token_counts,
+)
+from src.etl.run_ledger import RunLedger
+
+# 비중 계산 시 additive smoothing 값 (처음 등장/사라진 토큰의 lift 가 무한대가 되지 않도록)
+SMOOTHING_ALPHA = 0.5
+
+
+def shift_month(month: datetime.date, n: int) -> datetime.date:
+    """month(YYYY-MM-01) 에서 n 개월 이동."""
+    idx = month.year * 12 + (month.month - 1) + n
+    return datetime.date(idx // 12, idx % 12 + 1, 1)
+
+
+def parse_month_arg(month_str: str | None, engine: Engine) -> Optional[datetime.date]:
+    """--month 가 없으면 blog_token_counts 의 가장 최근 월."""
+    if month_str:
+        if len(month_str) == 7:
+            month_str = month_str + "-01"
+        return datetime.datetime.strptime(month_str, "%Y-%m-%d").date()
+
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT MAX(month) FROM blog_token_counts")).scalar()
+
+
+# -----------------------------
+# 전체 토큰 빈도 백필
+# -----------------------------
+def backfill_token_counts(
+    engine: Engine, months: List[datetime.date], kiwi_workers: int = -1
+) -> int:
+    """
+    blog_token_counts 가 없는 (model_id, month) 는 blog_article.content_plain 을
+    다시 토큰화해 채운다. (이 테이블이 생기기 전에 수집된 월 대응)
+    """
+    stmt = text(
+        """
+        SELECT a.model_id, a.month, a.content_plain
+        FROM blog_article a
+        LEFT JOIN blog_token_counts c
+          ON c.model_id = a.model_id
+         AND c.month = a.month
+        WHERE a.month IN :months
+          AND c.model_id IS NULL
+        """
+    ).bindparams(bindparam("months", expanding=True))
+    with engine.connect() as conn:
+        rows = conn.execute(stmt, {"months": months}).all()
+
+    groups: Dict[Tuple[int, datetime.date], List[str]] = {}
+    for model_id, month, content in rows:
+        groups.setdefault((int(model_id), month), []).append(content or "")
+    if not groups:
+        return 0
+
+    counters, stats = count_tokens_by_group(groups, num_workers=kiwi_workers)
+    print(f"[INFO] 전체 토큰 빈도 백필 토큰화: {stats.summary()}")
+
+    counts_rows = [
+        build_counts_row(model_id, month, counters[(model_id, month)])
+        for (model_id, month) in groups
+        if counters[(model_id, month)]
+    ]
+    with engine.begin() as conn:
+        write_token_counts(conn, counts_rows)
+    return len(counts_rows)
+
+
+# -----------------------------
+# 증감 점수 계산
+# -----------------------------
+def _smoothed_share(counts: pd.Series, total: float, vocab: int) -> pd.Series:
+    return (counts + SMOOTHING_ALPHA) / (total + SMOOTHING_ALPHA * vocab)
+
+
+def score_model_tokens(
+    curr: Dict[str, int],
+    prev: Optional[Dict[str, int]],
+    trailing: List[Dict[str, int]],
+) -> pd.DataFrame:
+    """
+    한 모델의 기준 월 토큰 빈도를 전월/직전 N개월 평균과 비교한다.
+
+    - 비중(share) = 토큰 빈도 / 월 전체 토큰 수 (글 수가 달라도 비교 가능하도록)
+    - mom_lift      = log2(기준 월 비중 / 전월 비중)  (전월 없으면 0)
+    - trailing_lift = log2(기준 월 비중 / 직전 N개월 합산 비중)
+    - trend_score   = trailing_lift × log(1 + max(기준 월 빈도, 직전 평균 빈도))
+      (빈도가 1~2회인 토큰의 큰 비율 변화가 상위를 차지하지 않도록 빈도로 가중)
+    """
+    prev = prev or {}
+    vocab_tokens = set(curr) | set(prev)
+    for t in trailing:
+        vocab_tokens |= set(t)
+    vocab = len(vocab_tokens)
+
+    df = pd.DataFrame(index=sorted(vocab_tokens))
+    df["curr_count"] = pd.Series(curr, dtype="float64")
+    df["prev_count"] = pd.Series(prev, dtype="float64")
+    df = df.fillna(0.0)
+
+    if trailing:
+        trail = pd.concat(
+            [pd.Series(t, dtype="float64") for t in trailing], axis=1
+        ).reindex(df.index).fillna(0.0)
+        trail_sum = trail.sum(axis=1)
+        trail_total = float(sum(sum(t.values()) for t in trailing))
+        df["trailing_avg"] = trail_sum / len(trailing)
+    else:
+        trail_sum = df["prev_count"]
+        trail_total = float(sum(prev.values()))
+        df["trailing_avg"] = df["prev_count"]
+
+    curr_share = _smoothed_share(df["curr_count"], float(sum(curr.values())), vocab)
+    prev_share = _smoothed_share(df["prev_count"], float(sum(prev.values())), vocab)
+    trail_share = _smoothed_share(trail_sum, trail_total, vocab)
+
+    # 전월 데이터가 없으면 전월 대비 값은 0 (trailing_lift 만 의미 있음)
+    df["mom_lift"] = (curr_share / prev_share).map(math.log2) if prev else 0.0
+    df["trailing_lift"] = (curr_share / trail_share).map(math.log2)
+    df["trend_score"] = df["trailing_lift"] * (
+        df[["curr_count", "trailing_avg"]].max(axis=1).map(math.log1p)
+    )
+    df.index.name = "token"
+    return df.reset_index()
+
+
+def select_trending(
+    scored: pd.DataFrame, top_k: int = 20, min_count: int = 3
+) -> pd.DataFrame:
+    """급상승(up) / 급하락(down) 토큰을 각각 top_k 개씩 골라 순위를 붙인다."""
+    up = scored[(scored["trend_score"] > 0) & (scored["curr_count"] >= min_count)]
+    up = up.sort_values(["trend_score", "token"], ascending=[False, True]).head(top_k)
+
+    base = scored[["prev_count", "trailing_avg"]].max(axis=1)
+    down = scored[(scored["trend_score"] < 0) & (base >= min_count)]
+    down = down.sort_values(["trend_score", "token"], ascending=[True, True]).head(top_k)
+
+    up = up.assign(direction="up", trend_rank=range(1, len(up) + 1))
+    down = down.assign(direction="down", trend_rank=range(1, len(down) + 1))
+    return pd.concat([up, down], ignore_index=True)
+
+
+def write_trends(
+    engine: Engine, month: datetime.date, model_ids: List[int], trends: pd.DataFrame
+) -> int:
+    """기준 월 대상 모델의 기존 행을 지우고 새 결과를 한 트랜잭션으로 넣는다."""
+    delete_sql = text(
+        """
+        DELETE FROM blog_token_trend
+        WHERE month = :month
+          AND model_id IN :model_ids
+        """
+    ).bindparams(bindparam("model_ids", expanding=True))
+    insert_sql = text(
+        """
+        INSERT INTO blog_token_trend (
+            model_id, month, token, direction, trend_rank,
+            curr_count, prev_count, trailing_avg,
+            mom_lift, trailing_lift, trend_score
+        )
+        VALUES (
+            :model_id, :month, :token, :direction, :trend_rank,
+            :curr_count, :prev_count, :trailing_avg,
+            :mom_lift, :trailing_lift, :trend_score
+        )
+        """
+    )
+
+    rows = [
+        {
+            "model_id": int(r.model_id),
+            "month": month,
+            "token": r.token,
+            "direction": r.direction,
+            "trend_rank": int(r.trend_rank),
+            "curr_count": int(r.curr_count),
+            "prev_count": int(r.prev_count),
+            "trailing_avg": round(float(r.trailing_avg), 4),
+            "mom_lift": round(float(r.mom_lift), 4),
+            "trailing_lift": round(float(r.trailing_lift), 4),
+            "trend_score": round(float(r.trend_score), 4),
+        }
+        for r in trends.itertuples(index=False)
+    ]
+
+    with engine.begin() as conn:
+        if model_ids:
+            conn.execute(delete_sql, {"month": month, "model_ids": model_ids})
+        if rows:
+            conn.execute(insert_sql, rows)
+    return len(rows)
+
+
+def compute_token_trends(
+    month: datetime.date,
+    trailing_months: int = 3,
+    top_k: int = 20,
+    min_count: int = 3,
+    backfill: bool = False,
+    kiwi_workers: int = -1,
+    engine: Engine | None = None,
+) -> int:
+    """
+    기준 월의 모델별 키워드 증감을 계산해 blog_token_trend 에 저장한다.
+    return: 저장한 행 수
+    """
+    engine = engine or get_write_engine()
+    months = [shift_month(month, -i) for i in range(trailing_months + 1)]
+
+    if backfill:
+        filled = backfill_token_counts(engine, months, kiwi_workers=kiwi_workers)
+        print(f"[INFO] blog_token_counts 백필: {filled}개 (model, month)")
+
+    started = time.perf_counter()
+    counts = load_token_counts(engine, months)
+    model_ids = sorted({mid for (mid, m) in counts if m == month})
+    if not model_ids:
+        print(f"[WARN] {month} 의 blog_token_counts 데이터가 없습니다. (--backfill 확인)")
+        return 0
+
+    frames: List[pd.DataFrame] = []
+    skipped = 0
+    for model_id in model_ids:
+        history = [counts.get((model_id, m)) for m in months[1:]]
+        trailing = [h for h in history if h]
+        if not trailing:
+            skipped += 1  # 비교할 이전 월이 없음
+            continue
+
+        scored = score_model_tokens(counts[(model_id, month)], history[0], trailing)
+        picked = select_trending(scored, top_k=top_k, min_count=min_count)
+        if not picked.empty:
+            frames.append(picked.assign(model_id=model_id))
+
+    trends = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    written = write_trends(engine, month, model_ids, trends)
+    print(
+        f"[INFO] 키워드 증감 계산 완료: month={month}, 모델 {len(model_ids)}개 "
+        f"(이전 월 없음 {skipped}개), 저장 {written}행, {time.perf_counter() - started:.1f}s"
+    )
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="blog_token_counts 기반 월간 키워드 증감(급상승/급하락) 계산"
+    )
+    parser.add_argument("--run-id", required=False, help="실행 ID (로그용)")
+    parser.add_argument(
+        "--month",
+        type=str,
+        default=None,
+        help="기준 월 (YYYY-MM 또는 YYYY-MM-DD, default: blog_token_counts 최신 월)",
+    )
+    parser.add_argument(
+        "--trailing-months", type=int, default=3, help="비교할 직전 개월 수 (기본 3)"
+    )
+    parser.add_argument(
+        "--top-k", type=int, default=20, help="모델별 급상승/급하락 각각 저장할 개수"
+    )
+    parser.add_argument(
+        "--min-count", type=int, default=3, help="후보로 인정할 최소 등장 횟수"
+    )
+    parser.add_argument(
+        "--backfill",
+        action="store_true",
+        help="blog_token_counts 가 없는 월은 blog_article 본문을 다시 토큰화해 채움",
+    )
+    parser.add_argument(
+        "--kiwi-workers", type=int, default=-1, help="백필 토큰화 스레드 수 (-1 = 전부)"
+    )
+    args = parser.parse_args()
+
+    engine = get_write_engine()
+    month = parse_month_arg(args.month, engine)
+    if month is None:
+        print("[WARN] blog_token_counts 데이터가 없습니다. --month 와 --backfill 을 지정하세요.")
+        return
+    print(f"[INFO] 키워드 증감 기준 월 = {month}")
+
+    ledger = RunLedger("compute_token_trends", run_id=args.run_id, engine=engine)
+    with ledger.stage("compute_trends") as m:
+        written = compute_token_trends(
+            month,
+            trailing_months=args.trailing_months,
+            top_k=args.top_k,
+            min_count=args.min_count,
+            backfill=args.backfill,
+            kiwi_workers=args.kiwi_workers,
+            engine=engine,
+        )
+        m.add(rows_written=written)
+        m.extra.update(month=str(month), backfill=bool(args.backfill))
+
+
+if __name__ == "__main__":
+    main()
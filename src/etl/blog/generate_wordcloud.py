@@ -4,20 +4,29 @@ from __future__ import annotations
 
 import argparse
 import datetime
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, Iterator, List, Tuple, Any, Optional
 
 from wordcloud import WordCloud
-import matplotlib.pyplot as plt
 from matplotlib import font_manager as fm
 
 from sqlalchemy import text
 
-from src.db.connection import get_engine
+from src.db.connection import get_write_engine
+from src.db.streaming import DEFAULT_CHUNK_SIZE, iter_row_chunks
+from src.etl.run_ledger import RunLedger
 
 
 BASE_DIR = Path(__file__).resolve().parents[3]
 
+# 마지막 렌더 당시 토큰 해시를 기록하는 파일 (월별 출력 디렉토리 안)
+MANIFEST_NAME = "manifest.json"
+
 DEFAULT_FONT_CANDIDATES = [
     "NanumGothic",
     "NanumSquare",
@@ -64,6 +73,42 @@ def parse_month_arg(month_str: str | None) -> datetime.date:
     return datetime.datetime.strptime(month_str, "%Y-%m-%d").date()
 
 
+def iter_token_counts_by_model(
+    month: datetime.date,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Tuple[int, Dict[str, int]]]:
+    """
+    blog_token_monthly 에서 해당 month 의 토큰 빈도를
+    model_id 별로 묶어 (model_id, {token: total_count}) 로 하나씩 돌려준다.
+    model_id 순으로 정렬된 결과를 서버 측 커서로 읽으므로 한 번에 한 모델의 토큰만 들고 있다.
+    """
+    engine = get_write_engine()
+    sql = """
+        SELECT
+            bt.model_id,
+            bt.token,
+            bt.total_count
+        FROM blog_token_monthly bt
+        WHERE bt.month = :month
+        ORDER BY bt.model_id, bt.token_rank
+    """
+
+    current_id: Optional[int] = None
+    tokens: Dict[str, int] = {}
+    for chunk in iter_row_chunks(engine, sql, {"month": month}, chunk_size=chunk_size):
+        for row in chunk:
+            mid = row["model_id"]
+            if mid != current_id:
+                if current_id is not None:
+                    yield current_id, tokens
+                current_id, tokens = mid, {}
+            # 중복 토큰이 있을 일은 없지만, 혹시 모르니 누적
+            tokens[row["token"]] = tokens.get(row["token"], 0) + row["total_count"]
+
+    if current_id is not None:
+        yield current_id, tokens
+
+
 def load_token_counts_by_model(
     month: datetime.date,
     limit_models: int | None = None,
@@ -71,6 +116,7 @@ def load_token_counts_by_model(
     """
     blog_token_monthly 에서 해당 month 의 토큰 빈도를
     model_id 별로 묶어서 반환.
+    limit_models 가 있으면 앞에서 N개 모델까지만 읽고 커서를 닫는다.
 
     return:
         {
@@ -78,41 +124,15 @@ def load_token_counts_by_model(
             ...
         }
     """
-    engine = get_engine(echo=False)
-    sql = text(
-        """
-        SELECT
-            bt.model_id,
-            bt.token,
-            bt.total_count
-        FROM blog_token_monthly bt
-        WHERE bt.month = :month
-        ORDER BY bt.model_id, bt.token_rank
-        """
-    )
-
     result: Dict[int, Dict[str, int]] = {}
-    with engine.connect() as conn:
-        rows = conn.execute(sql, {"month": month}).mappings().all()
-
-    for row in rows:
-        mid = row["model_id"]
-        token = row["token"]
-        count = row["total_count"]
-        if mid not in result:
-            result[mid] = {}
-        # 중복 토큰이 있을 일은 없지만, 혹시 모르니 누적
-        result[mid][token] = result[mid].get(token, 0) + count
-
-    # limit_models 가 있으면 앞에서 일부만 자르기
-    if limit_models is not None:
-        limited: Dict[int, Dict[str, int]] = {}
-        for i, (mid, tokens) in enumerate(result.items()):
-            if i >= limit_models:
+    models = iter_token_counts_by_model(month)
+    try:
+        for mid, tokens in models:
+            if limit_models is not None and len(result) >= limit_models:
                 break
-            limited[mid] = tokens
-        return limited
-
+            result[mid] = tokens
+    finally:
+        models.close()
     return result
 
 
@@ -126,7 +146,7 @@ def load_model_names(model_ids: List[int]) -> Dict[int, Tuple[str, str]]:
     if not model_ids:
         return {}
 
-    engine = get_engine(echo=False)
+    engine = get_write_engine()
     sql = text(
         """
         SELECT model_id, brand_name, model_name_kr
@@ -176,6 +196,53 @@ def build_filename(
     return out_dir / name
 
 
+def token_hash(
+    tokens: Dict[str, int],
+    font_path: str | None,
+    width: int,
+    height: int,
+    max_words: int,
+) -> str:
+    """
+    토큰 빈도 + 렌더링 옵션으로 만든 해시.
+    이전 렌더와 같으면 이미지가 바뀔 이유가 없으므로 다시 그리지 않는다.
+    """
+    payload = json.dumps(
+        {
+            "tokens": sorted(tokens.items()),
+            "font_path": font_path,
+            "width": width,
+            "height": height,
+            "max_words": max_words,
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def load_manifest(out_dir: Path) -> Dict[str, Dict[str, str]]:
+    """{model_id(str): {"hash": ..., "image_path": ...}}"""
+    path = out_dir / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        print(f"[WARN] manifest 읽기 실패, 전체 다시 생성: {path} ({e})")
+        return {}
+
+
+def save_manifest(out_dir: Path, manifest: Dict[str, Dict[str, str]]) -> None:
+    path = out_dir / MANIFEST_NAME
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(
+        json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True),
+        encoding="utf-8",
+    )
+    tmp.replace(path)
+
+
 def generate_wordcloud_image(
     tokens: Dict[str, int],
     output_path: Path,
@@ -186,14 +253,14 @@ def generate_wordcloud_image(
 ) -> None:
     """
     주어진 토큰 빈도로 워드클라우드 이미지 생성 후 파일 저장.
+    font_path 는 resolve_font_path 로 미리 찾아 둔 경로를 넘긴다. (모델마다 폰트 탐색 X)
+    matplotlib 를 거치지 않고 WordCloud 배열을 바로 PNG 로 쓴다.
     """
     if not tokens:
         return
 
-    resolved_font = resolve_font_path(font_path)
-
     wc = WordCloud(
-        font_path=resolved_font,
+        font_path=font_path,
         width=width,
         height=height,
         background_color="white",
@@ -202,15 +269,29 @@ def generate_wordcloud_image(
 
     wc.generate_from_frequencies(tokens)
 
-    # matplotlib 로 저장 (한 번도 plt.show() 안 쓰고 바로 저장)
-    plt.figure(figsize=(width / 100, height / 100))
-    plt.imshow(wc, interpolation="bilinear")
-    plt.axis("off")
-    plt.tight_layout(pad=0)
-
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, bbox_inches="tight", pad_inches=0)
-    plt.close()
+    wc.to_file(str(output_path))
+
+
+def _render_task(
+    model_id: int,
+    tokens: Dict[str, int],
+    output_path: Path,
+    font_path: str | None,
+    width: int,
+    height: int,
+    max_words: int,
+) -> int:
+    """프로세스 풀 워커용 (피클 가능한 최상위 함수)."""
+    generate_wordcloud_image(
+        tokens=tokens,
+        output_path=output_path,
+        font_path=font_path,
+        width=width,
+        height=height,
+        max_words=max_words,
+    )
+    return model_id
 
 
 def upsert_blog_wordcloud(
@@ -222,36 +303,42 @@ def upsert_blog_wordcloud(
     blog_wordcloud 에 (model_id, month) 기준 upsert.
     image_path 는 프로젝트 루트 기준 상대 경로로 넣는다.
     """
-    engine = get_engine(echo=False)
+    upsert_blog_wordclouds(
+        [{"model_id": model_id, "month": month, "image_path": image_path}]
+    )
+
+
+def upsert_blog_wordclouds(rows: List[Dict[str, Any]]) -> int:
+    """
+    여러 모델의 blog_wordcloud 행을 한 트랜잭션에서 upsert (executemany).
+    rows: [{"model_id", "month", "image_path"}, ...]
+    """
+    if not rows:
+        return 0
+
+    engine = get_write_engine()
+    # VALUES 에는 바인드 파라미터만 (docs/etl_planning.md "적재 SQL 공통 규칙")
     sql = text(
         """
         INSERT INTO blog_wordcloud (
             model_id,
             month,
-            image_path,
-            generated_at
+            image_path
         )
         VALUES (
             :model_id,
             :month,
-            :image_path,
-            NOW()
+            :image_path
         )
         ON DUPLICATE KEY UPDATE
-            image_path  = VALUES(image_path),
-            generated_at = VALUES(generated_at)
+            image_path   = VALUES(image_path),
+            generated_at = CURRENT_TIMESTAMP
         """
     )
 
     with engine.begin() as conn:
-        conn.execute(
-            sql,
-            {
-                "model_id": model_id,
-                "month": month,
-                "image_path": image_path,
-            },
-        )
+        conn.execute(sql, rows)
+    return len(rows)
 
 
 def main():
@@ -295,6 +382,17 @@ def main():
         default=100,
         help="워드클라우드에 사용할 최대 단어 수",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="렌더링 프로세스 수 (1 이면 현재 프로세스에서 순차 처리)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="토큰이 바뀌지 않은 모델도 다시 렌더링",
+    )
     args = parser.parse_args()
 
     month = parse_month_arg(args.month)
@@ -311,30 +409,104 @@ def main():
     out_dir = ensure_output_dir(month)
     print(f"[INFO] 출력 디렉토리: {out_dir}")
 
+    # 폰트는 실행당 한 번만 탐색
+    font_path = resolve_font_path(args.font_path)
+    manifest = {} if args.force else load_manifest(out_dir)
+
+    # 1) 토큰 해시가 지난 렌더와 같고 이미지도 남아 있으면 스킵
+    jobs: List[Dict[str, Any]] = []
+    skipped = 0
     for model_id, tokens in token_by_model.items():
+        if not tokens:
+            continue
         brand, model_name = model_names.get(model_id, (None, None))
-
         output_path = build_filename(out_dir, model_id, brand, model_name)
-        rel_path = output_path.relative_to(BASE_DIR)
+        digest = token_hash(tokens, font_path, args.width, args.height, args.max_words)
 
-        print(
-            f"[INFO] 모델 {model_id} ({brand} {model_name}) "
-            f"워드클라우드 생성 → {rel_path}"
-        )
+        prev = manifest.get(str(model_id))
+        if prev and prev.get("hash") == digest and output_path.exists():
+            skipped += 1
+            continue
 
-        generate_wordcloud_image(
-            tokens=tokens,
-            output_path=output_path,
-            font_path=args.font_path,
-            width=args.width,
-            height=args.height,
-            max_words=args.max_words,
+        jobs.append(
+            {
+                "model_id": model_id,
+                "label": f"{brand} {model_name}",
+                "tokens": tokens,
+                "output_path": output_path,
+                "hash": digest,
+            }
         )
 
-        upsert_blog_wordcloud(
-            model_id=model_id,
-            month=month,
-            image_path=str(rel_path),
+    print(
+        f"[INFO] 렌더링 대상 {len(jobs)}개, 변경 없음 스킵 {skipped}개 "
+        f"(workers={args.workers})"
+    )
+    ledger = RunLedger("generate_wordcloud", run_id=args.run_id)
+    if not jobs:
+        print("[INFO] 새로 생성할 워드클라우드가 없습니다.")
+        with ledger.stage("render") as m:
+            m.add(rows_read=len(token_by_model), rows_skipped=skipped)
+        return
+
+    with ledger.stage("render") as m:
+        # 2) 변경된 모델만 프로세스 풀로 렌더링
+        started = time.perf_counter()
+        job_by_id = {j["model_id"]: j for j in jobs}
+        done: List[int] = []
+
+        def _on_done(model_id: int) -> None:
+            job = job_by_id[model_id]
+            rel_path = job["output_path"].relative_to(BASE_DIR)
+            print(f"[INFO] 모델 {model_id} ({job['label']}) 워드클라우드 생성 → {rel_path}")
+            done.append(model_id)
+
+        render_opts = {
+            "font_path": font_path,
+            "width": args.width,
+            "height": args.height,
+            "max_words": args.max_words,
+        }
+        if args.workers <= 1 or len(jobs) == 1:
+            for j in jobs:
+                try:
+                    _on_done(
+                        _render_task(j["model_id"], j["tokens"], j["output_path"], **render_opts)
+                    )
+                except Exception as e:
+                    print(f"[WARN] 모델 {j['model_id']} 워드클라우드 생성 실패: {e}")
+        else:
+            with ProcessPoolExecutor(max_workers=min(args.workers, len(jobs))) as pool:
+                futures = {
+                    pool.submit(
+                        _render_task, j["model_id"], j["tokens"], j["output_path"], **render_opts
+                    ): j["model_id"]
+                    for j in jobs
+                }
+                for future in as_completed(futures):
+                    try:
+                        _on_done(future.result())
+                    except Exception as e:
+                        print(f"[WARN] 모델 {futures[future]} 워드클라우드 생성 실패: {e}")
+
+        print(f"[INFO] 렌더링 완료: {len(done)}/{len(jobs)}개, {time.perf_counter() - started:.1f}s")
+
+        # 3) DB upsert 한 번 + manifest 갱신
+        rows = []
+        for model_id in done:
+            job = job_by_id[model_id]
+            rel_path = str(job["output_path"].relative_to(BASE_DIR))
+            rows.append({"model_id": model_id, "month": month, "image_path": rel_path})
+            manifest[str(model_id)] = {"hash": job["hash"], "image_path": rel_path}
+
+        upsert_blog_wordclouds(rows)
+        save_manifest(out_dir, manifest)
+        m.add(
+            rows_read=len(token_by_model),
+            rows_written=len(done),
+            rows_skipped=skipped,
+            errors=len(jobs) - len(done),
+            bytes=sum(job_by_id[mid]["output_path"].stat().st_size for mid in done),
         )
 
     print("[INFO] 워드클라우드 생성/저장/DB upsert 완료")
@@ -0,0 +1,248 @@
+# src/etl/blog/html_extractor.py
+
+from __future__ import annotations
+
+import re
+from typing import List, Optional, Tuple
+from urllib.parse import parse_qs, urljoin, urlparse
+
+# 바깥 페이지(블로그 글 URL)에서 본문을 찾는 순서
+OUTER_CONTENT_SELECTORS = [
+    "div.se-main-container",  # 스마트에디터 3.0
+    "div#content",  # 구형 에디터
+]
+
+# iframe 안쪽(PostView) 페이지에서 본문을 찾는 순서
+INNER_CONTENT_SELECTORS = [
+    "div.se-main-container",
+    "div#postViewArea",
+    "div#contentArea",
+]
+
+IFRAME_SELECTOR = "iframe#mainFrame"
+
+_NAVER_BLOG_HOSTS = {"blog.naver.com", "m.blog.naver.com"}
+_POST_PATH_RE = re.compile(r"^/(?P<blog_id>[A-Za-z0-9_\-]+)/(?P<log_no>\d+)/?$")
+
+
+def to_postview_url(url: str) -> str:
+    """
+    blog.naver.com/<blogId>/<logNo> 형태의 URL 을
+    본문이 바로 들어있는 PostView URL 로 바꾼다. (iframe 한 단계 요청 생략)
+    네이버 블로그 글 URL 이 아니면 그대로 돌려준다.
+    """
+    parsed = urlparse(url)
+    if parsed.netloc not in _NAVER_BLOG_HOSTS:
+        return url
+
+    blog_id = log_no = None
+    m = _POST_PATH_RE.match(parsed.path)
+    if m:
+        blog_id, log_no = m.group("blog_id"), m.group("log_no")
+    else:
+        # blog.naver.com/<blogId>?Redirect=Log&logNo=<logNo> 형태
+        qs = parse_qs(parsed.query)
+        if "logNo" in qs:
+            log_no = qs["logNo"][0]
+            blog_id = (qs.get("blogId") or [parsed.path.strip("/")])[0]
+
+    if not blog_id or not log_no or blog_id.lower().startswith("postview"):
+        return url
+    return f"https://blog.naver.com/PostView.naver?blogId={blog_id}&logNo={log_no}"
+
+
+# -----------------------------
+# 파서 백엔드
+# -----------------------------
+class Bs4Backend:
+    """BeautifulSoup + html.parser (순수 Python, 항상 사용 가능)."""
+
+    name = "bs4"
+
+    def __init__(self):
+        from bs4 import BeautifulSoup
+
+        self._soup = BeautifulSoup
+
+    def parse(self, html: str):
+        return self._soup(html, "html.parser")
+
+    def select_text(self, doc, selector: str) -> Optional[str]:
+        el = doc.select_one(selector)
+        return el.get_text(separator="\n") if el is not None else None
+
+    def select_attr(self, doc, selector: str, attr: str) -> Optional[str]:
+        el = doc.select_one(selector)
+        return el.get(attr) if el is not None else None
+
+    def full_text(self, doc) -> str:
+        return doc.get_text(separator="\n")
+
+
+def _simple_css_to_xpath(selector: str) -> str:
+    """
+    이 모듈에서 쓰는 단순 선택자(tag.class / tag#id / #id)만 XPath 로 바꾼다.
+    (cssselect 의존성 없이 lxml 만으로 동작하도록)
+    """
+    m = re.fullmatch(r"(?P<tag>[a-zA-Z0-9]*)(?:(?P<kind>[.#])(?P<name>[\w\-]+))?", selector)
+    if not m:
+        raise ValueError(f"지원하지 않는 선택자: {selector}")
+    tag = m.group("tag") or "*"
+    kind, name = m.group("kind"), m.group("name")
+    if kind == "#":
+        return f"//{tag}[@id='{name}']"
+    if kind == ".":
+        return (
+            f"//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {name} ')]"
+        )
+    return f"//{tag}"
+
+
+class LxmlBackend:
+    """lxml.html (libxml2, C 파서)."""
+
+    name = "lxml"
+
+    def __init__(self):
+        import lxml.etree
+        import lxml.html
+
+        self._html = lxml.html
+        self._parse_errors = (lxml.etree.ParserError, ValueError)
+        # 이미 str 로 디코딩된 HTML 을 utf-8 bytes 로 넘기므로 문서 안의 encoding 선언은 무시
+        self._parser = lxml.html.HTMLParser(encoding="utf-8")
+        self._xpath_cache = {}
+
+    def parse(self, html: str):
+        """
+        str 에 <?xml ... encoding=...?> 선언이 있으면 lxml 이 ValueError 를 내므로 bytes 로 파싱한다.
+        빈 본문(ParserError: Document is empty)은 None → 빈 텍스트로 처리 (bs4 와 같은 결과)
+        """
+        try:
+            return self._html.document_fromstring(html.encode("utf-8"), parser=self._parser)
+        except self._parse_errors:
+            return None
+
+    def _first(self, doc, selector: str):
+        if doc is None:
+            return None
+        xpath = self._xpath_cache.get(selector)
+        if xpath is None:
+            xpath = self._xpath_cache[selector] = _simple_css_to_xpath(selector)
+        found = doc.xpath(xpath)
+        return found[0] if found else None
+
+    def select_text(self, doc, selector: str) -> Optional[str]:
+        el = self._first(doc, selector)
+        return "\n".join(el.itertext()) if el is not None else None
+
+    def select_attr(self, doc, selector: str, attr: str) -> Optional[str]:
+        el = self._first(doc, selector)
+        return el.get(attr) if el is not None else None
+
+    def full_text(self, doc) -> str:
+        return "\n".join(doc.itertext()) if doc is not None else ""
+
+
+class SelectolaxBackend:
+    """selectolax (lexbor, C 파서 + 내장 CSS 선택자). 설치되어 있을 때만 사용."""
+
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+
+        self._parser = LexborHTMLParser
+
+    def parse(self, html: str):
+        return self._parser(html)
+
+    def select_text(self, doc, selector: str) -> Optional[str]:
+        el = doc.css_first(selector)
+        return el.text(separator="\n") if el is not None else None
+
+    def select_attr(self, doc, selector: str, attr: str) -> Optional[str]:
+        el = doc.css_first(selector)
+        return el.attributes.get(attr) if el is not None else None
+
+    def full_text(self, doc) -> str:
+        root = doc.body or doc.root
+        return root.text(separator="\n") if root is not None else ""
+
+
+BACKENDS = {
+    "selectolax": SelectolaxBackend,
+    "lxml": LxmlBackend,
+    "bs4": Bs4Backend,
+}
+
+
+def available_backends() -> List[str]:
+    names: List[str] = []
+    for name, cls in BACKENDS.items():
+        try:
+            cls()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_backend(name: str = "auto"):
+    """
+    파서 백엔드 선택. auto 면 selectolax → lxml → bs4 순으로 설치된 것을 사용.
+    """
+    if name != "auto":
+        return BACKENDS[name]()
+
+    for cls in BACKENDS.values():
+        try:
+            return cls()
+        except ImportError:
+            continue
+    raise RuntimeError("사용 가능한 HTML 파서가 없습니다.")
+
+
+class BlogHtmlExtractor:
+    """
+    블로그 HTML 에서 본문 컨테이너 텍스트만 뽑아내는 추출기.
+    페이지당 한 번만 파싱하고, 선택자 순서대로 첫 번째로 찾은 컨테이너를 사용한다.
+    """
+
+    def __init__(self, backend: str = "auto"):
+        self.backend = get_backend(backend)
+
+    @property
+    def name(self) -> str:
+        return self.backend.name
+
+    def extract(self, html: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        return: (본문 텍스트, iframe URL)
+          - 본문을 찾으면 (text, None)
+          - iframe#mainFrame 만 있으면 (None, iframe_url)
+          - 둘 다 없으면 (전체 텍스트, None)
+        """
+        doc = self.backend.parse(html)
+
+        for selector in OUTER_CONTENT_SELECTORS:
+            found = self.backend.select_text(doc, selector)
+            if found is not None:
+                return found, None
+
+        src = self.backend.select_attr(doc, IFRAME_SELECTOR, "src")
+        if src:
+            return None, urljoin("https://blog.naver.com", src)
+
+        return self.backend.full_text(doc), None
+
+    def extract_inner(self, html: str) -> str:
+        """iframe 안쪽(PostView) HTML 에서 본문 텍스트를 찾는다."""
+        doc = self.backend.parse(html)
+
+        for selector in INNER_CONTENT_SELECTORS:
+            found = self.backend.select_text(doc, selector)
+            if found is not None:
+                return found
+
+        return self.backend.full_text(doc)
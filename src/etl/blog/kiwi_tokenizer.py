@@ -0,0 +1,130 @@
+# src/etl/blog/kiwi_tokenizer.py
+
+from __future__ import annotations
+
+import collections
+import time
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+_kiwi = None
+_kiwi_workers: Optional[int] = None
+
+
+@dataclass
+class TokenizeStats:
+    articles: int = 0
+    tokens: int = 0
+    seconds: float = 0.0
+
+    @property
+    def tokens_per_sec(self) -> float:
+        return self.tokens / self.seconds if self.seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"articles={self.articles}, tokens={self.tokens}, "
+            f"elapsed={self.seconds:.2f}s, tokens/sec={self.tokens_per_sec:,.0f}"
+        )
+
+
+def get_kiwi(num_workers: int = -1):
+    """
+    Kiwi 인스턴스를 처음 쓸 때 한 번만 만든다.
+    (import 시점에 모델을 로드하지 않으므로 --help 등은 바로 끝난다)
+
+    num_workers: Kiwi 내부 스레드 수 (-1 = 가용 코어 전부, 0 = 단일 스레드)
+    """
+    global _kiwi, _kiwi_workers
+    if _kiwi is None or _kiwi_workers != num_workers:
+        from kiwipiepy import Kiwi
+
+        _kiwi = Kiwi(num_workers=num_workers)
+        _kiwi_workers = num_workers
+    return _kiwi
+
+
+def iter_nouns(tokens) -> Iterator[str]:
+    """
+    Kiwi 토큰 결과에서 명사류(N*) 만 골라낸다.
+    (2글자 미만 / 숫자만 있는 토큰은 제외)
+    """
+    for w in tokens:
+        if w.tag.startswith("N"):
+            form = w.form.strip()
+            if len(form) > 1 and not form.isdigit():
+                yield form
+
+
+def count_tokens_by_group(
+    groups: Dict[Hashable, List[str]],
+    num_workers: int = -1,
+) -> Tuple[Dict[Hashable, collections.Counter], TokenizeStats]:
+    """
+    {key: [본문, ...]} 를 한 번의 Kiwi 배치 호출로 토큰화해
+    key 별 명사 Counter 를 만든다.
+
+    - kiwi.tokenize(iterable) 는 내부 스레드 풀에서 병렬 분석 후 입력 순서대로 결과를 돌려준다.
+    - 중간 토큰 리스트를 만들지 않고 Counter 에 바로 누적한다.
+    """
+    keys: List[Hashable] = []
+    texts: List[str] = []
+    for key, group_texts in groups.items():
+        for t in group_texts:
+            if t and t.strip():
+                keys.append(key)
+                texts.append(t)
+
+    counters: Dict[Hashable, collections.Counter] = {
+        key: collections.Counter() for key in groups
+    }
+    stats = TokenizeStats(articles=len(texts))
+    if not texts:
+        return counters, stats
+
+    kiwi = get_kiwi(num_workers)
+    started = time.perf_counter()
+    if num_workers == 0:
+        # 단일 스레드 모드에서는 배치(async) 분석을 지원하지 않으므로 한 건씩 처리
+        results = (kiwi.tokenize(t) for t in texts)
+    else:
+        results = kiwi.tokenize(texts)
+
+    for key, tokens in zip(keys, results):
+        counter = counters[key]
+        for form in iter_nouns(tokens):
+            counter[form] += 1
+            stats.tokens += 1
+    stats.seconds = time.perf_counter() - started
+
+    return counters, stats
+
+
+def count_tokens(texts: Iterable[str], num_workers: int = -1) -> collections.Counter:
+    """본문 리스트 전체를 하나의 Counter 로 센다."""
+    counters, _ = count_tokens_by_group({0: list(texts)}, num_workers=num_workers)
+    return counters[0]
+
+
+def sorted_token_counts(counter: collections.Counter) -> List[Tuple[str, int]]:
+    """빈도 내림차순, 같은 빈도는 토큰 사전순."""
+    return sorted(counter.items(), key=lambda x: (-x[1], x[0]))
+
+
+def distribution_shift(
+    before: collections.Counter, after: collections.Counter, top_k: int = 50
+) -> float:
+    """
+    두 토큰 빈도 분포의 차이 (상위 top_k 토큰 기준 total variation distance, 0~1).
+    글을 더 모아도 이 값이 작으면 상위 키워드 분포가 수렴했다고 본다.
+    """
+    if not before or not after:
+        return 1.0
+    tokens = {t for t, _ in after.most_common(top_k)} | {
+        t for t, _ in before.most_common(top_k)
+    }
+    total_before = sum(before[t] for t in tokens) or 1
+    total_after = sum(after[t] for t in tokens) or 1
+    return 0.5 * sum(
+        abs(before[t] / total_before - after[t] / total_after) for t in tokens
+    )
@@ -0,0 +1,286 @@
+# src/etl/blog/minhash.py
+
+from __future__ import annotations
+
+import datetime
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+# 시그니처 길이 / LSH 밴드 구성 (NUM_PERM = BANDS × ROWS)
+# BANDS=8, ROWS=8 → 유사도 약 0.77 부근부터 후보로 잡힌다.
+NUM_PERM = 64
+BANDS = 8
+ROWS = NUM_PERM // BANDS
+
+# 문자 단위 shingle 길이 (한국어는 공백 토큰이 의미 단위와 맞지 않아 문자 n-gram 사용)
+SHINGLE_SIZE = 5
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+# 저장된 시그니처와 호환되도록 순열 계수는 고정 시드로 만든다. (바꾸면 기존 시그니처 무효)
+_rng = np.random.RandomState(1)
+_PERM_A = _rng.randint(1, (1 << 61) - 1, size=NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.randint(0, (1 << 61) - 1, size=NUM_PERM, dtype=np.uint64)
+
+
+def shingles(text_body: str, k: int = SHINGLE_SIZE) -> Set[str]:
+    """공백/기호를 지운 소문자 텍스트의 문자 k-gram 집합."""
+    norm = _NON_WORD.sub("", (text_body or "").lower())
+    if len(norm) <= k:
+        return {norm} if norm else set()
+    return {norm[i : i + k] for i in range(len(norm) - k + 1)}
+
+
+def compute_signature(text_body: str) -> Optional[np.ndarray]:
+    """
+    MinHash 시그니처 (uint32 × NUM_PERM).
+    텍스트가 비어 있으면 None.
+    """
+    grams = shingles(text_body)
+    if not grams:
+        return None
+    hv = np.fromiter(
+        (zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams)
+    )
+    # (a·x + b) mod p 를 모든 순열에 대해 한 번에 계산 → 순열별 최솟값
+    phv = (np.outer(hv, _PERM_A) + _PERM_B) % _MERSENNE_PRIME & _MAX_HASH
+    return phv.min(axis=0).astype(np.uint32)
+
+
+def signature_to_bytes(sig: np.ndarray) -> bytes:
+    return sig.astype("<u4").tobytes()
+
+
+def bytes_to_signature(blob: bytes) -> np.ndarray:
+    return np.frombuffer(blob, dtype="<u4").astype(np.uint32)
+
+
+def estimate_jaccard(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.mean(a == b))
+
+
+class LshIndex:
+    """
+    MinHash LSH (밴딩) 인메모리 인덱스.
+    add 한 시그니처 중 query 시그니처와 추정 자카드 유사도가 threshold 이상인 키를 찾는다.
+    """
+
+    def __init__(self, threshold: float = 0.8):
+        self.threshold = threshold
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [
+            defaultdict(list) for _ in range(BANDS)
+        ]
+        self._sigs: Dict[Hashable, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._sigs)
+
+    @staticmethod
+    def _band_keys(sig: np.ndarray) -> Iterable[Tuple[int, bytes]]:
+        for band in range(BANDS):
+            yield band, sig[band * ROWS : (band + 1) * ROWS].tobytes()
+
+    def add(self, key: Hashable, sig: np.ndarray) -> None:
+        if key in self._sigs:
+            return
+        self._sigs[key] = sig
+        for band, band_key in self._band_keys(sig):
+            self._buckets[band][band_key].append(key)
+
+    def query(self, sig: np.ndarray) -> Optional[Tuple[Hashable, float]]:
+        """가장 유사한 (key, 추정 유사도). threshold 미만이면 None."""
+        candidates: Set[Hashable] = set()
+        for band, band_key in self._band_keys(sig):
+            candidates.update(self._buckets[band].get(band_key, ()))
+
+        best: Optional[Tuple[Hashable, float]] = None
+        for key in candidates:
+            sim = estimate_jaccard(sig, self._sigs[key])
+            if sim >= self.threshold and (best is None or sim > best[1]):
+                best = (key, sim)
+        return best
+
+
+class NearDuplicateFilter:
+    """
+    수집 파이프라인용 유사 중복 필터.
+
+    - check_snippet: 검색 API description 으로 본문 fetch 전에 중복 판정
+    - check_body: 본문으로 토큰화/저장 전에 중복 판정
+    - accept: 실제로 채택된 글만 이번 실행 인덱스에 추가해, 같은 실행 안의 재게시 글도 걸러낸다.
+      (본문 fetch 실패/본문 중복으로 버려진 글이 이후 글을 막지 않도록 check_* 는 조회만 한다)
+    """
+
+    def __init__(
+        self,
+        body_index: LshIndex,
+        snippet_index: LshIndex,
+        enabled: bool = True,
+    ):
+        self.body_index = body_index
+        self.snippet_index = snippet_index
+        self.enabled = enabled
+        self._body_sigs: Dict[str, np.ndarray] = {}
+        self._snippet_sigs: Dict[str, np.ndarray] = {}
+        self.stats: Dict[str, int] = {"snippet_dups": 0, "body_dups": 0}
+
+    @classmethod
+    def from_db(
+        cls,
+        engine: Engine,
+        since_month: Optional[datetime.date] = None,
+        threshold: float = 0.8,
+        enabled: bool = True,
+    ) -> "NearDuplicateFilter":
+        if not enabled:
+            return cls(LshIndex(threshold), LshIndex(threshold), enabled=False)
+        body_index, snippet_index = load_signature_indexes(engine, since_month, threshold)
+        return cls(body_index, snippet_index)
+
+    def check_snippet(self, url: str, snippet: str) -> Optional[Tuple[Hashable, float]]:
+        """스니펫이 기존 글과 유사하면 (매칭 키, 유사도), 아니면 None."""
+        sig = compute_signature(snippet)
+        if sig is None:
+            return None
+        if self.enabled:
+            hit = self.snippet_index.query(sig)
+            if hit is not None:
+                self.stats["snippet_dups"] += 1
+                return hit
+        self._snippet_sigs[url] = sig
+        return None
+
+    def check_body(self, url: str, body: str) -> Optional[Tuple[Hashable, float]]:
+        """본문이 기존 글과 유사하면 (매칭 키, 유사도), 아니면 None."""
+        sig = compute_signature(body)
+        if sig is None:
+            return None
+        if self.enabled:
+            hit = self.body_index.query(sig)
+            if hit is not None:
+                self.stats["body_dups"] += 1
+                return hit
+        self._body_sigs[url] = sig
+        return None
+
+    def accept(self, url: str) -> None:
+        """채택된 글의 스니펫/본문 시그니처를 이번 실행 인덱스에 추가한다."""
+        snippet_sig = self._snippet_sigs.get(url)
+        if snippet_sig is not None:
+            self.snippet_index.add(("run", url), snippet_sig)
+        body_sig = self._body_sigs.get(url)
+        if body_sig is not None:
+            self.body_index.add(("run", url), body_sig)
+
+    def signature_row(
+        self, url: str, model_id: int, month: datetime.date
+    ) -> Optional[Dict[str, object]]:
+        """write_signatures 에 넘길 행 (본문 시그니처가 없으면 None)."""
+        body_sig = self._body_sigs.get(url)
+        if body_sig is None:
+            return None
+        snippet_sig = self._snippet_sigs.get(url)
+        return {
+            "url": url,
+            "model_id": model_id,
+            "month": month,
+            "body_sig": signature_to_bytes(body_sig),
+            "snippet_sig": signature_to_bytes(snippet_sig) if snippet_sig is not None else None,
+        }
+
+
+# -----------------------------
+# DB (blog_article_signature)
+# -----------------------------
+UPSERT_SIGNATURE_SQL = text(
+    """
+    INSERT INTO blog_article_signature (
+        article_id,
+        model_id,
+        month,
+        body_sig,
+        snippet_sig
+    )
+    VALUES (
+        :article_id,
+        :model_id,
+        :month,
+        :body_sig,
+        :snippet_sig
+    )
+    ON DUPLICATE KEY UPDATE
+        body_sig    = VALUES(body_sig),
+        snippet_sig = VALUES(snippet_sig)
+    """
+)
+
+
+def load_signature_indexes(
+    engine: Engine,
+    since_month: Optional[datetime.date] = None,
+    threshold: float = 0.8,
+) -> Tuple[LshIndex, LshIndex]:
+    """
+    저장된 시그니처로 (본문 인덱스, 검색 스니펫 인덱스)를 만든다.
+    since_month 가 있으면 그 이후 월만 비교 대상으로 사용.
+    """
+    sql = """
+        SELECT article_id, body_sig, snippet_sig
+        FROM blog_article_signature
+    """
+    params: Dict[str, object] = {}
+    if since_month is not None:
+        sql += " WHERE month >= :since_month"
+        params["since_month"] = since_month
+
+    body_index = LshIndex(threshold)
+    snippet_index = LshIndex(threshold)
+    with engine.connect() as conn:
+        for article_id, body_sig, snippet_sig in conn.execute(text(sql), params):
+            body_index.add(("db", int(article_id)), bytes_to_signature(body_sig))
+            if snippet_sig:
+                snippet_index.add(("db", int(article_id)), bytes_to_signature(snippet_sig))
+    return body_index, snippet_index
+
+
+def write_signatures(conn: Connection, rows: List[Dict[str, object]]) -> int:
+    """
+    blog_article_signature upsert.
+    rows: [{"url", "model_id", "month", "body_sig", "snippet_sig"}, ...]
+    article_id 는 같은 트랜잭션에서 방금 upsert 한 blog_article 의 url 로 찾는다.
+    """
+    if not rows:
+        return 0
+
+    names = {f"u{i}": r["url"] for i, r in enumerate(rows)}
+    id_sql = text(
+        f"""
+        SELECT article_id, url
+        FROM blog_article
+        WHERE url IN ({", ".join(":" + n for n in names)})
+        """
+    )
+    id_by_url = {url: int(aid) for aid, url in conn.execute(id_sql, names)}
+
+    params = [
+        {
+            "article_id": id_by_url[r["url"]],
+            "model_id": r["model_id"],
+            "month": r["month"],
+            "body_sig": r["body_sig"],
+            "snippet_sig": r.get("snippet_sig"),
+        }
+        for r in rows
+        if r["url"] in id_by_url
+    ]
+    if params:
+        conn.execute(UPSERT_SIGNATURE_SQL, params)
+    return len(params)
@@ -3,19 +3,33 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import collections
 import datetime
 import os
 import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Tuple, Any
+from typing import List, Dict, Optional, Set, Tuple, Any
 
 import requests
 from bs4 import BeautifulSoup
-from kiwipiepy import Kiwi
 from sqlalchemy import text
-
-from src.db.connection import get_engine
+from sqlalchemy.engine import Connection, Engine
+
+from src.db.connection import get_write_engine
+from src.etl.blog.blog_fetcher import AsyncBlogFetcher, AsyncRateLimiter
+from src.etl.blog.html_extractor import BlogHtmlExtractor, to_postview_url
+from src.etl.blog.kiwi_tokenizer import (
+    TokenizeStats,
+    count_tokens_by_group,
+    distribution_shift,
+    sorted_token_counts,
+)
+from src.etl.blog.compute_token_trends import shift_month
+from src.etl.blog.minhash import NearDuplicateFilter, write_signatures
+from src.etl.blog.token_store import build_counts_row, write_token_counts
+from src.etl.run_ledger import RunLedger
 
 BASE_DIR = Path(__file__).resolve().parents[3]
 
@@ -23,11 +37,13 @@ BASE_DIR = Path(__file__).resolve().parents[3]
 # -----------------------------
 # DB 유틸
 # -----------------------------
-def get_models_for_blog_target(limit: int | None = None) -> List[Dict[str, Any]]:
+def get_models_for_blog_target(
+    limit: int | None = None, engine: Engine | None = None
+) -> List[Dict[str, Any]]:
     """
     워드클라우드/블로그 수집 대상 car_model 목록을 가져온다.
     """
-    engine = get_engine(echo=False)
+    engine = engine or get_write_engine()
     sql = text(
         """
         SELECT model_id, brand_name, model_name_kr
@@ -44,251 +60,195 @@ def get_models_for_blog_target(limit: int | None = None) -> List[Dict[str, Any]]
     return rows
 
 
-def has_tokens_for_month(model_id: int, month: datetime.date) -> bool:
+def fetch_collected_model_months(
+    month: datetime.date, engine: Engine | None = None
+) -> Set[Tuple[int, datetime.date]]:
     """
-    이미 해당 model_id + month에 blog_token_monthly 데이터가 있는지 확인.
-    있으면 이번 수집은 스킵.
+    해당 month 에 blog_token_monthly 데이터가 이미 있는 (model_id, month) 집합.
+    모델마다 존재 여부를 따로 묻지 않고 한 번의 쿼리로 미리 읽어 둔다.
     """
-    engine = get_engine(echo=False)
+    engine = engine or get_write_engine()
     sql = text(
         """
-        SELECT 1
+        SELECT DISTINCT model_id, month
         FROM blog_token_monthly
-        WHERE model_id = :model_id
-          AND month = :month
-        LIMIT 1
+        WHERE month = :month
         """
     )
     with engine.connect() as conn:
-        row = conn.execute(sql, {"model_id": model_id, "month": month}).first()
-    return row is not None
+        rows = conn.execute(sql, {"month": month}).all()
+    return {(int(r[0]), r[1]) for r in rows}
+
 
+# VALUES 에는 바인드 파라미터만 (docs/etl_planning.md "적재 SQL 공통 규칙")
+INSERT_TOKEN_SQL = text(
+    """
+    INSERT INTO blog_token_monthly (
+        model_id,
+        month,
+        token,
+        total_count,
+        token_rank
+    )
+    VALUES (
+        :model_id,
+        :month,
+        :token,
+        :total_count,
+        :rank
+    )
+    ON DUPLICATE KEY UPDATE
+        total_count = VALUES(total_count),
+        token_rank = VALUES(token_rank)
+    """
+)
+
+INSERT_ARTICLE_SQL = text(
+    """
+    INSERT INTO blog_article (
+        model_id,
+        month,
+        search_keyword,
+        search_rank,
+        title,
+        url,
+        summary,
+        content_plain,
+        posted_at
+    )
+    VALUES (
+        :model_id,
+        :month,
+        :search_keyword,
+        :search_rank,
+        :title,
+        :url,
+        :summary,
+        :content_plain,
+        :posted_at
+    )
+    ON DUPLICATE KEY UPDATE
+        summary       = VALUES(summary),
+        content_plain = VALUES(content_plain),
+        posted_at     = VALUES(posted_at),
+        collected_at  = CURRENT_TIMESTAMP
+    """
+)
 
-def insert_tokens(
+
+def build_token_rows(
     model_id: int,
     month: datetime.date,
     token_counts: List[Tuple[str, int]],
     top_k: int = 50,
-) -> None:
+) -> List[Dict[str, Any]]:
+    return [
+        {
+            "model_id": model_id,
+            "month": month,
+            "token": token,
+            "total_count": count,
+            "rank": rank,
+        }
+        for rank, (token, count) in enumerate(token_counts[:top_k], start=1)
+    ]
+
+
+def write_tokens(conn: Connection, rows: List[Dict[str, Any]]) -> int:
     """
-    토큰/빈도 리스트를 blog_token_monthly에 upsert.
+    blog_token_monthly upsert (executemany → pymysql 이 multi-row INSERT 로 묶어서 전송).
     DDL:
       - token_rank 컬럼 사용
       - UNIQUE KEY (model_id, month, token) 기준으로 ON DUPLICATE KEY UPDATE
     """
-    engine = get_engine(echo=False)
-    sql = text(
-        """
-        INSERT INTO blog_token_monthly (
-            model_id,
-            month,
-            token,
-            total_count,
-            token_rank,
-            created_at
-        )
-        VALUES (
-            :model_id,
-            :month,
-            :token,
-            :total_count,
-            :rank,
-            NOW()
-        )
-        ON DUPLICATE KEY UPDATE
-            total_count = VALUES(total_count),
-            token_rank = VALUES(token_rank)
-        """
-    )
-
-    with engine.begin() as conn:
-        for rank, (token, count) in enumerate(token_counts[:top_k], start=1):
-            conn.execute(
-                sql,
-                {
-                    "model_id": model_id,
-                    "month": month,
-                    "token": token,
-                    "total_count": count,
-                    "rank": rank,
-                },
-            )
-
-
-def insert_blog_article(
-    model_id: int,
-    month: datetime.date,
-    search_keyword: str,
-    search_rank: int,
-    title: str,
-    url: str,
-    summary: str,
-    content_plain: str,
-    posted_at: datetime.datetime | None = None,
-) -> None:
+    if not rows:
+        return 0
+    conn.execute(INSERT_TOKEN_SQL, rows)
+    return len(rows)
+
+
+def write_blog_articles(conn: Connection, rows: List[Dict[str, Any]]) -> int:
+    """blog_article upsert (executemany, multi-row INSERT)."""
+    if not rows:
+        return 0
+    conn.execute(INSERT_ARTICLE_SQL, rows)
+    return len(rows)
+
+
+def save_model_batch(
+    engine: Engine,
+    article_rows: List[Dict[str, Any]],
+    token_rows: List[Dict[str, Any]],
+    counts_row: Dict[str, Any] | None = None,
+    signature_rows: List[Dict[str, Any]] | None = None,
+) -> Tuple[int, int]:
     """
-    블로그 글을 blog_article에 저장.
-    - month: 기준 월 (워드클라우드 기준 월, ex) 2025-11-01)
-    - search_keyword: 네이버 API에 사용한 검색어 (예: 'EV3 후기')
-    - search_rank: 검색 결과 내 순위 (1, 2, 3)
-    - summary: 내용 요약 (앞 N자)
-    - content_plain: 전체 본문 텍스트
-    - posted_at: 원문 게시일 (모르면 NULL)
+    한 모델의 블로그 글 + 토큰(상위 N개 + 전체 빈도 blob)을 하나의 트랜잭션으로 저장한다.
+    (중간에 실패하면 해당 모델 분량 전체가 롤백되어 글만 있고 토큰은 없는 상태가 남지 않는다)
+    return: (저장한 글 수, 저장한 토큰 수)
     """
-    engine = get_engine(echo=False)
-    sql = text(
-        """
-        INSERT INTO blog_article (
-            model_id,
-            month,
-            search_keyword,
-            search_rank,
-            title,
-            url,
-            summary,
-            content_plain,
-            posted_at
-        )
-        VALUES (
-            :model_id,
-            :month,
-            :search_keyword,
-            :search_rank,
-            :title,
-            :url,
-            :summary,
-            :content_plain,
-            :posted_at
-        )
-        ON DUPLICATE KEY UPDATE
-            summary       = VALUES(summary),
-            content_plain = VALUES(content_plain),
-            posted_at     = VALUES(posted_at),
-            collected_at  = CURRENT_TIMESTAMP
-        """
-    )
     with engine.begin() as conn:
-        conn.execute(
-            sql,
-            {
-                "model_id": model_id,
-                "month": month,
-                "search_keyword": search_keyword,
-                "search_rank": search_rank,
-                "title": title,
-                "url": url,
-                "summary": summary,
-                "content_plain": content_plain,
-                "posted_at": posted_at,
-            },
-        )
+        n_articles = write_blog_articles(conn, article_rows)
+        n_tokens = write_tokens(conn, token_rows)
+        if counts_row is not None:
+            write_token_counts(conn, [counts_row])
+        if signature_rows:
+            write_signatures(conn, signature_rows)
+    return n_articles, n_tokens
 
 
 # -----------------------------
-# 블로그 본문 크롤링 (requests 기반)
+# 블로그 본문 크롤링
 # -----------------------------
-def _fetch_html(url: str) -> str:
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        )
-    }
-    resp = requests.get(url, headers=headers, timeout=10)
-    resp.raise_for_status()
-    return resp.text
+_extractor: BlogHtmlExtractor | None = None
 
 
-def extract_blog_text(url: str) -> str:
-    """
-    네이버 블로그(및 외부 블로그)의 본문 텍스트를 추출한다.
+def set_html_backend(name: str = "auto") -> BlogHtmlExtractor:
+    """본문 추출에 사용할 HTML 파서 백엔드를 지정한다 (auto/selectolax/lxml/bs4)."""
+    global _extractor
+    _extractor = BlogHtmlExtractor(backend=name)
+    return _extractor
 
-    1차: 직접 HTML에서 본문 영역 찾기
-    2차: iframe#mainFrame 이 있으면 그 src를 다시 요청해서 본문 찾기
-    3차: 그래도 안 되면 전체 텍스트
-    """
-    try:
-        html = _fetch_html(url)
-    except Exception as e:
-        print(f"    [WARN] 1차 fetch 실패: {e}")
-        return ""
-
-    soup = BeautifulSoup(html, "html.parser")
-
-    # 1) 최신 스마트에디터 3.0 구조
-    container = soup.select_one("div.se-main-container")
-    if container:
-        return container.get_text(separator="\n")
-
-    # 2) 구형 블로그 에디터 구조
-    legacy = soup.select_one("div#content")
-    if legacy:
-        return legacy.get_text(separator="\n")
-
-    # 3) iframe 구조 (구버전 blog.naver.com)
-    iframe = soup.select_one("iframe#mainFrame")
-    if iframe and iframe.has_attr("src"):
-        from urllib.parse import urljoin
 
-        iframe_src = iframe["src"]
-        iframe_url = urljoin("https://blog.naver.com", iframe_src)
+def get_extractor() -> BlogHtmlExtractor:
+    return _extractor or set_html_backend("auto")
 
-        try:
-            inner_html = _fetch_html(iframe_url)
-        except Exception as e:
-            print(f"    [WARN] iframe fetch 실패: {e}")
-            return ""
 
-        inner = BeautifulSoup(inner_html, "html.parser")
-
-        for selector in [
-            "div.se-main-container",
-            "div#postViewArea",
-            "div#contentArea",
-        ]:
-            area = inner.select_one(selector)
-            if area:
-                return area.get_text(separator="\n")
-
-        return inner.get_text(separator="\n")
+def parse_blog_html(html: str) -> Tuple[str | None, str | None]:
+    """
+    블로그 HTML 에서 본문 텍스트를 찾는다.
 
-    # 4) 그 외의 경우: 전체 텍스트 fallback
-    return soup.get_text(separator="\n")
+    return: (본문 텍스트, iframe URL)
+      - 본문을 찾으면 (text, None)
+      - 구버전 blog.naver.com 처럼 iframe#mainFrame 만 있으면 (None, iframe_url)
+    """
+    return get_extractor().extract(html)
 
 
-# -----------------------------
-# Kiwi 기반 명사 추출
-# -----------------------------
-kiwi = Kiwi()
+def parse_inner_blog_html(inner_html: str) -> str:
+    """iframe 안쪽(PostView) HTML 에서 본문 텍스트를 찾는다."""
+    return get_extractor().extract_inner(inner_html)
 
 
-def tokenize_text(text: str) -> List[str]:
-    """
-    한글 텍스트에서 명사류(N*) 토큰만 추출.
+async def _fetch_blog_text_async(fetcher: AsyncBlogFetcher, url: str) -> str:
     """
-    results = kiwi.tokenize(text)
-    tokens: List[str] = []
-
-    for w in results:
-        if w.tag.startswith("N"):
-            form = w.form.strip()
-            if len(form) > 1 and not form.isdigit():
-                tokens.append(form)
-    return tokens
+    네이버 블로그(및 외부 블로그)의 본문 텍스트를 추출한다. (HTML 파싱은 스레드에서 수행)
 
-
-def build_token_counts_from_articles(texts: List[str]) -> List[Tuple[str, int]]:
-    """
-    여러 블로그 본문 텍스트 리스트 → 토큰 빈도 리스트.
+    0차: blog.naver.com/<id>/<logNo> 는 PostView URL 로 바로 요청 (iframe 생략)
+    1차: 직접 HTML에서 본문 영역 찾기
+    2차: iframe#mainFrame 이 있으면 그 src를 다시 요청해서 본문 찾기
     """
-    all_tokens: List[str] = []
-    for t in texts:
-        all_tokens.extend(tokenize_text(t))
+    postview_url = to_postview_url(url)
+    html = await fetcher.fetch(postview_url)
+    if postview_url != url:
+        return await asyncio.to_thread(parse_inner_blog_html, html)
+
+    text_body, iframe_url = await asyncio.to_thread(parse_blog_html, html)
+    if iframe_url is None:
+        return text_body or ""
 
-    counter = collections.Counter(all_tokens)
-    sorted_items = sorted(counter.items(), key=lambda x: (-x[1], x[0]))
-    return sorted_items
+    inner_html = await fetcher.fetch(iframe_url)
+    return await asyncio.to_thread(parse_inner_blog_html, inner_html)
 
 
 # -----------------------------
@@ -314,18 +274,28 @@ def build_search_query(brand_name: str, model_name: str) -> str:
     return f"{model_name} 후기"
 
 
+# 네이버 검색 API 페이지 제한 (display 최대 100, start 최대 1000)
+SEARCH_MAX_DISPLAY = 100
+SEARCH_MAX_START = 1000
+
+
 def search_naver_blogs_via_api(
     query: str,
     max_results: int = 3,
     sort: str = "sim",
+    start: int = 1,
 ) -> List[Dict[str, str]]:
+    """
+    네이버 블로그 검색 API 한 페이지 조회.
+    start(1부터) 위치에서 max_results(최대 100)개. 결과가 끝나면 빈 리스트.
+    """
     client_id, client_secret = get_naver_credentials()
 
     url = "https://openapi.naver.com/v1/search/blog.json"
     params = {
         "query": query,
-        "display": max_results,
-        "start": 1,
+        "display": min(max_results, SEARCH_MAX_DISPLAY),
+        "start": start,
         "sort": sort,
     }
     headers = {
@@ -350,12 +320,239 @@ def search_naver_blogs_via_api(
         soup_title = BeautifulSoup(item.get("title", ""), "html.parser")
         title = soup_title.get_text(" ", strip=True)
         link = item.get("link", "").strip()
+        description = BeautifulSoup(
+            item.get("description", ""), "html.parser"
+        ).get_text(" ", strip=True)
         if link:
-            results.append({"title": title, "url": link})
+            results.append({"title": title, "url": link, "description": description})
 
     return results
 
 
+# -----------------------------
+# 스트리밍 수집 파이프라인 (검색 페이지 → 본문 fetch/추출 → 토큰화 → 수렴 판정)
+# -----------------------------
+@dataclass
+class CollectOptions:
+    max_articles: int = 100  # 모델별 저장 글 예산
+    min_articles: int = 30  # 수렴 판정 전 최소 글 수
+    page_size: int = 20  # 검색 API 1페이지 display
+    max_pages: int = 10  # 모델별 검색 API 호출 예산
+    converge_eps: float = 0.05  # 페이지 추가 전후 상위 토큰 분포 차이 기준
+    converge_patience: int = 2  # 기준 이하가 연속 몇 페이지면 중단할지
+    summary_length: int = 500
+    kiwi_workers: int = -1
+    search_interval: float = 0.2  # 검색 API 호출 간 최소 간격(초, 동시에 수집하는 모든 모델이 공유)
+
+
+@dataclass
+class ModelCollection:
+    model: Dict[str, Any]
+    query: str
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    counter: collections.Counter = field(default_factory=collections.Counter)
+    tok_stats: TokenizeStats = field(default_factory=TokenizeStats)
+    pages: int = 0
+    candidates: int = 0
+    last_shift: float = 1.0
+    stop_reason: str = ""
+
+
+async def _tokenize_page(
+    texts: List[str], kiwi_workers: int, lock: asyncio.Lock
+) -> Tuple[collections.Counter, TokenizeStats]:
+    """한 페이지 본문을 Kiwi 배치로 토큰화 (Kiwi 인스턴스는 공유하므로 한 번에 하나씩)."""
+    async with lock:
+        counters, stats = await asyncio.to_thread(
+            count_tokens_by_group, {0: texts}, kiwi_workers
+        )
+    return counters[0], stats
+
+
+async def collect_model_stream(
+    model: Dict[str, Any],
+    query: str,
+    month: datetime.date,
+    fetcher: AsyncBlogFetcher,
+    dedup: NearDuplicateFilter,
+    opts: CollectOptions,
+    kiwi_lock: asyncio.Lock,
+    search_limiter: AsyncRateLimiter,
+) -> ModelCollection:
+    """
+    한 모델의 검색 결과를 start/display 페이지 단위로 흘려보내며 수집한다.
+
+    - 검색 API 호출은 search_limiter 로 모든 모델이 함께 간격을 맞춘다.
+    - 이 페이지로 중단될 수 없을 때(글 수가 min/max 에 못 미침)만 본문을 받는 동안 다음 페이지를 미리 요청,
+      중단될 수 있으면 판정 후에 요청한다. (버려지는 유료 API 호출 방지)
+    - 페이지마다 본문을 토큰화해 누적 Counter 를 갱신하고,
+      상위 토큰 분포 변화가 converge_eps 미만인 페이지가 converge_patience 번 연속이면 중단
+    - max_articles(글 예산) / max_pages(API 호출 예산) / 검색 결과 끝에서도 중단
+    """
+    result = ModelCollection(model=model, query=query)
+    display = max(1, min(opts.page_size, opts.max_articles, SEARCH_MAX_DISPLAY))
+    stable_pages = 0
+    start = 1
+
+    async def _paced_search(start_at: int) -> List[Dict[str, str]]:
+        await search_limiter.wait()
+        return await asyncio.to_thread(
+            search_naver_blogs_via_api, query, display, "sim", start_at
+        )
+
+    def _search(start_at: int):
+        return asyncio.ensure_future(_paced_search(start_at))
+
+    next_page = _search(start)
+    while next_page is not None:
+        items = await next_page
+        next_page = None
+        result.pages += 1
+        if not items:
+            result.stop_reason = "검색 결과 끝"
+            break
+
+        page_start = start
+        start += len(items)
+        has_more = (
+            len(items) >= display
+            and start <= SEARCH_MAX_START
+            and result.pages < opts.max_pages
+        )
+        # 이 페이지를 다 넣어도 글 예산/수렴 조건에 닿을 수 없으면 본문 fetch 와 겹쳐서 다음 페이지 검색
+        rows_upper = len(result.rows) + len(items)
+        may_stop = rows_upper >= opts.max_articles or (
+            rows_upper >= opts.min_articles
+            and stable_pages + 1 >= opts.converge_patience
+        )
+        if has_more and not may_stop:
+            next_page = _search(start)
+
+        # 스니펫 중복이면 본문 fetch 생략
+        result.candidates += len(items)
+        fresh: List[Dict[str, Any]] = []
+        for offset, a in enumerate(items):
+            a["search_rank"] = page_start + offset
+            if dedup.check_snippet(a["url"], a.get("description", "")) is None:
+                fresh.append(a)
+
+        bodies = await asyncio.gather(
+            *(_fetch_blog_text_async(fetcher, a["url"]) for a in fresh),
+            return_exceptions=True,
+        )
+
+        page_texts: List[str] = []
+        for a, body in zip(fresh, bodies):
+            if len(result.rows) >= opts.max_articles:
+                break
+            if isinstance(body, BaseException):
+                print(f"  [WARN] 본문 크롤링 실패: {a['url']} ({body})")
+                continue
+            if not body.strip():
+                continue
+            if dedup.check_body(a["url"], body) is not None:
+                continue
+            dedup.accept(a["url"])
+
+            result.rows.append(
+                {
+                    "model_id": model["model_id"],
+                    "month": month,
+                    "search_keyword": query,
+                    "search_rank": a["search_rank"],
+                    "title": a["title"],
+                    "url": a["url"],
+                    "summary": body[: opts.summary_length],
+                    "content_plain": body,
+                    "posted_at": None,  # 나중에 필요하면 파싱
+                }
+            )
+            page_texts.append(body)
+
+        if page_texts:
+            page_counter, stats = await _tokenize_page(
+                page_texts, opts.kiwi_workers, kiwi_lock
+            )
+            before = result.counter.copy()
+            result.counter.update(page_counter)
+            result.tok_stats.articles += stats.articles
+            result.tok_stats.tokens += stats.tokens
+            result.tok_stats.seconds += stats.seconds
+
+            result.last_shift = distribution_shift(before, result.counter)
+            stable_pages = stable_pages + 1 if result.last_shift < opts.converge_eps else 0
+
+        if len(result.rows) >= opts.max_articles:
+            result.stop_reason = "글 예산 도달"
+        elif len(result.rows) >= opts.min_articles and stable_pages >= opts.converge_patience:
+            result.stop_reason = f"토큰 분포 수렴 (변화 {result.last_shift:.3f})"
+        elif not has_more:
+            result.stop_reason = (
+                "검색 API 예산 도달" if result.pages >= opts.max_pages else "검색 결과 끝"
+            )
+        else:
+            if next_page is None:
+                next_page = _search(start)
+            continue
+        break
+
+    if next_page is not None:
+        next_page.cancel()
+    return result
+
+
+async def collect_models_stream(
+    targets: List[Tuple[Dict[str, Any], str]],
+    month: datetime.date,
+    dedup: NearDuplicateFilter,
+    opts: CollectOptions,
+    fetcher_options: Dict[str, Any],
+    model_concurrency: int = 4,
+    fetch_stats: Optional[Dict[str, int]] = None,
+) -> List[ModelCollection]:
+    """
+    여러 모델을 동시에 스트리밍 수집한다.
+    (한 모델이 토큰화하는 동안 다른 모델의 검색/본문 fetch 가 진행되도록 파이프라인화)
+    fetch_stats 를 넘기면 본문 fetch 통계(requests/retries/failures)를 채운다.
+    """
+    kiwi_lock = asyncio.Lock()
+    search_limiter = AsyncRateLimiter(opts.search_interval)
+    sem = asyncio.Semaphore(max(1, model_concurrency))
+
+    async with AsyncBlogFetcher(**fetcher_options) as fetcher:
+
+        async def _one(model: Dict[str, Any], query: str) -> ModelCollection | None:
+            async with sem:
+                label = f"{model['brand_name']} {model['model_name_kr']}"
+                print(f"[INFO] 수집 시작: query='{query}'")
+                started = time.perf_counter()
+                try:
+                    res = await collect_model_stream(
+                        model, query, month, fetcher, dedup, opts, kiwi_lock, search_limiter
+                    )
+                except Exception as e:
+                    print(f"[WARN] 수집 실패 → {label}: {e}")
+                    return None
+                print(
+                    f"[INFO] 수집 종료 → {label}: 글 {len(res.rows)}개 "
+                    f"(후보 {res.candidates}개, 검색 {res.pages}페이지), "
+                    f"사유={res.stop_reason}, {time.perf_counter() - started:.1f}s"
+                )
+                return res
+
+        results = await asyncio.gather(*(_one(m, q) for m, q in targets))
+        stats = dict(fetcher.stats)
+        if fetch_stats is not None:
+            fetch_stats.update(stats)
+
+    print(
+        f"[INFO] 본문 fetch 통계: requests={stats['requests']}, "
+        f"retries={stats['retries']}, failures={stats['failures']}, "
+        f"검색 API 호출={search_limiter.calls}"
+    )
+    return [r for r in results if r is not None]
+
+
 # -----------------------------
 # 메인 실행 플로우
 # -----------------------------
@@ -370,8 +567,50 @@ def main():
     parser.add_argument(
         "--max-articles",
         type=int,
-        default=3,
-        help="모델별 수집할 블로그 글 개수 (기본 3개)",
+        default=100,
+        help="모델별 최대 수집 글 수 (글 예산, 기본 100개)",
+    )
+    parser.add_argument(
+        "--min-articles",
+        type=int,
+        default=30,
+        help="토큰 분포 수렴으로 중단하기 전 최소 글 수 (기본 30개)",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=20,
+        help="검색 API 페이지 크기 display (최대 100)",
+    )
+    parser.add_argument(
+        "--max-pages",
+        type=int,
+        default=10,
+        help="모델별 검색 API 호출 예산 (페이지 수)",
+    )
+    parser.add_argument(
+        "--converge-eps",
+        type=float,
+        default=0.05,
+        help="페이지 추가 전후 상위 토큰 분포 차이(TV distance)가 이 값 미만이면 안정으로 간주",
+    )
+    parser.add_argument(
+        "--converge-patience",
+        type=int,
+        default=2,
+        help="안정 페이지가 연속 몇 번이면 수집 중단할지",
+    )
+    parser.add_argument(
+        "--model-concurrency",
+        type=int,
+        default=4,
+        help="동시에 스트리밍 수집할 모델 수",
+    )
+    parser.add_argument(
+        "--search-interval",
+        type=float,
+        default=0.2,
+        help="네이버 검색 API 호출 간 최소 간격(초, 모든 모델 공유)",
     )
     parser.add_argument(
         "--summary-length",
@@ -379,77 +618,185 @@ def main():
         default=500,
         help="blog_article.summary 에 저장할 글자 수 (기본 500자)",
     )
+    parser.add_argument(
+        "--concurrency", type=int, default=16, help="본문 fetch 전체 동시 요청 수"
+    )
+    parser.add_argument(
+        "--per-host", type=int, default=4, help="호스트별 동시 요청 수 제한"
+    )
+    parser.add_argument(
+        "--host-delay",
+        type=float,
+        default=0.3,
+        help="같은 호스트 요청 시작 간 최소 간격(초)",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=10.0, help="본문 요청 타임아웃(초)"
+    )
+    parser.add_argument(
+        "--max-retries", type=int, default=2, help="본문 요청 재시도 횟수 (429/5xx/타임아웃)"
+    )
+    parser.add_argument(
+        "--kiwi-workers",
+        type=int,
+        default=-1,
+        help="Kiwi 형태소 분석 스레드 수 (-1 = 가용 코어 전부, 0 = 단일 스레드)",
+    )
+    parser.add_argument(
+        "--html-backend",
+        choices=["auto", "selectolax", "lxml", "bs4"],
+        default="auto",
+        help="본문 추출 HTML 파서 (auto = 설치된 것 중 가장 빠른 것)",
+    )
+    parser.add_argument(
+        "--dedup-threshold",
+        type=float,
+        default=0.8,
+        help="유사 중복 글 판정 기준 (MinHash 추정 자카드 유사도)",
+    )
+    parser.add_argument(
+        "--dedup-months",
+        type=int,
+        default=12,
+        help="중복 비교 대상으로 삼을 과거 개월 수 (0 = 전체)",
+    )
+    parser.add_argument(
+        "--no-dedup", action="store_true", help="유사 중복 글 필터 끄기"
+    )
     args = parser.parse_args()
 
+    extractor = set_html_backend(args.html_backend)
+    print(f"[INFO] HTML 추출 백엔드: {extractor.name}")
+
     today = datetime.date.today()
     month = today.replace(day=1)
     print(f"[INFO] 수집 기준 월 = {month}")
 
-    models = get_models_for_blog_target(limit=args.limit_models)
+    # DB 연결은 엔진 하나(커넥션 풀)를 실행 내내 재사용
+    engine = get_write_engine()
+    models = get_models_for_blog_target(limit=args.limit_models, engine=engine)
     print(f"[INFO] 대상 모델 수: {len(models)}")
 
-    for m in models:
-        model_id = m["model_id"]
-        brand = m["brand_name"]
-        model_name = m["model_name_kr"]
+    # 이미 수집된 (model_id, month) 는 한 번의 쿼리로 미리 읽어 둔다
+    collected = fetch_collected_model_months(month, engine=engine)
 
-        if has_tokens_for_month(model_id, month):
-            print(f"[INFO] 스킵 (이미 수집됨) → {brand} {model_name}")
-            continue
-
-        query = build_search_query(brand, model_name)
-        print(f"[INFO] 검색 시작: query='{query}'")
+    # 저장된 글의 MinHash 시그니처로 유사 중복 필터 구성
+    dedup = NearDuplicateFilter.from_db(
+        engine,
+        since_month=shift_month(month, -args.dedup_months) if args.dedup_months > 0 else None,
+        threshold=args.dedup_threshold,
+        enabled=not args.no_dedup,
+    )
+    if dedup.enabled:
+        print(f"[INFO] 중복 비교용 기존 시그니처: {len(dedup.body_index)}개")
 
-        articles = search_naver_blogs_via_api(
-            query,
-            max_results=args.max_articles,
-            sort="sim",
-        )
-        if not articles:
-            print(f"[WARN] 검색 결과 없음: {brand} {model_name}")
+    # 1) 수집 대상 모델 / 검색어
+    targets: List[Tuple[Dict[str, Any], str]] = []
+    for m in models:
+        if (m["model_id"], month) in collected:
+            print(f"[INFO] 스킵 (이미 수집됨) → {m['brand_name']} {m['model_name_kr']}")
             continue
+        targets.append((m, build_search_query(m["brand_name"], m["model_name_kr"])))
+
+    # 2~4) 모델별 검색 페이지 스트리밍 → 본문 fetch/추출 → 토큰화 (수렴/예산 도달 시 중단)
+    opts = CollectOptions(
+        max_articles=args.max_articles,
+        min_articles=min(args.min_articles, args.max_articles),
+        page_size=args.page_size,
+        max_pages=args.max_pages,
+        converge_eps=args.converge_eps,
+        converge_patience=args.converge_patience,
+        summary_length=args.summary_length,
+        kiwi_workers=args.kiwi_workers,
+        search_interval=args.search_interval,
+    )
+    ledger = RunLedger("run_naver_blog_wordcloud", run_id=args.run_id, engine=engine)
+    started = time.perf_counter()
+    fetch_stats: Dict[str, int] = {}
+    with ledger.stage("collect") as lm:
+        results = asyncio.run(
+            collect_models_stream(
+                targets,
+                month,
+                dedup,
+                opts,
+                fetcher_options={
+                    "concurrency": args.concurrency,
+                    "per_host": args.per_host,
+                    "host_delay": args.host_delay,
+                    "timeout": args.timeout,
+                    "max_retries": args.max_retries,
+                },
+                model_concurrency=args.model_concurrency,
+                fetch_stats=fetch_stats,
+            )
+        )
+        tok_stats = TokenizeStats()
+        for c in results:
+            tok_stats.articles += c.tok_stats.articles
+            tok_stats.tokens += c.tok_stats.tokens
+            tok_stats.seconds += c.tok_stats.seconds
+        lm.add(
+            rows_read=sum(c.candidates for c in results),
+            rows_written=sum(len(c.rows) for c in results),
+            rows_skipped=dedup.stats["snippet_dups"] + dedup.stats["body_dups"],
+            api_calls=sum(c.pages for c in results) + fetch_stats.get("requests", 0),
+            errors=fetch_stats.get("failures", 0) + len(targets) - len(results),
+            bytes=sum(
+                len((r.get("content_plain") or "").encode("utf-8"))
+                for c in results
+                for r in c.rows
+            ),
+        )
+        lm.extra.update(
+            models=len(targets), tokens=tok_stats.tokens, tokenize_sec=round(tok_stats.seconds, 2)
+        )
+    print(f"[INFO] 수집 파이프라인 소요: {time.perf_counter() - started:.1f}s")
+    print(f"[INFO] 토큰화 완료: {tok_stats.summary()}")
+
+    # 5) 모델별 글 + 토큰을 한 트랜잭션으로 저장 (multi-row INSERT)
+    started = time.perf_counter()
+    with ledger.stage("save") as sm:
+        for res in results:
+            m = res.model
+            model_id = m["model_id"]
+            brand = m["brand_name"]
+            model_name = m["model_name_kr"]
+            if not res.rows:
+                print(f"[WARN] 본문 없음: {brand} {model_name}")
+                continue
+
+            token_counts = sorted_token_counts(res.counter)
+            if not token_counts:
+                print(f"[WARN] 토큰 없음: {brand} {model_name}")
 
-        texts: List[str] = []
-        for idx, a in enumerate(articles, start=1):
             try:
-                print(f"  [INFO] 텍스트 수집: {a['title']} ({a['url']})")
-                text_body = extract_blog_text(a["url"])
-                if text_body.strip():
-                    summary = text_body[: args.summary_length]
-
-                    insert_blog_article(
-                        model_id=model_id,
-                        month=month,  # 위에서 today.replace(day=1)로 만든 기준 월
-                        search_keyword=query,  # build_search_query에서 만든 검색어
-                        search_rank=idx,  # 1, 2, 3
-                        title=a["title"],
-                        url=a["url"],
-                        summary=summary,
-                        content_plain=text_body,
-                        posted_at=None,  # 나중에 필요하면 파싱
-                    )
-
-                    texts.append(text_body)
-                time.sleep(0.8)
+                n_articles, n_tokens = save_model_batch(
+                    engine,
+                    res.rows,
+                    build_token_rows(model_id, month, token_counts),
+                    build_counts_row(model_id, month, res.counter),
+                    [
+                        row
+                        for r in res.rows
+                        if (row := dedup.signature_row(r["url"], model_id, month))
+                    ],
+                )
             except Exception as e:
-                print(f"  [WARN] 본문 크롤링 실패: {e}")
-
-        if not texts:
-            print(f"[WARN] 본문 없음: {brand} {model_name}")
-            continue
-
-        token_counts = build_token_counts_from_articles(texts)
-        if not token_counts:
-            print(f"[WARN] 토큰 없음: {brand} {model_name}")
-            continue
-
-        insert_tokens(model_id, month, token_counts)
-        print(
-            f"[INFO] 저장 완료 → {brand} {model_name}, "
-            f"토큰 수={len(token_counts)}, 글 수={len(texts)}"
-        )
-
-        time.sleep(1.5)
+                print(f"[WARN] 저장 실패 (롤백) → {brand} {model_name}: {e}")
+                sm.add(errors=1)
+                continue
+            sm.add(rows_written=n_articles + n_tokens)
+
+            print(
+                f"[INFO] 저장 완료 → {brand} {model_name}, "
+                f"토큰 수={len(token_counts)} (저장 {n_tokens}), 글 수={n_articles}"
+            )
+    print(f"[INFO] DB 저장 소요: {time.perf_counter() - started:.1f}s")
+    print(
+        f"[INFO] 유사 중복 스킵: 스니펫 {dedup.stats['snippet_dups']}건 (fetch 생략), "
+        f"본문 {dedup.stats['body_dups']}건 (토큰화 생략)"
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,101 @@
+# src/etl/blog/token_store.py
+
+from __future__ import annotations
+
+import datetime
+import json
+import zlib
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import Connection, Engine
+
+UPSERT_COUNTS_SQL = text(
+    """
+    INSERT INTO blog_token_counts (
+        model_id,
+        month,
+        vocab_size,
+        total_tokens,
+        counts_blob
+    )
+    VALUES (
+        :model_id,
+        :month,
+        :vocab_size,
+        :total_tokens,
+        :counts_blob
+    )
+    ON DUPLICATE KEY UPDATE
+        vocab_size   = VALUES(vocab_size),
+        total_tokens = VALUES(total_tokens),
+        counts_blob  = VALUES(counts_blob)
+    """
+)
+
+
+def encode_counts(counts: Mapping[str, int]) -> bytes:
+    """{token: count} → zlib 압축 JSON (토큰 정렬로 같은 입력이면 같은 바이트)."""
+    payload = json.dumps(
+        {k: int(v) for k, v in sorted(counts.items()) if v > 0},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return zlib.compress(payload.encode("utf-8"), level=6)
+
+
+def decode_counts(blob: bytes) -> Dict[str, int]:
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+def build_counts_row(
+    model_id: int, month: datetime.date, counts: Mapping[str, int]
+) -> Dict[str, object]:
+    return {
+        "model_id": model_id,
+        "month": month,
+        "vocab_size": sum(1 for v in counts.values() if v > 0),
+        "total_tokens": int(sum(counts.values())),
+        "counts_blob": encode_counts(counts),
+    }
+
+
+def write_token_counts(conn: Connection, rows: List[Dict[str, object]]) -> int:
+    """blog_token_counts upsert (executemany). rows 는 build_counts_row 결과."""
+    if not rows:
+        return 0
+    conn.execute(UPSERT_COUNTS_SQL, rows)
+    return len(rows)
+
+
+def load_token_counts(
+    engine: Engine,
+    months: Iterable[datetime.date],
+    model_ids: Optional[Iterable[int]] = None,
+) -> Dict[Tuple[int, datetime.date], Dict[str, int]]:
+    """
+    여러 월의 전체 토큰 빈도를 한 번에 읽는다.
+    return: {(model_id, month): {token: count}}
+    """
+    months = list(months)
+    if not months:
+        return {}
+
+    sql = """
+        SELECT model_id, month, counts_blob
+        FROM blog_token_counts
+        WHERE month IN :months
+    """
+    params: Dict[str, object] = {"months": months}
+    bind = [bindparam("months", expanding=True)]
+    if model_ids is not None:
+        sql += " AND model_id IN :model_ids"
+        params["model_ids"] = list(model_ids)
+        bind.append(bindparam("model_ids", expanding=True))
+
+    stmt = text(sql).bindparams(*bind)
+    result: Dict[Tuple[int, datetime.date], Dict[str, int]] = {}
+    with engine.connect() as conn:
+        for model_id, month, blob in conn.execute(stmt, params):
+            result[(int(model_id), month)] = decode_counts(blob)
+    return result
@@ -3,121 +3,374 @@
 from __future__ import annotations
 
 import argparse
-from typing import List, Dict, Any
+import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 
 from sqlalchemy import text
 
-from src.db.connection import get_engine
+from src.db.connection import get_write_engine
+from src.db.streaming import DEFAULT_CHUNK_SIZE, iter_row_chunks
+from src.etl.run_ledger import RunLedger
 
 
-def fetch_aggregated_naver_index() -> List[Dict[str, Any]]:
+BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
+WATERMARK_PATH = (
+    BASE_DIR / "data" / "processed" / "state" / "aggregate_naver_interest.watermark"
+)
+
+
+AGGREGATED_NAVER_INDEX_SQL = """
+    SELECT
+        model_id,
+        month,
+        AVG(ratio) AS naver_index
+    FROM model_monthly_interest_detail
+    GROUP BY model_id, month
+    ORDER BY month, model_id
+"""
+
+
+def iter_aggregated_naver_index(
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Dict[str, Any]]:
     """
     model_monthly_interest_detail 에서
     (model_id, month) 단위로 평균 ratio 를 집계해온다.
+    서버 측 커서로 chunk_size 행씩 받아오므로 결과 전체를 메모리에 올리지 않는다.
     """
-    engine = get_engine(echo=False)
+    engine = get_write_engine()
 
-    sql = text(
-        """
-        SELECT
-            model_id,
-            month,
-            AVG(ratio) AS naver_index
-        FROM model_monthly_interest_detail
-        GROUP BY model_id, month
-        ORDER BY month, model_id
-        """
-    )
+    for chunk in iter_row_chunks(engine, AGGREGATED_NAVER_INDEX_SQL, chunk_size=chunk_size):
+        for row in chunk:
+            yield {
+                "model_id": row["model_id"],
+                "month": row["month"],
+                "naver_index": (
+                    float(row["naver_index"]) if row["naver_index"] is not None else None
+                ),
+            }
 
-    with engine.connect() as conn:
-        rows = conn.execute(sql).mappings().all()
 
-    return [
-        {
-            "model_id": row["model_id"],
-            "month": row["month"],
-            "naver_index": (
-                float(row["naver_index"]) if row["naver_index"] is not None else None
-            ),
-        }
-        for row in rows
-    ]
+def fetch_aggregated_naver_index() -> List[Dict[str, Any]]:
+    """iter_aggregated_naver_index 결과를 리스트로"""
+    return list(iter_aggregated_naver_index())
 
 
-def upsert_model_monthly_interest(aggregated: List[Dict[str, Any]]) -> None:
+def upsert_model_monthly_interest(
+    aggregated: Iterable[Dict[str, Any]],
+    batch_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
     """
     집계된 네이버 관심도(aggregated)를
     model_monthly_interest 테이블에 upsert 한다.
+    batch_size 행씩 executemany (multi-row INSERT 한 번)
 
     - DB 컬럼명:
         naver_search_index       ← 네이버 검색 지수
         google_trend_index       ← (미사용, NULL 유지)
         danawa_pop_rank          ← (미사용, NULL 유지)
         danawa_pop_rank_size     ← (미사용, NULL 유지)
-    """
-    if not aggregated:
-        print("[WARN] 집계된 데이터가 없습니다. detail 테이블을 확인하세요.")
-        return
 
-    engine = get_engine(echo=False)
+    return: 읽은 (model_id, month) 개수
+    """
+    engine = get_write_engine()
 
+    # VALUES 에는 바인드 파라미터만 (docs/etl_planning.md "적재 SQL 공통 규칙")
     sql = text(
         """
         INSERT INTO model_monthly_interest (
             model_id,
             month,
-            naver_search_index,
-            google_trend_index,
-            danawa_pop_rank,
-            danawa_pop_rank_size,
-            created_at
+            naver_search_index
         )
         VALUES (
             :model_id,
             :month,
-            :naver_search_index,
-            NULL,
-            NULL,
-            NULL,
-            NOW()
+            :naver_search_index
         )
         ON DUPLICATE KEY UPDATE
             naver_search_index = VALUES(naver_search_index)
         """
     )
 
+    total = 0
+    batch: List[Dict[str, Any]] = []
     with engine.begin() as conn:
         for row in aggregated:
+            total += 1
             if row["naver_index"] is None:
                 continue
 
-            conn.execute(
-                sql,
+            batch.append(
                 {
                     "model_id": row["model_id"],
                     "month": row["month"],
                     "naver_search_index": row["naver_index"],
-                },
+                }
+            )
+            if len(batch) >= batch_size:
+                conn.execute(sql, batch)
+                batch = []
+        if batch:
+            conn.execute(sql, batch)
+
+    if total == 0:
+        print("[WARN] 집계된 데이터가 없습니다. detail 테이블을 확인하세요.")
+        return 0
+
+    print(f"[INFO] model_monthly_interest upsert 완료 (rows={total})")
+    return total
+
+
+# -----------------------------
+# 증분 집계 (DB 내부 INSERT ... SELECT)
+# -----------------------------
+def _build_weight_case(
+    column: str, weights: Dict[str, float], prefix: str, params: Dict[str, Any]
+) -> str:
+    """
+    {'mobile': 0.7, 'pc': 0.3} 같은 가중치 dict 를
+    CASE 식으로 바꾼다. 지정되지 않은 값(NULL 포함)은 1.0.
+    """
+    if not weights:
+        return "1.0"
+
+    whens: List[str] = []
+    for i, (value, weight) in enumerate(weights.items()):
+        params[f"{prefix}_k{i}"] = value
+        params[f"{prefix}_w{i}"] = float(weight)
+        whens.append(f"WHEN :{prefix}_k{i} THEN :{prefix}_w{i}")
+    return f"(CASE d.{column} {' '.join(whens)} ELSE 1.0 END)"
+
+
+def aggregate_naver_interest_in_db(
+    touched_since: Optional[datetime.datetime] = None,
+    since_month: Optional[str] = None,
+    model_ids: Optional[List[int]] = None,
+    device_weights: Optional[Dict[str, float]] = None,
+    gender_weights: Optional[Dict[str, float]] = None,
+) -> int:
+    """
+    detail → model_monthly_interest 집계를
+    단일 INSERT ... SELECT ... GROUP BY ... ON DUPLICATE KEY UPDATE 로 DB 안에서 처리한다.
+    (집계 결과가 Python 으로 넘어오지 않음)
+
+    - touched_since: detail.updated_at 이 이 시각 이후인 (model_id, month) 만 재집계
+    - since_month: 이 월(YYYY-MM-01) 이후만 재집계
+    - model_ids: 지정한 모델만 재집계
+    - device_weights / gender_weights: 셀별 가중 평균 (미지정 시 단순 평균)
+
+    return: 영향받은 행 수 (MySQL 기준 insert=1, update=2 로 카운트됨)
+    """
+    engine = get_write_engine()
+    params: Dict[str, Any] = {}
+
+    if device_weights or gender_weights:
+        weight_expr = (
+            _build_weight_case("device", device_weights or {}, "dw", params)
+            + " * "
+            + _build_weight_case("gender", gender_weights or {}, "gw", params)
+        )
+        index_expr = f"SUM(d.ratio * {weight_expr}) / NULLIF(SUM({weight_expr}), 0)"
+    else:
+        index_expr = "AVG(d.ratio)"
+
+    conditions: List[str] = []
+    if since_month:
+        conditions.append("d.month >= :since_month")
+        params["since_month"] = since_month
+    if model_ids:
+        placeholders = ", ".join([f":m{i}" for i in range(len(model_ids))])
+        conditions.append(f"d.model_id IN ({placeholders})")
+        params.update({f"m{i}": int(mid) for i, mid in enumerate(model_ids)})
+    if touched_since is not None:
+        conditions.append(
+            """
+            (d.model_id, d.month) IN (
+                SELECT t.model_id, t.month
+                FROM model_monthly_interest_detail t
+                WHERE t.updated_at >= :touched_since
             )
+            """
+        )
+        params["touched_since"] = touched_since
+
+    where_sql = ("WHERE " + " AND ".join(conditions)) if conditions else ""
+
+    sql = text(
+        f"""
+        INSERT INTO model_monthly_interest (
+            model_id,
+            month,
+            naver_search_index,
+            created_at
+        )
+        SELECT
+            d.model_id,
+            d.month,
+            {index_expr} AS naver_index,
+            NOW()
+        FROM model_monthly_interest_detail d
+        {where_sql}
+        GROUP BY d.model_id, d.month
+        HAVING naver_index IS NOT NULL
+        ON DUPLICATE KEY UPDATE
+            naver_search_index = VALUES(naver_search_index)
+        """
+    )
+
+    with engine.begin() as conn:
+        result = conn.execute(sql, params)
+
+    return result.rowcount
+
+
+def read_watermark() -> Optional[datetime.datetime]:
+    """마지막 증분 집계 시작 시각(DB 기준)을 읽는다. 없으면 None."""
+    if not WATERMARK_PATH.exists():
+        return None
+    raw = WATERMARK_PATH.read_text(encoding="utf-8").strip()
+    if not raw:
+        return None
+    return datetime.datetime.fromisoformat(raw)
+
+
+def write_watermark(value: datetime.datetime) -> None:
+    WATERMARK_PATH.parent.mkdir(parents=True, exist_ok=True)
+    WATERMARK_PATH.write_text(value.isoformat(sep=" "), encoding="utf-8")
+
+
+def fetch_db_now() -> datetime.datetime:
+    """
+    워터마크는 DB 시계 기준으로 잡는다.
+    (ETL 서버와 DB 서버 시계가 달라도 updated_at 비교가 어긋나지 않도록)
+    """
+    engine = get_write_engine()
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT NOW()")).scalar_one()
+
+
+def run_incremental_aggregate(
+    since_month: Optional[str] = None,
+    model_ids: Optional[List[int]] = None,
+    device_weights: Optional[Dict[str, float]] = None,
+    gender_weights: Optional[Dict[str, float]] = None,
+    full: bool = False,
+) -> int:
+    """
+    워터마크 이후 변경된 detail 만 DB 내부에서 재집계한다.
+    - 워터마크가 없거나 full=True 면 전체 재집계
+    - 성공 시 이번 실행 시작 시각으로 워터마크 갱신
+      (since_month / model_ids 로 범위를 좁힌 경우는 갱신하지 않음)
+    return: 영향받은 행 수
+    """
+    started_at = fetch_db_now()
+    watermark = None if full else read_watermark()
+
+    print(
+        "[INFO] 네이버 detail → model_monthly_interest 증분 집계 시작 "
+        f"(watermark={watermark or '없음(전체)'}, since_month={since_month}, "
+        f"model_ids={model_ids or '전체'})"
+    )
+
+    affected = aggregate_naver_interest_in_db(
+        touched_since=watermark,
+        since_month=since_month,
+        model_ids=model_ids,
+        device_weights=device_weights,
+        gender_weights=gender_weights,
+    )
 
-    print(f"[INFO] model_monthly_interest upsert 완료 (rows={len(aggregated)})")
+    print(f"[INFO] 증분 집계 완료 (affected rows={affected})")
 
+    # 범위를 좁힌 실행은 나머지 모델/월을 건너뛰었으므로 워터마크를 옮기지 않는다.
+    if since_month or model_ids:
+        return affected
+    write_watermark(started_at)
+    print(f"[INFO] 워터마크 갱신: {started_at}")
+    return affected
 
-def run_aggregate() -> None:
+
+def run_aggregate() -> int:
     print("[INFO] 네이버 detail → model_monthly_interest 집계 시작")
+    # 집계 결과는 (model_id, month) 크기라 다 읽은 뒤 쓴다.
+    # (서버 측 커서를 연 채로 upsert 하면 큰 테이블에서 net_write_timeout 으로 끊길 수 있음)
     aggregated = fetch_aggregated_naver_index()
     print(f"[INFO] 집계된 (model_id, month) 개수: {len(aggregated)}")
-    upsert_model_monthly_interest(aggregated)
+    total = upsert_model_monthly_interest(aggregated)
     print("[INFO] 네이버 관심도 집계 완료")
+    return total
+
+
+def parse_weight_args(values: Optional[List[str]]) -> Dict[str, float]:
+    """['mobile=0.7', 'pc=0.3'] → {'mobile': 0.7, 'pc': 0.3}"""
+    weights: Dict[str, float] = {}
+    for item in values or []:
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"가중치 형식은 key=value 입니다: {item}")
+        weights[key.strip()] = float(value)
+    return weights
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="model_monthly_interest_detail → model_monthly_interest (naver_search_index 집계)"
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="워터마크 이후 변경된 (model_id, month) 만 DB 내부에서 재집계",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="워터마크 무시하고 전체를 DB 내부에서 재집계 후 워터마크 갱신 (--incremental 포함)",
+    )
+    parser.add_argument(
+        "--since-month", default=None, help="이 월 이후만 집계 (YYYY-MM-01)"
+    )
+    parser.add_argument(
+        "--model-ids", nargs="+", type=int, default=None, help="집계 대상 model_id"
+    )
+    parser.add_argument(
+        "--device-weight",
+        action="append",
+        default=None,
+        help="device 가중치 (예: --device-weight mobile=0.7 --device-weight pc=0.3)",
+    )
+    parser.add_argument(
+        "--gender-weight",
+        action="append",
+        default=None,
+        help="gender 가중치 (예: --gender-weight male=0.5)",
+    )
     args = parser.parse_args()
 
-    run_aggregate()
+    ledger = RunLedger("aggregate_naver_interest")
+    if (
+        args.incremental
+        or args.full
+        or args.since_month
+        or args.model_ids
+        or args.device_weight
+        or args.gender_weight
+    ):
+        with ledger.stage("aggregate_incremental") as m:
+            affected = run_incremental_aggregate(
+                since_month=args.since_month,
+                model_ids=args.model_ids,
+                device_weights=parse_weight_args(args.device_weight),
+                gender_weights=parse_weight_args(args.gender_weight),
+                full=args.full,
+            )
+            m.add(rows_written=affected)
+            m.extra["full"] = bool(args.full)
+    else:
+        with ledger.stage("aggregate") as m:
+            rows = run_aggregate()
+            m.add(rows_read=rows, rows_written=rows)
 
 
 if __name__ == "__main__":
@@ -5,20 +5,65 @@ from __future__ import annotations
 import argparse
 import csv
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy import text
 
-from src.db.connection import get_engine
+from src.db.connection import get_write_engine
+from src.etl.run_ledger import RunLedger
 
 
 BASE_DIR = Path(__file__).resolve().parents[3]
 GOOGLE_DIR = BASE_DIR / "data" / "raw" / "google"
 
 
-def load_google_trend(run_id: str) -> None:
+# VALUES 에는 바인드 파라미터만 (docs/etl_planning.md "적재 SQL 공통 규칙")
+UPSERT_SQL = text(
+    """
+    INSERT INTO model_monthly_interest (
+        model_id,
+        month,
+        google_trend_index
+    )
+    VALUES (
+        :model_id,
+        :month,
+        :google_trend_index
+    )
+    ON DUPLICATE KEY UPDATE
+        google_trend_index = VALUES(google_trend_index)
+    """
+)
+
+
+def upsert_google_trend_rows(rows: List[Dict[str, Any]]) -> int:
+    """
+    (model_id, month, google_trend_index) 행 목록을
+    executemany 한 번으로 upsert 한다. (pymysql 이 multi-row INSERT 로 묶어줌)
+    """
+    if not rows:
+        return 0
+
+    params = [
+        {
+            "model_id": int(r["model_id"]),
+            "month": str(r["month"]),
+            "google_trend_index": int(r["google_trend_index"]),
+        }
+        for r in rows
+    ]
+
+    engine = get_write_engine()
+    with engine.begin() as conn:
+        conn.execute(UPSERT_SQL, params)
+    return len(params)
+
+
+def load_google_trend(run_id: str, stats: Optional[Dict[str, int]] = None) -> None:
     """
     정규화된 구글 트렌드 CSV를 읽어서
     model_monthly_interest.google_trend_index 를 upsert.
+    stats 를 넘기면 total_rows / skipped_rows / upserted / bytes 를 채운다.
     """
     csv_path = GOOGLE_DIR / run_id / f"google_trend_{run_id}_normalized.csv"
     if not csv_path.exists():
@@ -26,57 +71,35 @@ def load_google_trend(run_id: str) -> None:
 
     print(f"[INFO] 구글 트렌드 로딩 시작: {csv_path}")
 
-    engine = get_engine(echo=False)
-
-    sql = text(
-        """
-        INSERT INTO model_monthly_interest (
-            model_id,
-            month,
-            naver_search_index,
-            google_trend_index,
-            danawa_pop_rank,
-            danawa_pop_rank_size,
-            created_at
-        )
-        VALUES (
-            :model_id,
-            :month,
-            NULL,
-            :google_trend_index,
-            NULL,
-            NULL,
-            NOW()
-        )
-        ON DUPLICATE KEY UPDATE
-            google_trend_index = VALUES(google_trend_index)
-        """
-    )
-
-    rows = 0
+    valid_rows: List[Dict[str, Any]] = []
+    skipped = 0
 
-    with engine.begin() as conn, csv_path.open("r", encoding="utf-8-sig") as f:
+    with csv_path.open("r", encoding="utf-8-sig") as f:
         reader = csv.DictReader(f)
         for row in reader:
             try:
-                model_id = int(row["model_id"])
-                month = row["month"]
-                google_trend_index = int(row["google_trend_index"])
+                valid_rows.append(
+                    {
+                        "model_id": int(row["model_id"]),
+                        "month": row["month"],
+                        "google_trend_index": int(row["google_trend_index"]),
+                    }
+                )
             except (KeyError, ValueError) as e:
                 print(f"[WARN] 행 스킵: row={row}, error={e}")
+                skipped += 1
                 continue
 
-            conn.execute(
-                sql,
-                {
-                    "model_id": model_id,
-                    "month": month,
-                    "google_trend_index": google_trend_index,
-                },
-            )
-            rows += 1
+    rows = upsert_google_trend_rows(valid_rows)
 
     print(f"[INFO] model_monthly_interest.google_trend_index upsert 완료 (rows={rows})")
+    if stats is not None:
+        stats.update(
+            total_rows=len(valid_rows) + skipped,
+            skipped_rows=skipped,
+            upserted=rows,
+            bytes=csv_path.stat().st_size,
+        )
 
 
 def main():
@@ -86,7 +109,17 @@ def main():
     parser.add_argument("--run-id", required=True, help="실행 ID (예: 25_11_16)")
     args = parser.parse_args()
 
-    load_google_trend(run_id=args.run_id)
+    stats: Dict[str, int] = {}
+    ledger = RunLedger("load_google_trend", run_id=args.run_id)
+    with ledger.stage("load") as m:
+        load_google_trend(run_id=args.run_id, stats=stats)
+        m.merge_stats(
+            stats,
+            rows_read="total_rows",
+            rows_written="upserted",
+            rows_skipped="skipped_rows",
+            bytes="bytes",
+        )
 
 
 if __name__ == "__main__":
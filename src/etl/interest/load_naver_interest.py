@@ -11,7 +11,8 @@ from typing import Dict, Tuple, List
 
 from sqlalchemy import text
 
-from src.db.connection import get_engine
+from src.db.connection import get_write_engine
+from src.etl.run_ledger import RunLedger
 
 
 BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
@@ -99,7 +100,7 @@ def upsert_naver_interest(points: List[InterestPoint]) -> None:
         print("[WARN] 적재할 데이터가 없습니다.")
         return
 
-    engine = get_engine(echo=False)
+    engine = get_write_engine()
 
     sql = text(
         """
@@ -138,9 +139,10 @@ def upsert_naver_interest(points: List[InterestPoint]) -> None:
     print(f"[INFO] model_monthly_interest upsert 완료 (rows={len(points)})")
 
 
-def run_loader(run_id: str) -> None:
+def run_loader(run_id: str) -> int:
     points = load_raw_csv(run_id)
     upsert_naver_interest(points)
+    return len(points)
 
 
 def main():
@@ -150,7 +152,10 @@ def main():
     parser.add_argument("--run-id", required=True, help="수집 실행 ID (예: 25_11_16)")
 
     args = parser.parse_args()
-    run_loader(run_id=args.run_id)
+    ledger = RunLedger("load_naver_interest", run_id=args.run_id)
+    with ledger.stage("load") as m:
+        rows = run_loader(run_id=args.run_id)
+        m.add(rows_read=rows, rows_written=rows)
 
 
 if __name__ == "__main__":
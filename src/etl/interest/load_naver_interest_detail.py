@@ -9,17 +9,19 @@ from typing import Dict, Any
 
 from sqlalchemy import text
 
-from src.db.connection import get_engine
+from src.db.connection import get_write_engine
+from src.etl.run_ledger import RunLedger
 
 
 BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
 NAVER_DIR = BASE_DIR / "data" / "raw" / "naver"
 
 
-def load_detail(run_id: str):
+def load_detail(run_id: str) -> int:
     """
     정규화된 네이버 detail CSV를 읽어서
     model_monthly_interest_detail 테이블에 upsert.
+    return: upsert 한 행 수
     """
     csv_path = NAVER_DIR / run_id / f"naver_trend_{run_id}_detail_normalized.csv"
     if not csv_path.exists():
@@ -27,7 +29,7 @@ def load_detail(run_id: str):
 
     print(f"[INFO] 로딩 시작: {csv_path}")
 
-    engine = get_engine(echo=False)
+    engine = get_write_engine()
 
     sql = text(
         """
@@ -72,6 +74,7 @@ def load_detail(run_id: str):
                 rows += 1
 
     print(f"[INFO] detail 테이블 upsert 완료: {rows} rows")
+    return rows
 
 
 def main():
@@ -79,7 +82,10 @@ def main():
     parser.add_argument("--run-id", required=True, help="수집 실행 ID (예: 25_11_16)")
     args = parser.parse_args()
 
-    load_detail(run_id=args.run_id)
+    ledger = RunLedger("load_naver_interest_detail", run_id=args.run_id)
+    with ledger.stage("load_detail") as m:
+        rows = load_detail(run_id=args.run_id)
+        m.add(rows_read=rows, rows_written=rows)
 
 
 if __name__ == "__main__":
@@ -5,12 +5,17 @@ from __future__ import annotations
 import argparse
 import csv
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Tuple, List, Any
+from typing import Dict, Tuple, List, Any, Optional
 
+import numpy as np
+import pandas as pd
 from sqlalchemy import text
 
-from src.db.connection import get_engine
+from src.db.connection import get_write_engine
+from src.etl.interest.load_google_trend import upsert_google_trend_rows
+from src.etl.run_ledger import RunLedger
 
 
 BASE_DIR = Path(__file__).resolve().parents[3]
@@ -21,7 +26,7 @@ def load_model_map() -> Dict[Tuple[str, str], int]:
     """
     car_model에서 (brand_name, model_name_kr) -> model_id 매핑을 만든다.
     """
-    engine = get_engine(echo=False)
+    engine = get_write_engine()
     sql = text(
         """
         SELECT model_id, brand_name, model_name_kr
@@ -69,6 +74,25 @@ def open_skip_category_line(path: Path):
     return f
 
 
+def find_wide_files(folder: Path) -> List[Path]:
+    """
+    대소문자 상관 없이 hyundai/kia + all 이 들어간 wide CSV 파일을 찾는다.
+    """
+    existing_files: List[Path] = []
+    for p in sorted(folder.iterdir()):
+        if not p.is_file() or p.suffix.lower() != ".csv":
+            continue
+        name_lower = p.name.lower()
+        if "all" in name_lower and ("hyundai" in name_lower or "kia" in name_lower):
+            existing_files.append(p)
+
+    if not existing_files:
+        raise FileNotFoundError(
+            f"{folder} 에서 *hyundai*all.csv / *kia*all.csv 패턴의 파일을 찾을 수 없습니다."
+        )
+    return existing_files
+
+
 def normalize_google_trend_wide(run_id: str) -> Path:
     """
     data/raw/google/<run_id> 안의
@@ -87,19 +111,7 @@ def normalize_google_trend_wide(run_id: str) -> Path:
     if not folder.exists():
         raise FileNotFoundError(f"폴더가 없습니다: {folder}")
 
-    # 대소문자 상관 없이 hyundai/kia + all 이 들어간 파일 찾기
-    existing_files: List[Path] = []
-    for p in folder.iterdir():
-        if not p.is_file():
-            continue
-        name_lower = p.name.lower()
-        if "all" in name_lower and ("hyundai" in name_lower or "kia" in name_lower):
-            existing_files.append(p)
-
-    if not existing_files:
-        raise FileNotFoundError(
-            f"{folder} 에서 *hyundai*all.csv / *kia*all.csv 패턴의 파일을 찾을 수 없습니다."
-        )
+    existing_files = find_wide_files(folder)
 
     model_map = load_model_map()
     print(f"[INFO] car_model 매핑 로드 완료: {len(model_map)} 개")
@@ -215,14 +227,206 @@ def normalize_google_trend_wide(run_id: str) -> Path:
     return out_path
 
 
+# -----------------------------
+# 벡터화 버전 (pandas melt + groupby)
+# -----------------------------
+def _alias_key(name: str) -> str:
+    """헤더/모델명 비교용 키: 공백 제거 + 소문자."""
+    return "".join(name.split()).lower()
+
+
+def build_alias_table(
+    model_map: Dict[Tuple[str, str], int],
+) -> Dict[Tuple[str, str], int]:
+    """
+    (brand_name, model_name_kr) → model_id 매핑을
+    (brand_name, 정규화된 이름) → model_id 별칭 테이블로 미리 펼쳐둔다.
+    (공백·대소문자 차이만 흡수: '아이오닉 5' = '아이오닉5', 'EV 6' = 'ev6'.
+     'IONIQ5' ↔ '아이오닉5' 같은 영문/한글 표기 차이는 매칭되지 않는다)
+    """
+    aliases: Dict[Tuple[str, str], int] = {}
+    for (brand_name, model_name), model_id in model_map.items():
+        aliases[(brand_name, _alias_key(model_name))] = model_id
+    return aliases
+
+
+def _header_to_trend_name(header: str) -> str:
+    """'캐스퍼: (대한민국)' → '캐스퍼'"""
+    return header.split(":", 1)[0].strip()
+
+
+def read_wide_as_long(
+    path: Path,
+    brand_name: str,
+    aliases: Dict[Tuple[str, str], int],
+) -> pd.DataFrame:
+    """
+    wide CSV 한 개를 읽어 long 형태 (model_id, month, google_trend_index) 로 melt 한다.
+    값은 기존 경로와 동일하게 int(float()) 절삭 후 사용하고,
+    '<1' 처럼 숫자가 아닌 값은 버린다.
+    """
+    with path.open("r", encoding="utf-8-sig") as f:
+        first = f.readline()
+    skiprows = 1 if first.strip().startswith("카테고리:") else 0
+
+    wide = pd.read_csv(path, encoding="utf-8-sig", skiprows=skiprows, dtype=str)
+    if wide.empty or len(wide.columns) < 2:
+        return pd.DataFrame(columns=["model_id", "month", "google_trend_index"])
+
+    date_col = wide.columns[0]
+    col_to_model_id = {
+        col: aliases.get((brand_name, _alias_key(_header_to_trend_name(col))))
+        for col in wide.columns[1:]
+    }
+    mapped_cols = [col for col, mid in col_to_model_id.items() if mid is not None]
+
+    long = wide.melt(
+        id_vars=[date_col],
+        value_vars=mapped_cols,
+        var_name="column",
+        value_name="value",
+    )
+    long["model_id"] = long["column"].map(col_to_model_id)
+    long["google_trend_index"] = np.trunc(
+        pd.to_numeric(long["value"], errors="coerce")
+    )
+    dates = long[date_col].fillna("").str.strip()
+    long["month"] = dates.str[:7] + "-01"
+
+    long = long[(dates.str.len() >= 7) & long["google_trend_index"].notna()]
+    return long[["model_id", "month", "google_trend_index"]]
+
+
+def _read_wide_task(
+    args: Tuple[Path, str, Dict[Tuple[str, str], int]],
+) -> pd.DataFrame:
+    return read_wide_as_long(*args)
+
+
+def normalize_google_trend_wide_vectorized(
+    run_id: str,
+    output: str = "csv",
+    workers: int = 4,
+    stats: Optional[Dict[str, int]] = None,
+) -> Path | None:
+    """
+    normalize_google_trend_wide 와 같은 입력/결과를
+    pandas melt + 한 번의 groupby 로 처리하는 벡터화 버전.
+
+    - 여러 wide CSV 는 프로세스 풀에서 병렬로 읽는다.
+    - 주간 값은 (model_id, month) groupby 평균 → 반올림으로 월 단위 변환.
+    - output:
+        csv     → google_trend_<run_id>_normalized.csv (기존 load_google_trend 입력과 동일)
+        parquet → google_trend_<run_id>_normalized.parquet (pyarrow 필요)
+        db      → model_monthly_interest.google_trend_index 로 바로 bulk upsert
+    - stats 를 넘기면 files / points / normalized_rows / bytes 를 채운다.
+    """
+    folder = GOOGLE_DIR / run_id
+    if not folder.exists():
+        raise FileNotFoundError(f"폴더가 없습니다: {folder}")
+
+    existing_files = find_wide_files(folder)
+
+    model_map = load_model_map()
+    aliases = build_alias_table(model_map)
+    print(f"[INFO] car_model 별칭 테이블 로드 완료: {len(aliases)} 개")
+
+    tasks = []
+    for path in existing_files:
+        brand_name = guess_brand_from_filename(path)
+        if not brand_name:
+            print(f"[WARN] 브랜드 추정 실패, 스킵: {path}")
+            continue
+        tasks.append((path, brand_name, aliases))
+
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            frames = list(pool.map(_read_wide_task, tasks))
+    else:
+        frames = [_read_wide_task(t) for t in tasks]
+
+    for (path, brand_name, _), frame in zip(tasks, frames):
+        print(f"[INFO] {path.name} (brand={brand_name}) → {len(frame)} points")
+
+    frames = [f for f in frames if not f.empty]
+    if frames:
+        long = pd.concat(frames, ignore_index=True)
+        normalized = (
+            long.groupby(["model_id", "month"], sort=False)["google_trend_index"]
+            .mean()
+            .round()
+            .astype(int)
+            .reset_index()
+        )
+        normalized["model_id"] = normalized["model_id"].astype(int)
+    else:
+        normalized = pd.DataFrame(columns=["model_id", "month", "google_trend_index"])
+
+    print(f"[INFO] 정규화된 (model_id, month) 개수: {len(normalized)}")
+    if stats is not None:
+        stats.update(
+            files=len(tasks),
+            points=int(sum(len(f) for f in frames)),
+            normalized_rows=len(normalized),
+            bytes=sum(path.stat().st_size for path, _, _ in tasks),
+        )
+
+    if output == "db":
+        rows = upsert_google_trend_rows(normalized.to_dict(orient="records"))
+        print(f"[INFO] model_monthly_interest.google_trend_index bulk upsert 완료 (rows={rows})")
+        return None
+
+    if output == "parquet":
+        out_path = folder / f"google_trend_{run_id}_normalized.parquet"
+        normalized.to_parquet(out_path, index=False)
+    else:
+        out_path = folder / f"google_trend_{run_id}_normalized.csv"
+        normalized.to_csv(out_path, index=False, encoding="utf-8-sig")
+
+    print(f"[INFO] 정규화 결과 저장 완료: {out_path}")
+    return out_path
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="구글 트렌드 wide CSV → 월별 지수 정규화"
     )
     parser.add_argument("--run-id", required=True, help="실행 ID (예: 25_11_16)")
+    parser.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="pandas melt/groupby 기반 벡터화 경로 사용",
+    )
+    parser.add_argument(
+        "--output",
+        choices=["csv", "parquet", "db"],
+        default="csv",
+        help="벡터화 경로 출력 형식 (기본 csv, db 는 바로 upsert)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="벡터화 경로에서 wide CSV 를 병렬로 읽을 프로세스 수",
+    )
 
     args = parser.parse_args()
-    normalize_google_trend_wide(run_id=args.run_id)
+    ledger = RunLedger("normalize_google_trend_wide", run_id=args.run_id)
+    if args.vectorized or args.output != "csv":
+        stats: Dict[str, int] = {}
+        with ledger.stage(f"normalize_vectorized_{args.output}") as m:
+            normalize_google_trend_wide_vectorized(
+                run_id=args.run_id,
+                output=args.output,
+                workers=args.workers,
+                stats=stats,
+            )
+            m.merge_stats(
+                stats, rows_read="points", rows_written="normalized_rows", bytes="bytes"
+            )
+    else:
+        with ledger.stage("normalize") as m:
+            normalize_google_trend_wide(run_id=args.run_id)
 
 
 if __name__ == "__main__":
@@ -6,19 +6,23 @@ import argparse
 import csv
 from collections import defaultdict
 from pathlib import Path
-from typing import List, Dict, Tuple, Any
+from typing import List, Dict, Tuple, Any, Optional
+
+from src.etl.run_ledger import RunLedger
 
 BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
 NAVER_DIR = BASE_DIR / "data" / "raw" / "naver"
 
 
-def normalize_detail(run_id: str) -> Path:
+def normalize_detail(run_id: str, stats: Optional[Dict[str, int]] = None) -> Path:
     """
     data/raw/naver/<run_id>/naver_trend_<run_id>.csv 를 읽어서
     model_monthly_interest_detail 테이블에 적재하기 좋은 형태로 정규화된 CSV 생성.
 
     출력: data/raw/naver/<run_id>/naver_trend_<run_id>_detail_normalized.csv
       - model_id, month, device, gender, age_group, ratio
+
+    stats 를 넘기면 raw_rows / skipped_rows / normalized_rows / raw_bytes 를 채운다.
     """
     raw_path = NAVER_DIR / run_id / f"naver_trend_{run_id}.csv"
     out_path = NAVER_DIR / run_id / f"naver_trend_{run_id}_detail_normalized.csv"
@@ -29,10 +33,12 @@ def normalize_detail(run_id: str) -> Path:
     print(f"[INFO] raw CSV 로딩: {raw_path}")
 
     rows: List[Dict[str, Any]] = []
+    raw_rows = 0
 
     with raw_path.open("r", encoding="utf-8-sig") as f:
         reader = csv.DictReader(f)
         for row in reader:
+            raw_rows += 1
             try:
                 model_id = int(row["model_id"])
             except (KeyError, ValueError):
@@ -85,6 +91,13 @@ def normalize_detail(run_id: str) -> Path:
         writer.writerows(rows)
 
     print(f"[INFO] 정규화 CSV 저장 완료: {out_path}")
+    if stats is not None:
+        stats.update(
+            raw_rows=raw_rows,
+            skipped_rows=raw_rows - len(rows),
+            normalized_rows=len(rows),
+            raw_bytes=raw_path.stat().st_size,
+        )
     return out_path
 
 
@@ -93,7 +106,18 @@ def main():
     parser.add_argument("--run-id", required=True, help="수집 실행 ID (예: 25_11_16)")
 
     args = parser.parse_args()
-    normalize_detail(run_id=args.run_id)
+
+    stats: Dict[str, int] = {}
+    ledger = RunLedger("normalize_naver_detail", run_id=args.run_id)
+    with ledger.stage("normalize") as m:
+        normalize_detail(run_id=args.run_id, stats=stats)
+        m.merge_stats(
+            stats,
+            rows_read="raw_rows",
+            rows_written="normalized_rows",
+            rows_skipped="skipped_rows",
+            bytes="raw_bytes",
+        )
 
 
 if __name__ == "__main__":
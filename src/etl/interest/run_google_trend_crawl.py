@@ -0,0 +1,404 @@
+# src/etl/interest/run_google_trend_crawl.py
+
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import math
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from src.etl.interest.run_naver_trend_crawl import fetch_target_models
+from src.etl.run_ledger import RunLedger
+
+
+BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
+GOOGLE_DIR = BASE_DIR / "data" / "raw" / "google"
+
+# 구글 트렌드 1회 요청당 최대 키워드 수 (앵커 포함)
+BATCH_SIZE = 5
+
+# car_model.brand_name → 출력 파일명 브랜드 코드 (normalize_google_trend_wide 가 파일명으로 브랜드 추정)
+BRAND_FILE_CODE: Dict[str, str] = {
+    "현대": "hyundai",
+    "기아": "kia",
+}
+
+
+# -----------------------------
+# 수집 백엔드
+# -----------------------------
+class PytrendsBackend:
+    """
+    pytrends 기반 실제 구글 트렌드 백엔드.
+    반환: index=날짜, columns=키워드 인 DataFrame (배치 내 최고값=100 기준)
+    """
+
+    def __init__(self, hl: str = "ko", tz: int = 540, category: int = 47):
+        from pytrends.request import TrendReq
+
+        self.hl = hl
+        self.tz = tz
+        self.category = category  # 47 = Autos & Vehicles
+        self._trend_req = TrendReq
+
+    def fetch(self, keywords: List[str], timeframe: str, geo: str) -> pd.DataFrame:
+        # TrendReq 는 쿠키/세션 상태를 가지므로 워커마다 새로 만든다.
+        client = self._trend_req(hl=self.hl, tz=self.tz)
+        client.build_payload(
+            keywords, cat=self.category, timeframe=timeframe, geo=geo
+        )
+        df = client.interest_over_time()
+        if "isPartial" in df.columns:
+            df = df.drop(columns=["isPartial"])
+        return df
+
+
+class StubTrendBackend:
+    """
+    오프라인 테스트용 백엔드.
+    키워드별로 고정된 '실제 검색량' 시계열을 만들어 두고,
+    구글처럼 요청 배치 안에서 최고값=100 으로 재스케일해 돌려준다.
+    (스티칭 결과가 원래 비율을 복원하는지 확인할 수 있다)
+    """
+
+    def __init__(self, periods: int = 52, fail_rate: float = 0.0, seed: int = 0):
+        self.periods = periods
+        self.fail_rate = fail_rate
+        self._rng = random.Random(seed)
+        self.dates = pd.date_range(end="2025-10-26", periods=periods, freq="W-SUN")
+
+    def latent_series(self, keyword: str) -> pd.Series:
+        h = int(hashlib.md5(keyword.encode("utf-8")).hexdigest()[:8], 16)
+        scale = 5 + (h % 500)
+        phase = (h % 52) / 52 * 2 * math.pi
+        values = [
+            scale * (1.0 + 0.3 * math.sin(2 * math.pi * i / 52 + phase))
+            for i in range(self.periods)
+        ]
+        return pd.Series(values, index=self.dates, name=keyword)
+
+    def fetch(self, keywords: List[str], timeframe: str, geo: str) -> pd.DataFrame:
+        if self.fail_rate and self._rng.random() < self.fail_rate:
+            raise RuntimeError("stub: 429 Too Many Requests")
+        df = pd.concat([self.latent_series(k) for k in keywords], axis=1)
+        peak = df.to_numpy().max()
+        return (df / peak * 100).round().astype(int)
+
+
+def build_backend(name: str):
+    if name == "stub":
+        return StubTrendBackend()
+    return PytrendsBackend()
+
+
+# -----------------------------
+# 대상 모델 (car_model 또는 DB 없이 CSV / 인자)
+# -----------------------------
+def load_models_csv(path: Path, brands: List[str]) -> List[dict]:
+    """brand_name, model_name_kr 컬럼이 있는 CSV (car_model_candidates.csv 와 같은 형식)에서 대상 모델을 읽는다."""
+    with path.open("r", encoding="utf-8-sig", newline="") as f:
+        rows = list(csv.DictReader(f))
+    return [
+        {"brand_name": r["brand_name"].strip(), "model_name_kr": r["model_name_kr"].strip()}
+        for r in rows
+        if r["brand_name"].strip() in brands and r["model_name_kr"].strip()
+    ]
+
+
+def parse_model_args(values: List[str]) -> List[dict]:
+    """['현대:아이오닉 5', '기아:EV6'] → [{'brand_name': '현대', 'model_name_kr': '아이오닉 5'}, ...]"""
+    models: List[dict] = []
+    for item in values:
+        brand, sep, name = item.partition(":")
+        if not sep or not brand.strip() or not name.strip():
+            raise ValueError(f"모델 형식은 브랜드:모델명 입니다: {item}")
+        models.append({"brand_name": brand.strip(), "model_name_kr": name.strip()})
+    return models
+
+
+# -----------------------------
+# 배치 구성 / 수집 / 스티칭
+# -----------------------------
+def build_batches(keywords: List[str], anchor: str) -> List[List[str]]:
+    """
+    앵커를 제외한 키워드를 (BATCH_SIZE - 1)개씩 묶고,
+    모든 배치 맨 앞에 같은 앵커 키워드를 붙인다.
+    """
+    others = [k for k in keywords if k != anchor]
+    step = BATCH_SIZE - 1
+    return [[anchor] + others[i : i + step] for i in range(0, len(others), step)]
+
+
+def fetch_batch_with_backoff(
+    backend,
+    batch: List[str],
+    timeframe: str,
+    geo: str,
+    max_retries: int = 5,
+    backoff_base: float = 30.0,
+) -> pd.DataFrame:
+    """
+    한 배치를 수집한다. 실패(주로 429)하면 지수 백오프 + 지터 후 재시도.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return backend.fetch(batch, timeframe=timeframe, geo=geo)
+        except Exception as e:
+            if attempt >= max_retries:
+                raise
+            wait = backoff_base * (2**attempt) * random.uniform(0.5, 1.5)
+            print(
+                f"[WARN] 구글 트렌드 요청 실패 (시도 {attempt + 1}/{max_retries + 1}): "
+                f"{batch}, error={e} → {wait:.1f}s 후 재시도"
+            )
+            time.sleep(wait)
+    raise RuntimeError("unreachable")
+
+
+def stitch_batches(frames: List[pd.DataFrame], anchor: str) -> pd.DataFrame:
+    """
+    배치마다 따로 0~100 으로 정규화된 결과를 앵커 기준으로 하나의 스케일로 맞춘다.
+
+    - 첫 배치의 앵커 시계열을 기준으로,
+      각 배치에 (기준 앵커 합 / 배치 앵커 합) 배율을 곱한다.
+    - 전체를 합친 뒤 최고값이 100 이 되도록 다시 스케일링한다.
+    """
+    if not frames:
+        return pd.DataFrame()
+
+    reference = frames[0][anchor].astype(float)
+    ref_total = reference.sum()
+    if ref_total <= 0:
+        raise ValueError(f"앵커 '{anchor}' 의 검색량이 0 이라 스티칭할 수 없습니다.")
+
+    stitched: List[pd.DataFrame] = []
+    for frame in frames:
+        batch_total = frame[anchor].astype(float).sum()
+        if batch_total <= 0:
+            print(f"[WARN] 앵커 값이 0 인 배치 스킵: {list(frame.columns)}")
+            continue
+        scaled = frame.astype(float) * (ref_total / batch_total)
+        stitched.append(scaled.drop(columns=[anchor]))
+
+    combined = pd.concat([reference.to_frame(anchor)] + stitched, axis=1)
+    combined = combined.loc[:, ~combined.columns.duplicated()]
+
+    peak = combined.to_numpy().max()
+    if peak > 0:
+        combined = combined / peak * 100
+    return combined.round().astype(int)
+
+
+def write_wide_csv(df: pd.DataFrame, out_path: Path) -> None:
+    """
+    구글 트렌드 내보내기와 같은 wide CSV 형식으로 저장한다.
+      1행: '카테고리: 자동차'
+      2행: '주,<모델명>: (대한민국),...'
+    """
+    out = df.copy()
+    out.index = pd.to_datetime(out.index).strftime("%Y-%m-%d")
+    out.index.name = "주"
+    out.columns = [f"{c}: (대한민국)" for c in out.columns]
+
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with out_path.open("w", newline="", encoding="utf-8-sig") as f:
+        f.write("카테고리: 자동차\n")
+        out.to_csv(f)
+
+
+def run_google_trend_crawl(
+    run_id: str,
+    timeframe: str = "today 12-m",
+    geo: str = "KR",
+    brands: Optional[List[str]] = None,
+    anchor: Optional[str] = None,
+    workers: int = 2,
+    max_retries: int = 5,
+    backoff_base: float = 30.0,
+    backend_name: str = "pytrends",
+    limit_models: Optional[int] = None,
+    stats: Optional[Dict[str, int]] = None,
+    models: Optional[List[dict]] = None,
+) -> List[Path]:
+    """
+    car_model 모델명을 앵커 1개 + 4개씩 배치로 묶어 구글 트렌드를 수집하고,
+    앵커 기준으로 스티칭한 뒤 브랜드별 wide CSV 로 저장한다.
+
+    출력: data/raw/google/<run_id>/google_trend_<run_id>_<brand>_all.csv
+      → normalize_google_trend_wide.py 가 그대로 읽을 수 있는 형식
+
+    stats 를 넘기면 batches / failed_batches / rows_written / bytes 를 채운다.
+    models(brand_name / model_name_kr)를 넘기면 car_model 을 조회하지 않는다. (stub 백엔드로 DB 없이 실행)
+    """
+    stats = stats if stats is not None else {}
+    if brands is None:
+        brands = ["현대", "기아"]
+
+    if models is None:
+        models = fetch_target_models(brands)
+    if limit_models is not None:
+        models = models[:limit_models]
+    if not models:
+        print("[WARN] 대상 모델이 없습니다. car_model 테이블을 확인하세요.")
+        return []
+
+    brand_by_keyword: Dict[str, str] = {}
+    for m in models:
+        brand_by_keyword.setdefault(m["model_name_kr"], m["brand_name"])
+    keywords = list(brand_by_keyword.keys())
+
+    anchor = anchor or keywords[0]
+    if anchor not in brand_by_keyword:
+        raise ValueError(f"앵커 모델이 대상 모델 목록에 없습니다: {anchor}")
+
+    batches = build_batches(keywords, anchor)
+    print(
+        f"[INFO] 구글 트렌드 수집 시작: run_id={run_id}, 모델 수={len(keywords)}, "
+        f"배치 수={len(batches)}, anchor='{anchor}', workers={workers}, backend={backend_name}"
+    )
+
+    backend = build_backend(backend_name)
+    results: Dict[int, pd.DataFrame] = {}
+    stats.update(batches=len(batches), failed_batches=0, rows_written=0, bytes=0)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {
+            pool.submit(
+                fetch_batch_with_backoff,
+                backend,
+                batch,
+                timeframe,
+                geo,
+                max_retries,
+                backoff_base,
+            ): idx
+            for idx, batch in enumerate(batches)
+        }
+        for future in as_completed(futures):
+            idx = futures[future]
+            try:
+                results[idx] = future.result()
+                print(f"[INFO] 배치 {idx + 1}/{len(batches)} 수집 완료: {batches[idx]}")
+            except Exception as e:
+                stats["failed_batches"] += 1
+                print(f"[WARN] 배치 최종 실패, 스킵: {batches[idx]}, error={e}")
+
+    frames = [results[i] for i in sorted(results) if not results[i].empty]
+    if not frames:
+        print("[WARN] 수집된 배치가 없습니다.")
+        return []
+
+    stitched = stitch_batches(frames, anchor)
+
+    out_dir = GOOGLE_DIR / run_id
+    written: List[Path] = []
+    for brand_name in brands:
+        cols = [c for c in stitched.columns if brand_by_keyword.get(c) == brand_name]
+        if not cols:
+            continue
+        code = BRAND_FILE_CODE.get(brand_name, brand_name)
+        out_path = out_dir / f"google_trend_{run_id}_{code}_all.csv"
+        write_wide_csv(stitched[cols], out_path)
+        written.append(out_path)
+        stats["rows_written"] += len(stitched) * len(cols)
+        stats["bytes"] += out_path.stat().st_size
+        print(f"[INFO] wide CSV 저장 완료: {out_path} (모델 {len(cols)}개)")
+
+    print(f"[INFO] 구글 트렌드 수집 완료 (성공 배치 {len(frames)}/{len(batches)})")
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="구글 트렌드 수집 (앵커 키워드 스티칭, car_model 기준)"
+    )
+    parser.add_argument("--run-id", required=True, help="수집 실행 ID (예: 25_11_16)")
+    parser.add_argument(
+        "--timeframe", default="today 12-m", help="pytrends timeframe (기본: today 12-m)"
+    )
+    parser.add_argument("--geo", default="KR", help="지역 코드 (기본: KR)")
+    parser.add_argument(
+        "--brands",
+        nargs="+",
+        default=["현대", "기아"],
+        help="대상 브랜드명 목록 (car_model.brand_name 기준)",
+    )
+    parser.add_argument(
+        "--anchor",
+        default=None,
+        help="모든 배치에 공통으로 넣을 앵커 모델명 (검색량이 중간 정도인 모델 권장)",
+    )
+    parser.add_argument("--workers", type=int, default=2, help="동시 요청 워커 수")
+    parser.add_argument(
+        "--max-retries", type=int, default=5, help="배치별 최대 재시도 횟수"
+    )
+    parser.add_argument(
+        "--backoff-base", type=float, default=30.0, help="재시도 백오프 기본 대기(초)"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["pytrends", "stub"],
+        default="pytrends",
+        help="수집 백엔드 (stub = 네트워크 없이 테스트)",
+    )
+    parser.add_argument(
+        "--limit-models", type=int, default=None, help="테스트용: 상위 N개 모델만 수집"
+    )
+    parser.add_argument(
+        "--models-csv",
+        type=Path,
+        default=None,
+        help="car_model 대신 brand_name,model_name_kr CSV 에서 대상 모델 읽기 (DB 불필요)",
+    )
+    parser.add_argument(
+        "--models",
+        nargs="+",
+        default=None,
+        help="car_model 대신 대상 모델 직접 지정 (예: 현대:아이오닉5 기아:EV6, DB 불필요)",
+    )
+    args = parser.parse_args()
+
+    models: Optional[List[dict]] = None
+    if args.models_csv is not None:
+        models = load_models_csv(args.models_csv, args.brands)
+    if args.models:
+        models = (models or []) + parse_model_args(args.models)
+
+    # stub + 모델 목록 지정이면 DB 없이 실행 (실행 기록은 JSONL 에만)
+    offline = args.backend == "stub" and models is not None
+    stats: Dict[str, int] = {}
+    ledger = RunLedger("run_google_trend_crawl", run_id=args.run_id, write_db=not offline)
+    with ledger.stage("crawl") as m:
+        run_google_trend_crawl(
+            run_id=args.run_id,
+            timeframe=args.timeframe,
+            geo=args.geo,
+            brands=args.brands,
+            anchor=args.anchor,
+            workers=args.workers,
+            max_retries=args.max_retries,
+            backoff_base=args.backoff_base,
+            backend_name=args.backend,
+            limit_models=args.limit_models,
+            stats=stats,
+            models=models,
+        )
+        # 재시도 횟수는 배치 함수 안에서만 보이므로 API 호출 수는 배치 수(최소값)로 기록
+        m.merge_stats(
+            stats,
+            api_calls="batches",
+            errors="failed_batches",
+            rows_written="rows_written",
+            bytes="bytes",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,12 +6,13 @@ import argparse
 import csv
 import time
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from sqlalchemy import text
 
 from src.api.naver_datalab import NaverDatalabClient
-from src.db.connection import get_engine
+from src.db.connection import get_write_engine
+from src.etl.run_ledger import RunLedger
 
 
 BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
@@ -23,7 +24,7 @@ def fetch_target_models(brands: List[str]) -> List[dict]:
     car_model 테이블에서 네이버 관심도 수집 대상 모델 목록을 조회한다.
     현재는 brand_name IN ('현대', '기아') 기준으로 필터링.
     """
-    engine = get_engine(echo=False)
+    engine = get_write_engine()
 
     placeholders = ", ".join([f":b{i}" for i in range(len(brands))])
     params = {f"b{i}": brand for i, brand in enumerate(brands)}
@@ -63,7 +64,7 @@ def run_naver_trend_crawl(
     brands: Optional[List[str]] = None,
     sleep_sec: float = 0.3,
     limit_models: Optional[int] = None,
-) -> None:
+) -> Dict[str, int]:
     """
     car_model 기준으로 현대/기아 모델의 네이버 검색 트렌드를 수집하여
     /data/raw/naver/<run_id>/naver_trend_<run_id>.csv 에 저장한다.
@@ -72,6 +73,8 @@ def run_naver_trend_crawl(
       - device: pc / mobile
       - gender: male / female
       - age_group: 현재는 필터 미사용 → 빈 문자열로 기록
+
+    return: 수집 통계 (api_calls, api_errors, empty_series, rows_written, bytes)
     """
     if brands is None:
         brands = ["현대", "기아"]
@@ -87,7 +90,7 @@ def run_naver_trend_crawl(
 
     if not models:
         print("[WARN] 대상 모델이 없습니다. car_model 테이블을 확인하세요.")
-        return
+        return {}
 
     print(f"[INFO] 수집 대상 모델 수: {len(models)}")
 
@@ -126,6 +129,9 @@ def run_naver_trend_crawl(
         writer.writeheader()
 
         total_calls = 0
+        api_errors = 0
+        empty_series = 0
+        rows_written = 0
 
         for idx, m in enumerate(models, start=1):
             model_id = m["model_id"]
@@ -150,6 +156,7 @@ def run_naver_trend_crawl(
                         )
                         total_calls += 1
                     except Exception as e:
+                        api_errors += 1
                         print(
                             f"[WARN] 네이버 API 호출 실패: "
                             f"[{brand_name}] {model_name}, device={device_code}, gender={gender_code}, error={e}"
@@ -157,6 +164,7 @@ def run_naver_trend_crawl(
                         continue
 
                     if not data_points:
+                        empty_series += 1
                         print(
                             f"[WARN] 네이버 데이터 없음: "
                             f"[{brand_name}] {model_name}, device={device_code}, gender={gender_code}"
@@ -181,12 +189,21 @@ def run_naver_trend_crawl(
                                 "ratio": ratio,
                             }
                         )
+                        rows_written += 1
 
                     if sleep_sec > 0:
                         time.sleep(sleep_sec)
 
     print(f"[INFO] 네이버 데이터랩 수집 완료: {out_path}")
     print(f"[INFO] 총 API 호출 수: {total_calls}")
+    return {
+        "models": len(models),
+        "api_calls": total_calls + api_errors,
+        "api_errors": api_errors,
+        "empty_series": empty_series,
+        "rows_written": rows_written,
+        "bytes": out_path.stat().st_size,
+    }
 
 
 def main():
@@ -223,15 +240,25 @@ def main():
 
     args = parser.parse_args()
 
-    run_naver_trend_crawl(
-        run_id=args.run_id,
-        start_date=args.start_date,
-        end_date=args.end_date,
-        time_unit=args.time_unit,
-        brands=args.brands,
-        sleep_sec=args.sleep_sec,
-        limit_models=args.limit_models,
-    )
+    ledger = RunLedger("run_naver_trend_crawl", run_id=args.run_id)
+    with ledger.stage("crawl") as m:
+        stats = run_naver_trend_crawl(
+            run_id=args.run_id,
+            start_date=args.start_date,
+            end_date=args.end_date,
+            time_unit=args.time_unit,
+            brands=args.brands,
+            sleep_sec=args.sleep_sec,
+            limit_models=args.limit_models,
+        )
+        m.merge_stats(
+            stats,
+            api_calls="api_calls",
+            errors="api_errors",
+            rows_written="rows_written",
+            rows_skipped="empty_series",
+            bytes="bytes",
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,413 @@
+# src/etl/job_runner.py
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import shlex
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+# 대시보드(src 를 sys.path 에 추가)와 ETL(프로젝트 루트 기준) 양쪽에서 import 하므로
+# 모듈 레벨에서는 DB 연결 모듈을 가져오지 않고 engine 을 인자로 받는다.
+BASE_DIR = Path(__file__).resolve().parents[2]
+LOG_DIR = BASE_DIR / "data" / "logs" / "etl_jobs"
+
+# 파이프라인별 기본 동시 실행 수 (Selenium/외부 API 는 한 번에 하나)
+DEFAULT_PIPELINE_CAP = 1
+CLAIM_LOCK_NAME = "etl_job_claim"
+
+INSERT_JOB_SQL = text(
+    """
+    INSERT INTO etl_job (
+        pipeline,
+        command_key,
+        script,
+        args_json,
+        requested_by
+    )
+    VALUES (
+        :pipeline,
+        :command_key,
+        :script,
+        :args_json,
+        :requested_by
+    )
+    """
+)
+
+
+def format_command(script: str, args: List[str]) -> str:
+    return " ".join(shlex.quote(part) for part in ["python", script, *args])
+
+
+# -----------------------------
+# 큐 (etl_job)
+# -----------------------------
+def enqueue_job(
+    engine: Engine,
+    pipeline: str,
+    command_key: str,
+    script: str,
+    args: List[str],
+    requested_by: Optional[str] = None,
+) -> int:
+    """작업을 queued 상태로 넣고 job_id 를 돌려준다. (실행은 워커가 가져감)"""
+    with engine.begin() as conn:
+        result = conn.execute(
+            INSERT_JOB_SQL,
+            {
+                "pipeline": pipeline,
+                "command_key": command_key,
+                "script": script,
+                "args_json": json.dumps(args, ensure_ascii=False),
+                "requested_by": requested_by,
+            },
+        )
+        return int(result.lastrowid)
+
+
+def request_cancel(engine: Engine, job_id: int) -> None:
+    """queued 작업은 바로 cancelled, running 작업은 워커가 다음 폴링 때 종료한다."""
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                UPDATE etl_job
+                SET status = 'cancelled', finished_at = NOW()
+                WHERE job_id = :job_id AND status = 'queued'
+                """
+            ),
+            {"job_id": job_id},
+        )
+        conn.execute(
+            text(
+                """
+                UPDATE etl_job
+                SET cancel_requested = 1
+                WHERE job_id = :job_id AND status = 'running'
+                """
+            ),
+            {"job_id": job_id},
+        )
+
+
+def claim_next_job(
+    engine: Engine, worker_id: str, caps: Dict[str, int], default_cap: int = DEFAULT_PIPELINE_CAP
+) -> Optional[Dict[str, Any]]:
+    """
+    파이프라인별 동시 실행 상한을 넘지 않는 가장 오래된 queued 작업을 running 으로 가져온다.
+    워커 여러 개가 같은 작업/상한을 동시에 보지 않도록 MySQL 이름 락(GET_LOCK)으로 감싼다.
+    """
+    with engine.connect() as conn:
+        got = conn.execute(
+            text("SELECT GET_LOCK(:name, 5)"), {"name": CLAIM_LOCK_NAME}
+        ).scalar()
+        if not got:
+            return None
+        try:
+            running = dict(
+                conn.execute(
+                    text(
+                        """
+                        SELECT pipeline, COUNT(*)
+                        FROM etl_job
+                        WHERE status = 'running'
+                        GROUP BY pipeline
+                        """
+                    )
+                ).all()
+            )
+            queued = conn.execute(
+                text(
+                    """
+                    SELECT job_id, pipeline, command_key, script, args_json
+                    FROM etl_job
+                    WHERE status = 'queued'
+                    ORDER BY job_id
+                    LIMIT 100
+                    """
+                )
+            ).mappings().all()
+
+            picked = None
+            for job in queued:
+                if int(running.get(job["pipeline"], 0)) < caps.get(job["pipeline"], default_cap):
+                    picked = dict(job)
+                    break
+            if picked is not None:
+                conn.execute(
+                    text(
+                        """
+                        UPDATE etl_job
+                        SET status = 'running', worker = :worker, started_at = NOW()
+                        WHERE job_id = :job_id AND status = 'queued'
+                        """
+                    ),
+                    {"worker": worker_id, "job_id": picked["job_id"]},
+                )
+            # 락을 풀기 전에 커밋해야 다음 워커가 running 상태를 본다
+            conn.commit()
+            return picked
+        finally:
+            conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": CLAIM_LOCK_NAME})
+            conn.commit()
+
+
+def _update_job(engine: Engine, job_id: int, **fields: Any) -> None:
+    assignments = ", ".join(f"{k} = :{k}" for k in fields)
+    with engine.begin() as conn:
+        conn.execute(
+            text(f"UPDATE etl_job SET {assignments} WHERE job_id = :job_id"),
+            {"job_id": job_id, **fields},
+        )
+
+
+def _cancel_requested(engine: Engine, job_id: int) -> bool:
+    with engine.connect() as conn:
+        return bool(
+            conn.execute(
+                text("SELECT cancel_requested FROM etl_job WHERE job_id = :job_id"),
+                {"job_id": job_id},
+            ).scalar()
+        )
+
+
+def run_job(engine: Engine, job: Dict[str, Any], poll_sec: float = 2.0) -> str:
+    """
+    작업 하나를 자식 프로세스로 실행한다.
+    stdout/stderr 는 버퍼링 없이(-u) 로그 파일로 바로 흘려보내 관리자 페이지에서 tail 할 수 있다.
+    return: 최종 status (success / failed / cancelled)
+    """
+    job_id = int(job["job_id"])
+    args = json.loads(job["args_json"] or "[]")
+    script_path = BASE_DIR / job["script"]
+
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    log_path = LOG_DIR / f"{job_id}_{job['command_key']}.log"
+    cmd = [sys.executable, "-u", str(script_path), *args]
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(BASE_DIR)
+    env["PYTHONUNBUFFERED"] = "1"
+    env["ETL_JOB_ID"] = str(job_id)  # run_ledger 가 etl_run 과 연결
+
+    started = time.perf_counter()
+    cancelled = False
+    with log_path.open("w", encoding="utf-8") as log:
+        log.write(f"$ {format_command(job['script'], args)}\n\n")
+        log.flush()
+        if not script_path.exists():
+            log.write(f"스크립트를 찾을 수 없습니다: {script_path}\n")
+            returncode = -1
+        else:
+            proc = subprocess.Popen(
+                cmd, cwd=BASE_DIR, env=env, stdout=log, stderr=subprocess.STDOUT
+            )
+            _update_job(
+                engine,
+                job_id,
+                pid=proc.pid,
+                log_path=str(log_path.relative_to(BASE_DIR)),
+            )
+            while proc.poll() is None:
+                time.sleep(poll_sec)
+                if not cancelled and _cancel_requested(engine, job_id):
+                    cancelled = True
+                    proc.terminate()
+                    try:
+                        proc.wait(timeout=10)
+                    except subprocess.TimeoutExpired:
+                        proc.kill()
+            returncode = proc.wait()
+
+    if cancelled:
+        status = "cancelled"
+    else:
+        status = "success" if returncode == 0 else "failed"
+    _update_job(
+        engine,
+        job_id,
+        status=status,
+        returncode=returncode,
+        finished_at=datetime.datetime.now(),
+        duration_sec=round(time.perf_counter() - started, 2),
+        log_path=str(log_path.relative_to(BASE_DIR)),
+    )
+    return status
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def recover_stale_jobs(engine: Engine, hostname: str) -> int:
+    """
+    이 호스트에서 running 으로 남아 있지만 프로세스가 없는 작업(워커 비정상 종료)을 failed 로 정리.
+    """
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(
+                """
+                SELECT job_id, pid
+                FROM etl_job
+                WHERE status = 'running' AND worker LIKE :host
+                """
+            ),
+            {"host": f"{hostname}:%"},
+        ).all()
+
+    stale = [int(job_id) for job_id, pid in rows if not _pid_alive(pid)]
+    for job_id in stale:
+        _update_job(engine, job_id, status="failed", finished_at=datetime.datetime.now())
+    return len(stale)
+
+
+# -----------------------------
+# 로그 tail (관리자 페이지 폴링용)
+# -----------------------------
+def tail_log(log_path: str | Path, offset: int = 0, max_bytes: int = 64 * 1024) -> Tuple[str, int]:
+    """
+    offset 이후에 추가된 로그를 읽는다. return: (새 텍스트, 다음 offset)
+    처음(offset=0) 읽을 때 파일이 크면 마지막 max_bytes 만 읽는다.
+    """
+    path = Path(log_path)
+    if not path.is_absolute():
+        path = BASE_DIR / path
+    if not path.exists():
+        return "", offset
+
+    size = path.stat().st_size
+    if size < offset:  # 같은 이름으로 다시 쓰인 경우
+        offset = 0
+    if offset == 0 and size > max_bytes:
+        offset = size - max_bytes
+    with path.open("rb") as f:
+        f.seek(offset)
+        chunk = f.read()
+    return chunk.decode("utf-8", errors="replace"), offset + len(chunk)
+
+
+# -----------------------------
+# 워커
+# -----------------------------
+def parse_cap_args(values: Optional[List[str]]) -> Dict[str, int]:
+    """['danawa=1', 'blog=2'] → {'danawa': 1, 'blog': 2}"""
+    caps: Dict[str, int] = {}
+    for item in values or []:
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"상한 형식은 pipeline=N 입니다: {item}")
+        caps[key.strip()] = int(value)
+    return caps
+
+
+def worker_loop(
+    caps: Dict[str, int],
+    default_cap: int = DEFAULT_PIPELINE_CAP,
+    poll_sec: float = 2.0,
+    once: bool = False,
+) -> None:
+    """queued 작업을 하나씩 가져와 실행. once=True 면 큐가 비었을 때 종료."""
+    from src.db.connection import get_write_engine
+
+    engine = get_write_engine()  # 프로세스(pid)별 캐시 엔진 (fork 후 커넥션 공유 방지)
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    stop = False
+
+    def _stop(signum, frame):
+        nonlocal stop
+        stop = True
+
+    # Ctrl+C / SIGTERM → 실행 중인 작업은 마치고 종료
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+    print(f"[INFO] 워커 시작: {worker_id}")
+
+    while not stop:
+        job = claim_next_job(engine, worker_id, caps, default_cap)
+        if job is None:
+            if once:
+                break
+            time.sleep(poll_sec)
+            continue
+        print(f"[INFO] [{worker_id}] job #{job['job_id']} 시작 → {job['command_key']}")
+        status = run_job(engine, job, poll_sec=poll_sec)
+        print(f"[INFO] [{worker_id}] job #{job['job_id']} {status}")
+
+    print(f"[INFO] 워커 종료: {worker_id}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="etl_job 큐를 처리하는 로컬 작업 워커 (관리자 페이지에서 넣은 ETL 실행)"
+    )
+    parser.add_argument("--workers", type=int, default=2, help="워커 프로세스 수")
+    parser.add_argument(
+        "--cap",
+        action="append",
+        default=None,
+        help="파이프라인별 동시 실행 상한 (예: --cap blog=2 --cap danawa=1)",
+    )
+    parser.add_argument(
+        "--default-cap",
+        type=int,
+        default=DEFAULT_PIPELINE_CAP,
+        help="--cap 에 없는 파이프라인의 동시 실행 상한",
+    )
+    parser.add_argument("--poll-sec", type=float, default=2.0, help="큐/취소 확인 주기(초)")
+    parser.add_argument("--once", action="store_true", help="큐가 비면 종료 (cron 용)")
+    args = parser.parse_args()
+
+    from src.db.connection import get_write_engine
+
+    caps = parse_cap_args(args.cap)
+    recovered = recover_stale_jobs(get_write_engine(), socket.gethostname())
+    if recovered:
+        print(f"[WARN] 프로세스가 없는 running 작업 {recovered}개를 failed 로 정리했습니다.")
+    print(f"[INFO] 워커 {args.workers}개, 파이프라인 상한 {caps or {}} (기본 {args.default_cap})")
+
+    if args.workers <= 1:
+        worker_loop(caps, args.default_cap, args.poll_sec, args.once)
+        return
+
+    procs = [
+        multiprocessing.Process(
+            target=worker_loop,
+            args=(caps, args.default_cap, args.poll_sec, args.once),
+            daemon=False,
+        )
+        for _ in range(args.workers)
+    ]
+    for p in procs:
+        p.start()
+    try:
+        for p in procs:
+            p.join()
+    except KeyboardInterrupt:
+        print("[INFO] 종료 요청 → 실행 중인 작업이 끝나면 워커가 멈춥니다.")
+        for p in procs:
+            if p.is_alive():
+                os.kill(p.pid, signal.SIGTERM)
+        for p in procs:
+            p.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,528 @@
+# src/etl/orchestrator.py
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+STATE_DIR = BASE_DIR / "data" / "processed" / "state" / "orchestrator"
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    ETL 스크립트 하나 = DAG 의 노드 하나.
+
+    - inputs / outputs: BASE_DIR 기준 glob 패턴 ({run_id} 치환).
+      inputs 중 outputs 에 해당하는 파일은 입력 지문에서 제외한다.
+    - external: 외부 소스(크롤링/API)를 읽는 단계. 입력 파일이 없으므로
+      같은 run_id + 같은 인자로 이미 성공했으면 재실행하지 않는다.
+    """
+
+    key: str
+    pipeline: str
+    script: str
+    args: Callable[[argparse.Namespace], List[str]]
+    deps: Tuple[str, ...] = ()
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    external: bool = False
+
+
+def _run_id_args(o: argparse.Namespace) -> List[str]:
+    return ["--run-id", o.run_id]
+
+
+def _optional(flag: str, value: Any) -> List[str]:
+    return [flag, str(value)] if value not in (None, "", 0) else []
+
+
+# 다나와 정규화(normalize_folder)는 run_danawa_model_crawl.py 안에서 브랜드 폴더마다 수행된다.
+STAGES: List[Stage] = [
+    # ① 다나와
+    Stage(
+        key="danawa_crawl",
+        pipeline="danawa",
+        script="src/etl/sales/run_danawa_model_crawl.py",
+        args=lambda o: _run_id_args(o)
+        + ["--year", str(o.year), "--start-month", str(o.start_month), "--end-month", str(o.end_month)],
+        outputs=("data/raw/danawa/{run_id}/*/*.csv",),
+        external=True,
+    ),
+    Stage(
+        key="danawa_meta",
+        pipeline="danawa",
+        script="src/etl/sales/load_danawa_meta_to_db.py",
+        args=_run_id_args,
+        deps=("danawa_crawl",),
+        inputs=("data/raw/danawa/{run_id}/*/*_model_meta_*.csv",),
+    ),
+    Stage(
+        key="danawa_sales",
+        pipeline="danawa",
+        script="src/etl/sales/load_danawa_sales_to_db.py",
+        args=_run_id_args,
+        deps=("danawa_meta",),
+        inputs=("data/raw/danawa/{run_id}/*/*_normalized.csv",),
+    ),
+    # ② 네이버 데이터랩
+    Stage(
+        key="naver_crawl",
+        pipeline="naver",
+        script="src/etl/interest/run_naver_trend_crawl.py",
+        args=lambda o: _run_id_args(o)
+        + ["--start-date", o.start_date, "--end-date", o.end_date]
+        + _optional("--limit-models", o.limit_models),
+        outputs=("data/raw/naver/{run_id}/naver_trend_{run_id}.csv",),
+        external=True,
+    ),
+    Stage(
+        key="naver_normalize",
+        pipeline="naver",
+        script="src/etl/interest/normalize_naver_detail.py",
+        args=_run_id_args,
+        deps=("naver_crawl",),
+        inputs=("data/raw/naver/{run_id}/naver_trend_{run_id}.csv",),
+        outputs=("data/raw/naver/{run_id}/naver_trend_{run_id}_detail_normalized.csv",),
+    ),
+    Stage(
+        key="naver_detail",
+        pipeline="naver",
+        script="src/etl/interest/load_naver_interest_detail.py",
+        args=_run_id_args,
+        deps=("naver_normalize",),
+        inputs=("data/raw/naver/{run_id}/naver_trend_{run_id}_detail_normalized.csv",),
+    ),
+    Stage(
+        key="naver_aggregate",
+        pipeline="naver",
+        script="src/etl/interest/aggregate_naver_interest.py",
+        args=lambda o: ["--incremental"],
+        deps=("naver_detail",),
+    ),
+    # ③ 구글 트렌드
+    Stage(
+        key="google_crawl",
+        pipeline="google",
+        script="src/etl/interest/run_google_trend_crawl.py",
+        args=lambda o: _run_id_args(o)
+        + ["--timeframe", o.timeframe]
+        + _optional("--limit-models", o.limit_models),
+        outputs=("data/raw/google/{run_id}/google_trend_{run_id}_*_all.csv",),
+        external=True,
+    ),
+    Stage(
+        key="google_normalize",
+        pipeline="google",
+        script="src/etl/interest/normalize_google_trend_wide.py",
+        args=lambda o: _run_id_args(o) + ["--vectorized"],
+        deps=("google_crawl",),
+        inputs=("data/raw/google/{run_id}/*.csv",),
+        outputs=("data/raw/google/{run_id}/google_trend_{run_id}_normalized.csv",),
+    ),
+    Stage(
+        key="google_load",
+        pipeline="google",
+        script="src/etl/interest/load_google_trend.py",
+        args=_run_id_args,
+        deps=("google_normalize",),
+        inputs=("data/raw/google/{run_id}/google_trend_{run_id}_normalized.csv",),
+    ),
+    # ④ 네이버 블로그
+    Stage(
+        key="blog_collect",
+        pipeline="blog",
+        script="src/etl/blog/run_naver_blog_wordcloud.py",
+        args=lambda o: _run_id_args(o) + _optional("--limit-models", o.limit_models),
+        external=True,
+    ),
+    Stage(
+        key="blog_token_trend",
+        pipeline="blog",
+        script="src/etl/blog/compute_token_trends.py",
+        args=lambda o: _run_id_args(o) + _optional("--month", o.month),
+        deps=("blog_collect",),
+    ),
+    Stage(
+        key="blog_wordcloud",
+        pipeline="blog",
+        script="src/etl/blog/generate_wordcloud.py",
+        args=lambda o: _run_id_args(o)
+        + _optional("--month", o.month)
+        + _optional("--limit-models", o.limit_models),
+        deps=("blog_collect",),
+    ),
+    # ⑤ 대시보드 읽기 전용 스냅샷 (MySQL → SQLite/DuckDB, DB_BACKEND 로 선택)
+    Stage(
+        key="snapshot_export",
+        pipeline="snapshot",
+        script="src/db/export_snapshot.py",
+        args=lambda o: ["--backend", o.snapshot_backend],
+        deps=("danawa_sales", "naver_aggregate", "google_load", "blog_token_trend", "blog_wordcloud"),
+    ),
+]
+
+STAGE_MAP: Dict[str, Stage] = {s.key: s for s in STAGES}
+PIPELINES: Tuple[str, ...] = tuple(dict.fromkeys(s.pipeline for s in STAGES))
+
+
+# -----------------------------
+# DAG 선택
+# -----------------------------
+def descendants(keys: Iterable[str]) -> Set[str]:
+    """keys 와 그 하위(의존하는) 단계 전부."""
+    result = set(keys)
+    changed = True
+    while changed:
+        changed = False
+        for s in STAGES:
+            if s.key not in result and any(d in result for d in s.deps):
+                result.add(s.key)
+                changed = True
+    return result
+
+
+def select_stages(
+    only: Optional[Sequence[str]] = None,
+    from_stage: Optional[str] = None,
+    skip_crawl: bool = False,
+) -> List[Stage]:
+    """
+    실행 대상 단계 (STAGES 순서 = 위상 정렬 순서 유지).
+    only: 단계 key 또는 파이프라인 이름(danawa/naver/google/blog)
+    from_stage: 이 단계와 하위 단계만
+    """
+    selected = set(STAGE_MAP)
+    if only:
+        picked: Set[str] = set()
+        for name in only:
+            if name in PIPELINES:
+                picked |= {s.key for s in STAGES if s.pipeline == name}
+            elif name in STAGE_MAP:
+                picked.add(name)
+            else:
+                raise ValueError(f"알 수 없는 단계/파이프라인: {name}")
+        selected &= picked
+    if from_stage:
+        if from_stage not in STAGE_MAP:
+            raise ValueError(f"알 수 없는 단계: {from_stage}")
+        selected &= descendants([from_stage])
+    if skip_crawl:
+        selected -= {s.key for s in STAGES if s.external}
+    return [s for s in STAGES if s.key in selected]
+
+
+# -----------------------------
+# 입력 지문 / 체크포인트
+# -----------------------------
+def _expand(patterns: Iterable[str], run_id: str) -> Set[Path]:
+    paths: Set[Path] = set()
+    for pattern in patterns:
+        paths.update(p for p in BASE_DIR.glob(pattern.format(run_id=run_id)) if p.is_file())
+    return paths
+
+
+def files_digest(patterns: Iterable[str], run_id: str, exclude: Iterable[str] = ()) -> str:
+    """glob 에 걸린 파일들의 (경로, 크기, mtime) 해시. 내용을 읽지 않아 큰 CSV 도 빠르다."""
+    h = hashlib.sha256()
+    for p in sorted(_expand(patterns, run_id) - _expand(exclude, run_id)):
+        st = p.stat()
+        h.update(f"{p.relative_to(BASE_DIR)}|{st.st_size}|{st.st_mtime_ns}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def stage_fingerprint(
+    stage: Stage, cli_args: List[str], run_id: str, upstream: Dict[str, Optional[str]]
+) -> str:
+    """스크립트 + 인자 + 입력 파일 + 상위 단계 산출물 지문."""
+    payload = {
+        "script": stage.script,
+        "args": cli_args,
+        "inputs": files_digest(stage.inputs, run_id, exclude=stage.outputs) if stage.inputs else None,
+        "upstream": {d: upstream.get(d) for d in stage.deps},
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def state_path(run_id: str) -> Path:
+    return STATE_DIR / f"{run_id}.json"
+
+
+def load_state(run_id: str) -> Dict[str, Any]:
+    path = state_path(run_id)
+    if not path.exists():
+        return {"run_id": run_id, "stages": {}}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_state(state: Dict[str, Any]) -> None:
+    """임시 파일에 쓰고 교체 (중간에 죽어도 체크포인트가 깨지지 않도록)."""
+    path = state_path(state["run_id"])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+# -----------------------------
+# 실행
+# -----------------------------
+@dataclass
+class StageResult:
+    key: str
+    status: str  # success / failed / skipped / blocked / planned
+    seconds: float = 0.0
+    detail: str = ""
+
+
+@dataclass
+class Orchestrator:
+    run_id: str
+    options: argparse.Namespace
+    stages: List[Stage]
+    workers: int = 4
+    force: bool = False
+    dry_run: bool = False
+    state: Dict[str, Any] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __post_init__(self):
+        self.state = load_state(self.run_id)
+        self.log_dir = STATE_DIR / "logs" / self.run_id
+
+    def _record(self, key: str) -> Dict[str, Any]:
+        return self.state["stages"].get(key, {})
+
+    def _upstream_digests(self, stage: Stage, results: Dict[str, StageResult]) -> Dict[str, Optional[str]]:
+        digests: Dict[str, Optional[str]] = {}
+        for d in stage.deps:
+            if d in results and results[d].status == "planned":
+                digests[d] = "planned"  # dry-run: 상위가 다시 돈다고 가정
+            else:
+                digests[d] = self._record(d).get("output_digest")
+        return digests
+
+    def _should_skip(self, stage: Stage, fingerprint: str) -> bool:
+        rec = self._record(stage.key)
+        return (
+            not self.force
+            and rec.get("status") == "success"
+            and rec.get("fingerprint") == fingerprint
+        )
+
+    def _execute(self, stage: Stage, cli_args: List[str]) -> Tuple[int, float, Path]:
+        script_path = BASE_DIR / stage.script
+        cmd = [sys.executable, str(script_path), *cli_args]
+        env = os.environ.copy()
+        env["PYTHONPATH"] = str(BASE_DIR)
+
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        log_path = self.log_dir / f"{stage.key}.log"
+        started = time.perf_counter()
+        with log_path.open("w", encoding="utf-8") as log:
+            log.write(f"$ {' '.join(cmd)}\n\n")
+            log.flush()
+            proc = subprocess.run(
+                cmd, cwd=BASE_DIR, env=env, stdout=log, stderr=subprocess.STDOUT, text=True
+            )
+        return proc.returncode, time.perf_counter() - started, log_path
+
+    def _run_stage(self, stage: Stage, cli_args: List[str], fingerprint: str) -> StageResult:
+        print(f"[INFO] ▶ {stage.key} 시작")
+        started_at = datetime.datetime.now().isoformat(timespec="seconds")
+        try:
+            returncode, seconds, log_path = self._execute(stage, cli_args)
+        except Exception as e:
+            returncode, seconds, log_path = -1, 0.0, None
+            print(f"[WARN] {stage.key} 실행 실패: {e}")
+
+        finished_at = datetime.datetime.now().isoformat(timespec="seconds")
+        rec: Dict[str, Any] = {
+            "status": "success" if returncode == 0 else "failed",
+            "fingerprint": fingerprint,
+            "args": cli_args,
+            "returncode": returncode,
+            "started_at": started_at,
+            "finished_at": finished_at,
+            "seconds": round(seconds, 2),
+            "log": str(log_path.relative_to(BASE_DIR)) if log_path else None,
+        }
+        if returncode == 0:
+            # 산출물 파일이 있으면 그 지문, DB 적재 단계는 실행 시각으로 하위 단계 재실행을 유도
+            rec["output_digest"] = (
+                files_digest(stage.outputs, self.run_id)
+                if stage.outputs
+                else f"{fingerprint}@{finished_at}"
+            )
+        else:
+            rec["output_digest"] = self._record(stage.key).get("output_digest")
+
+        with self._lock:
+            self.state["stages"][stage.key] = rec
+            save_state(self.state)
+
+        if returncode == 0:
+            print(f"[INFO] ✔ {stage.key} 완료 ({seconds:.1f}s)")
+            return StageResult(stage.key, "success", seconds)
+        print(f"[WARN] ✖ {stage.key} 실패 (returncode={returncode}) → {rec['log']}")
+        return StageResult(stage.key, "failed", seconds, f"returncode={returncode}")
+
+    def run(self) -> Dict[str, StageResult]:
+        """
+        의존 단계가 끝난 단계부터 워커 풀에 넣는다.
+        서로 다른 파이프라인(다나와/네이버/구글/블로그)은 동시에 진행되고,
+        실패한 단계의 하위 단계는 blocked 로 남는다.
+        """
+        pending: Dict[str, Stage] = {s.key: s for s in self.stages}
+        results: Dict[str, StageResult] = {}
+        running: Dict[Future, str] = {}
+
+        def deps_state(stage: Stage) -> Optional[str]:
+            """None = 아직 대기, 'ok' = 실행 가능, 'blocked' = 상위 실패."""
+            for d in stage.deps:
+                if d not in pending and d not in results and d not in running.values():
+                    continue  # 이번 실행 대상이 아닌 상위 단계 → 체크포인트 기준으로 진행
+                res = results.get(d)
+                if res is None:
+                    return None
+                if res.status in ("failed", "blocked"):
+                    return "blocked"
+            return "ok"
+
+        with ThreadPoolExecutor(max_workers=max(1, self.workers)) as pool:
+            while pending or running:
+                for key, stage in list(pending.items()):
+                    ready = deps_state(stage)
+                    if ready is None:
+                        continue
+                    del pending[key]
+                    if ready == "blocked":
+                        results[key] = StageResult(key, "blocked", detail="상위 단계 실패")
+                        print(f"[WARN] {key} 건너뜀 (상위 단계 실패)")
+                        continue
+
+                    cli_args = stage.args(self.options)
+                    fingerprint = stage_fingerprint(
+                        stage, cli_args, self.run_id, self._upstream_digests(stage, results)
+                    )
+                    if self._should_skip(stage, fingerprint):
+                        results[key] = StageResult(key, "skipped", detail="입력 변경 없음")
+                        print(f"[INFO] 스킵 (입력 변경 없음) → {key}")
+                        continue
+                    if self.dry_run:
+                        results[key] = StageResult(key, "planned", detail=" ".join(cli_args))
+                        print(f"[INFO] 실행 예정 → {key}: {stage.script} {' '.join(cli_args)}")
+                        continue
+                    running[pool.submit(self._run_stage, stage, cli_args, fingerprint)] = key
+
+                if not running:
+                    if pending:
+                        # 대기 중인데 실행 중인 것이 없으면 의존성이 풀리지 않는 상태
+                        for key in pending:
+                            results[key] = StageResult(key, "blocked", detail="의존성 해소 불가")
+                        pending.clear()
+                    continue
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for fut in done:
+                    key = running.pop(fut)
+                    results[key] = fut.result()
+
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="ETL 스크립트 DAG 실행기 (파이프라인 병렬 실행 + 단계별 체크포인트/재개)"
+    )
+    parser.add_argument(
+        "--run-id",
+        default=datetime.datetime.now().strftime("%y_%m_%d"),
+        help="실행 ID (data/raw/<source>/<run_id>, 체크포인트 파일명)",
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        default=None,
+        help=f"실행할 단계 key 또는 파이프라인 ({', '.join(PIPELINES)})",
+    )
+    parser.add_argument("--from", dest="from_stage", default=None, help="이 단계와 하위 단계만 실행")
+    parser.add_argument(
+        "--skip-crawl", action="store_true", help="크롤링/API 수집 단계를 빼고 이미 받은 파일로 실행"
+    )
+    parser.add_argument("--force", action="store_true", help="체크포인트/입력 지문 무시하고 전부 실행")
+    parser.add_argument("--dry-run", action="store_true", help="실행 계획만 출력")
+    parser.add_argument("--workers", type=int, default=4, help="동시에 실행할 단계 수")
+    parser.add_argument("--list", action="store_true", help="단계 목록과 마지막 체크포인트 출력")
+
+    today = datetime.date.today()
+    parser.add_argument("--year", type=int, default=today.year, help="다나와 수집 연도")
+    parser.add_argument("--start-month", type=int, default=1, help="다나와 수집 시작 월")
+    parser.add_argument("--end-month", type=int, default=today.month, help="다나와 수집 종료 월")
+    parser.add_argument(
+        "--start-date", default=f"{today.year - 1}-{today.month:02d}-01", help="네이버 API 시작일"
+    )
+    parser.add_argument("--end-date", default=today.isoformat(), help="네이버 API 종료일")
+    parser.add_argument("--timeframe", default="today 12-m", help="구글 트렌드 timeframe")
+    parser.add_argument("--month", default=None, help="블로그 증감/워드클라우드 기준 월 (YYYY-MM)")
+    parser.add_argument("--limit-models", type=int, default=None, help="테스트용 모델 제한")
+    parser.add_argument(
+        "--snapshot-backend",
+        choices=["sqlite", "duckdb", "parquet"],
+        default="sqlite",
+        help="snapshot_export 단계에서 만들 대시보드 스냅샷 형식",
+    )
+    args = parser.parse_args()
+
+    if args.list:
+        state = load_state(args.run_id)
+        for s in STAGES:
+            rec = state["stages"].get(s.key, {})
+            deps = ",".join(s.deps) or "-"
+            print(
+                f"  {s.pipeline:>7} | {s.key:<18} deps={deps:<16} "
+                f"last={rec.get('status', '-')} {rec.get('finished_at', '')}"
+            )
+        return
+
+    stages = select_stages(args.only, args.from_stage, skip_crawl=args.skip_crawl)
+    print(f"[INFO] run_id={args.run_id}, 대상 단계 {len(stages)}개: {[s.key for s in stages]}")
+
+    orch = Orchestrator(
+        run_id=args.run_id,
+        options=args,
+        stages=stages,
+        workers=args.workers,
+        force=args.force,
+        dry_run=args.dry_run,
+    )
+    started = time.perf_counter()
+    results = orch.run()
+
+    print("\n[SUMMARY] ETL 오케스트레이터 결과")
+    for s in stages:
+        r = results.get(s.key)
+        if r is None:
+            continue
+        extra = f" ({r.detail})" if r.detail else ""
+        print(f"  {s.key}: {r.status} {r.seconds:.1f}s{extra}")
+    print(f"  total: {time.perf_counter() - started:.1f}s")
+
+    if any(r.status in ("failed", "blocked") for r in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
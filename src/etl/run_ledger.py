@@ -0,0 +1,194 @@
+# src/etl/run_ledger.py
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+LEDGER_JSONL = BASE_DIR / "data" / "logs" / "etl_runs.jsonl"
+
+INSERT_RUN_SQL = text(
+    """
+    INSERT INTO etl_run (
+        run_uuid,
+        run_id,
+        job_id,
+        script,
+        stage,
+        status,
+        started_at,
+        finished_at,
+        duration_sec,
+        rows_read,
+        rows_written,
+        rows_skipped,
+        api_calls,
+        bytes,
+        errors,
+        rows_per_sec,
+        host,
+        extra_json
+    )
+    VALUES (
+        :run_uuid,
+        :run_id,
+        :job_id,
+        :script,
+        :stage,
+        :status,
+        :started_at,
+        :finished_at,
+        :duration_sec,
+        :rows_read,
+        :rows_written,
+        :rows_skipped,
+        :api_calls,
+        :bytes,
+        :errors,
+        :rows_per_sec,
+        :host,
+        :extra_json
+    )
+    """
+)
+
+
+@dataclass
+class StageMetrics:
+    """한 단계의 처리량 카운터. 스크립트가 with 블록 안에서 채운다."""
+
+    rows_read: int = 0
+    rows_written: int = 0
+    rows_skipped: int = 0
+    api_calls: int = 0
+    bytes: int = 0
+    errors: int = 0
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    def add(self, **counts: int) -> None:
+        for key, value in counts.items():
+            setattr(self, key, getattr(self, key) + int(value or 0))
+
+    def merge_stats(self, stats: Mapping[str, Any], **mapping: str) -> None:
+        """
+        기존 스크립트의 stats dict 를 그대로 넘긴다.
+        mapping: 지표 이름 → stats key (예: rows_written="insert_or_update")
+        stats 전체는 extra 에도 남긴다.
+        """
+        for metric, key in mapping.items():
+            self.add(**{metric: stats.get(key, 0)})
+        self.extra.update({k: v for k, v in stats.items() if isinstance(v, (int, float, str))})
+
+
+class RunLedger:
+    """
+    ETL 스크립트 실행 기록.
+
+    ledger = RunLedger("load_danawa_sales_to_db", run_id=args.run_id)
+    with ledger.stage("load") as m:
+        ...
+        m.add(rows_read=n, rows_written=k)
+
+    단계가 끝날 때마다 data/logs/etl_runs.jsonl 에 한 줄 추가하고 etl_run 테이블에 insert 한다.
+    DB 기록이 실패해도 JSONL 은 남고 ETL 자체는 계속 진행한다.
+    """
+
+    def __init__(
+        self,
+        script: str,
+        run_id: Optional[str] = None,
+        engine: Optional[Engine] = None,
+        write_db: bool = True,
+    ):
+        self.script = script
+        self.run_id = run_id
+        self.run_uuid = uuid.uuid4().hex
+        # job_runner 로 실행되면 etl_job.job_id 와 연결
+        job_id = os.getenv("ETL_JOB_ID")
+        self.job_id = int(job_id) if job_id and job_id.isdigit() else None
+        self.host = socket.gethostname()
+        self._engine = engine
+        self._write_db = write_db
+        self._lock = threading.Lock()
+
+    def _get_engine(self) -> Engine:
+        if self._engine is None:
+            from src.db.connection import get_write_engine
+
+            self._engine = get_write_engine()
+        return self._engine
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageMetrics]:
+        metrics = StageMetrics()
+        started_at = datetime.datetime.now()
+        started = time.perf_counter()
+        status = "success"
+        try:
+            yield metrics
+        except BaseException as e:
+            status = "failed"
+            metrics.errors += 1
+            metrics.extra["error"] = f"{type(e).__name__}: {e}"[:500]
+            raise
+        finally:
+            self._record(name, status, metrics, started_at, time.perf_counter() - started)
+
+    def _record(
+        self,
+        stage: str,
+        status: str,
+        metrics: StageMetrics,
+        started_at: datetime.datetime,
+        seconds: float,
+    ) -> None:
+        rows = max(metrics.rows_written, metrics.rows_read)
+        row = {
+            "run_uuid": self.run_uuid,
+            "run_id": self.run_id,
+            "job_id": self.job_id,
+            "script": self.script,
+            "stage": stage,
+            "status": status,
+            "started_at": started_at,
+            "finished_at": datetime.datetime.now(),
+            "duration_sec": round(seconds, 3),
+            **{k: v for k, v in asdict(metrics).items() if k != "extra"},
+            "rows_per_sec": round(rows / seconds, 2) if seconds > 0 and rows > 0 else None,
+            "host": self.host,
+            "extra_json": json.dumps(metrics.extra, ensure_ascii=False, default=str),
+        }
+
+        with self._lock:
+            try:
+                LEDGER_JSONL.parent.mkdir(parents=True, exist_ok=True)
+                with LEDGER_JSONL.open("a", encoding="utf-8") as f:
+                    f.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+            except OSError as e:
+                print(f"[WARN] 실행 기록(JSONL) 저장 실패: {e}")
+
+            if self._write_db:
+                try:
+                    with self._get_engine().begin() as conn:
+                        conn.execute(INSERT_RUN_SQL, row)
+                except Exception as e:
+                    print(f"[WARN] 실행 기록(etl_run) 저장 실패: {e}")
+
+        rate = f", {row['rows_per_sec']} rows/s" if row["rows_per_sec"] else ""
+        print(
+            f"[INFO] [ledger] {self.script}/{stage} {status} "
+            f"{seconds:.1f}s (read={metrics.rows_read}, written={metrics.rows_written}{rate})"
+        )
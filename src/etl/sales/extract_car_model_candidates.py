@@ -5,6 +5,8 @@ import re
 from dataclasses import dataclass
 from pathlib import Path
 
+from src.etl.run_ledger import RunLedger
+
 
 BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
 DANAWA_BASE = BASE_DIR / "data" / "raw" / "danawa" / "25_11_14"
@@ -116,8 +118,11 @@ def save_candidates_to_csv(stats: dict[tuple[str, str], ModelStat]):
 
 
 def main():
-    stats = build_model_candidates()
-    save_candidates_to_csv(stats)
+    ledger = RunLedger("extract_car_model_candidates")
+    with ledger.stage("extract_candidates") as m:
+        stats = build_model_candidates()
+        save_candidates_to_csv(stats)
+        m.add(rows_written=len(stats), bytes=OUTPUT_PATH.stat().st_size)
     print(f"총 모델 수: {len(stats)}개")
     print(f"→ {OUTPUT_PATH} 에 후보 리스트 저장 완료")
 
@@ -6,7 +6,8 @@ from pathlib import Path
 from sqlalchemy import text
 
 # 프로젝트의 DB 연결 함수
-from src.db.connection import get_engine
+from src.db.connection import get_write_engine
+from src.etl.run_ledger import RunLedger
 
 
 # ----------------------------------------
@@ -39,11 +40,15 @@ def load_candidates():
 # ----------------------------------------
 
 
-def upsert_car_model():
-    engine = get_engine(echo=False)
+def upsert_car_model() -> tuple[int, int]:
+    """return: (후보 행 수, 신규 INSERT 수)"""
+    engine = get_write_engine()
+    total = 0
+    inserted = 0
 
     with engine.begin() as conn:
         for row in load_candidates():
+            total += 1
             brand_name = row["brand_name"].strip()
             model_name_kr = row["model_name_kr"].strip()
 
@@ -84,8 +89,10 @@ def upsert_car_model():
                 ),
                 {"brand_name": brand_name, "model_name_kr": model_name_kr},
             )
+            inserted += 1
 
     print("[OK] car_model 테이블 적재 완료!")
+    return total, inserted
 
 
 # ----------------------------------------
@@ -95,7 +102,10 @@ def upsert_car_model():
 
 def main():
     print(f"[INFO] 후보 파일: {CANDIDATES_PATH}")
-    upsert_car_model()
+    ledger = RunLedger("load_car_model_from_candidates")
+    with ledger.stage("load_car_model") as m:
+        total, inserted = upsert_car_model()
+        m.add(rows_read=total, rows_written=inserted, rows_skipped=total - inserted)
 
 
 if __name__ == "__main__":
@@ -11,7 +11,8 @@ from urllib.parse import urlparse, parse_qs
 
 from sqlalchemy import text
 
-from src.db.connection import get_engine
+from src.db.connection import get_write_engine
+from src.etl.run_ledger import RunLedger
 
 
 BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
@@ -251,7 +252,7 @@ def process_meta_for_brand(
 
 
 def run_loader(run_id: str, brands: List[str]) -> None:
-    engine = get_engine(echo=False)
+    engine = get_write_engine()
 
     stats = {
         "total_rows": 0,
@@ -262,9 +263,17 @@ def run_loader(run_id: str, brands: List[str]) -> None:
         "danawa_id_conflict": 0,
     }
 
-    with engine.begin() as conn:
-        for brand in brands:
-            process_meta_for_brand(conn, run_id=run_id, brand_code=brand, stats=stats)
+    ledger = RunLedger("load_danawa_meta_to_db", run_id=run_id, engine=engine)
+    with ledger.stage("load_meta") as m:
+        with engine.begin() as conn:
+            for brand in brands:
+                process_meta_for_brand(conn, run_id=run_id, brand_code=brand, stats=stats)
+        m.merge_stats(
+            stats,
+            rows_read="total_rows",
+            rows_written="car_model_updated",
+            rows_skipped="no_model_match",
+        )
 
     print("\n[SUMMARY] 다나와 메타 로더 결과")
     for k, v in stats.items():
@@ -6,7 +6,8 @@ from pathlib import Path
 
 from sqlalchemy import text
 
-from src.db.connection import get_engine
+from src.db.connection import get_write_engine
+from src.etl.run_ledger import RunLedger
 
 
 # ----------------------------------------
@@ -70,8 +71,9 @@ def build_model_id_map(conn):
 # ----------------------------------------
 
 
-def load_sales():
-    engine = get_engine(echo=False)
+def load_sales() -> dict:
+    """return: {"total_rows", "inserted_rows", "skipped_no_model"}"""
+    engine = get_write_engine()
 
     with engine.begin() as conn:
         model_id_map = build_model_id_map(conn)
@@ -152,10 +154,24 @@ def load_sales():
         print(f"[DONE] 삽입/업데이트된 행 수: {inserted_rows}")
         print(f"[DONE] car_model에 매칭되지 않아 스킵된 행 수: {skipped_no_model}")
 
+    return {
+        "total_rows": total_rows,
+        "inserted_rows": inserted_rows,
+        "skipped_no_model": skipped_no_model,
+    }
+
 
 def main():
     print(f"[INFO] DANAWA_BASE: {DANAWA_BASE}")
-    load_sales()
+    ledger = RunLedger("load_danawa_sales_from_normalized", run_id=DANAWA_BASE.name)
+    with ledger.stage("load_sales") as m:
+        stats = load_sales()
+        m.merge_stats(
+            stats,
+            rows_read="total_rows",
+            rows_written="inserted_rows",
+            rows_skipped="skipped_no_model",
+        )
 
 
 if __name__ == "__main__":
@@ -11,7 +11,8 @@ from typing import Dict, List, Optional
 
 from sqlalchemy import text
 
-from src.db.connection import get_engine
+from src.db.connection import get_write_engine
+from src.etl.run_ledger import RunLedger
 
 
 BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
@@ -236,7 +237,7 @@ def process_sales_for_brand(
 
 
 def run_loader(run_id: str, brands: List[str]) -> None:
-    engine = get_engine(echo=False)
+    engine = get_write_engine()
 
     stats: Dict[str, int] = {
         "total_rows": 0,
@@ -244,9 +245,17 @@ def run_loader(run_id: str, brands: List[str]) -> None:
         "insert_or_update": 0,
     }
 
-    with engine.begin() as conn:
-        for brand in brands:
-            process_sales_for_brand(conn, run_id=run_id, brand_code=brand, stats=stats)
+    ledger = RunLedger("load_danawa_sales_to_db", run_id=run_id, engine=engine)
+    with ledger.stage("load_sales") as m:
+        with engine.begin() as conn:
+            for brand in brands:
+                process_sales_for_brand(conn, run_id=run_id, brand_code=brand, stats=stats)
+        m.merge_stats(
+            stats,
+            rows_read="total_rows",
+            rows_written="insert_or_update",
+            rows_skipped="no_model_match",
+        )
 
     print("\n[SUMMARY] 다나와 판매량 로더 결과")
     for k, v in stats.items():
@@ -14,6 +14,7 @@ from src.etl.sales.danawa_scraper import (
     Brand,
 )
 from src.etl.sales.danawa_normalizer import normalize_folder
+from src.etl.run_ledger import RunLedger
 
 
 BASE_DIR = Path(__file__).resolve().parents[3]  # 프로젝트 루트
@@ -37,30 +38,38 @@ def run_crawl(
     months = build_month_list(year, start_month, end_month)
     base_raw = BASE_DIR / "data" / "raw" / "danawa" / run_id
 
+    ledger = RunLedger("run_danawa_model_crawl", run_id=run_id)
     driver = get_driver(headless=headless)
     try:
-        for month in months:
-            for brand in brands:
-                rows = scrape_month_for_brand(driver, brand=brand, month=month)
-
-                if not rows:
-                    continue
-
-                brand_dir = base_raw / brand
-                brand_dir.mkdir(parents=True, exist_ok=True)
-
-                # raw 판매량 CSV: 기존 팀원 명명 규칙 유지
-                sales_filename = f"{brand}_model_sales_{month.replace('-', '_')}.csv"
-                sales_path = brand_dir / sales_filename
-                save_sales_csv(rows, sales_path)
-
-                # 메타 CSV: 모델 상세 URL / 이미지 URL
-                meta_filename = f"{brand}_model_meta_{month.replace('-', '_')}.csv"
-                meta_path = brand_dir / meta_filename
-                save_meta_csv(rows, meta_path)
-
-                # 바로 이 폴더에 대해 normalized CSV 생성
-                normalize_folder(brand_dir)
+        with ledger.stage("crawl") as m:
+            for month in months:
+                for brand in brands:
+                    rows = scrape_month_for_brand(driver, brand=brand, month=month)
+                    m.add(api_calls=1, rows_read=len(rows))
+
+                    if not rows:
+                        m.add(rows_skipped=1)
+                        continue
+
+                    brand_dir = base_raw / brand
+                    brand_dir.mkdir(parents=True, exist_ok=True)
+
+                    # raw 판매량 CSV: 기존 팀원 명명 규칙 유지
+                    sales_filename = f"{brand}_model_sales_{month.replace('-', '_')}.csv"
+                    sales_path = brand_dir / sales_filename
+                    save_sales_csv(rows, sales_path)
+
+                    # 메타 CSV: 모델 상세 URL / 이미지 URL
+                    meta_filename = f"{brand}_model_meta_{month.replace('-', '_')}.csv"
+                    meta_path = brand_dir / meta_filename
+                    save_meta_csv(rows, meta_path)
+
+                    # 바로 이 폴더에 대해 normalized CSV 생성
+                    normalize_folder(brand_dir)
+                    m.add(
+                        rows_written=len(rows),
+                        bytes=sales_path.stat().st_size + meta_path.stat().st_size,
+                    )
 
     finally:
         driver.quit()